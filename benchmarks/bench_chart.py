@@ -0,0 +1,95 @@
+"""
+Benchmarks of the Chart class: construction, refresh, sync and export.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from ipychart import Chart
+
+from .common import payload_bytes
+
+
+def make_data(n_points: int, n_datasets: int, binary: bool) -> dict:
+    """
+    Create the data dictionary of a line chart.
+
+    Args:
+        n_points (int): Number of points of each dataset.
+
+        n_datasets (int): Number of datasets.
+
+        binary (bool): If True, values are numpy arrays. Otherwise, they are
+            lists.
+
+    Returns:
+        dict: The data dictionary.
+    """
+    rng = np.random.default_rng(0)
+    values = [rng.normal(size=n_points) for _ in range(n_datasets)]
+
+    return {
+        "labels": np.arange(n_points) if binary else list(range(n_points)),
+        "datasets": [
+            {"data": v if binary else v.tolist(), "label": str(i)}
+            for i, v in enumerate(values)
+        ],
+    }
+
+
+class ChartSync:
+    params = [[1_000, 100_000, 1_000_000], [1, 20], [False, True]]
+    param_names = ["n_points", "n_datasets", "binary"]
+    timeout = 600
+
+    def setup(self, n_points, n_datasets, binary):
+        self.data = make_data(n_points, n_datasets, binary)
+        self.chart = Chart(self.data, "line", binary=binary)
+
+    def time_construction(self, n_points, n_datasets, binary):
+        Chart(make_data(n_points, n_datasets, binary), "line", binary=binary)
+
+    def peakmem_construction(self, n_points, n_datasets, binary):
+        Chart(make_data(n_points, n_datasets, binary), "line", binary=binary)
+
+    def time_refresh(self, n_points, n_datasets, binary):
+        self.chart._refresh_chart()
+
+    def time_refresh_without_validation(self, n_points, n_datasets, binary):
+        self.chart.validate = "off"
+        self.chart._refresh_chart()
+
+    def time_serialization(self, n_points, n_datasets, binary):
+        self.chart.get_state()
+
+    def track_payload_bytes(self, n_points, n_datasets, binary):
+        return payload_bytes(self.chart)
+
+    track_payload_bytes.unit = "bytes"
+
+
+class ChartExport:
+    params = [[1_000, 100_000], [False, True]]
+    param_names = ["n_points", "binary"]
+    timeout = 600
+
+    def setup(self, n_points, binary):
+        self.chart = Chart(
+            make_data(n_points, 1, binary), "line", binary=binary
+        )
+        self.path = os.path.join(tempfile.mkdtemp(), "chart.html")
+
+    def teardown(self, n_points, binary):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def time_to_html(self, n_points, binary):
+        self.chart.to_html(self.path)
+
+    def track_html_bytes(self, n_points, binary):
+        self.chart.to_html(self.path)
+        return os.path.getsize(self.path)
+
+    track_html_bytes.unit = "bytes"
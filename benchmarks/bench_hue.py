@@ -0,0 +1,34 @@
+"""
+Benchmarks of the aggregation of datasets grouped by a hue column.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ipychart.utils.plots_utils import (
+    _create_chart_data_agg,
+    _create_chart_data_count,
+)
+
+
+class HueAggregation:
+    params = [[100_000, 1_000_000], [2, 20]]
+    param_names = ["n_rows", "n_hue"]
+
+    def setup(self, n_rows, n_hue):
+        rng = np.random.default_rng(0)
+        self.data = pd.DataFrame(
+            {
+                "x": rng.integers(0, 500, size=n_rows),
+                "y": rng.normal(size=n_rows),
+                "hue": rng.integers(0, n_hue, size=n_rows).astype(str),
+            }
+        )
+
+    def time_agg(self, n_rows, n_hue):
+        _create_chart_data_agg(
+            self.data, kind="line", x="x", y="y", hue="hue", agg="mean"
+        )
+
+    def time_count(self, n_rows, n_hue):
+        _create_chart_data_count(self.data, x="x", hue="hue")
@@ -0,0 +1,115 @@
+"""
+Benchmarks of the plot functions of the pandas interface.
+
+Each plot is measured in wall time, peak memory and size of the payload
+sent to the browser.
+"""
+
+import ipychart
+
+from .common import DTYPES, SIZES, make_frame, payload_bytes
+
+
+class CountPlot:
+    params = [SIZES, [1, 20], DTYPES]
+    param_names = ["n_rows", "n_hue", "dtype"]
+    timeout = 600
+
+    def setup(self, n_rows, n_hue, dtype):
+        self.data = make_frame(n_rows, n_hue, dtype)
+        self.hue = "hue" if n_hue > 1 else None
+
+    def time_countplot(self, n_rows, n_hue, dtype):
+        ipychart.countplot(self.data, x="x", hue=self.hue)
+
+    def peakmem_countplot(self, n_rows, n_hue, dtype):
+        ipychart.countplot(self.data, x="x", hue=self.hue)
+
+    def track_payload_bytes(self, n_rows, n_hue, dtype):
+        return payload_bytes(
+            ipychart.countplot(self.data, x="x", hue=self.hue)
+        )
+
+    track_payload_bytes.unit = "bytes"
+
+
+class BarPlot:
+    params = [SIZES, [1, 20], DTYPES]
+    param_names = ["n_rows", "n_hue", "dtype"]
+    timeout = 600
+
+    def setup(self, n_rows, n_hue, dtype):
+        self.data = make_frame(n_rows, n_hue, dtype)
+        self.hue = "hue" if n_hue > 1 else None
+
+    def time_barplot(self, n_rows, n_hue, dtype):
+        ipychart.barplot(self.data, x="x", y="y", hue=self.hue)
+
+    def peakmem_barplot(self, n_rows, n_hue, dtype):
+        ipychart.barplot(self.data, x="x", y="y", hue=self.hue)
+
+    def track_payload_bytes(self, n_rows, n_hue, dtype):
+        return payload_bytes(
+            ipychart.barplot(self.data, x="x", y="y", hue=self.hue)
+        )
+
+    track_payload_bytes.unit = "bytes"
+
+
+class ScatterPlot:
+    params = [SIZES, [1, 20], [False, True]]
+    param_names = ["n_rows", "n_hue", "binary"]
+    timeout = 600
+
+    def setup(self, n_rows, n_hue, binary):
+        self.data = make_frame(n_rows, n_hue)
+        self.hue = "hue" if n_hue > 1 else None
+
+    def time_scatterplot(self, n_rows, n_hue, binary):
+        ipychart.scatterplot(
+            self.data, x="y", y="value", hue=self.hue, binary=binary
+        )
+
+    def time_scatterplot_downsampled(self, n_rows, n_hue, binary):
+        ipychart.scatterplot(
+            self.data,
+            x="y",
+            y="value",
+            hue=self.hue,
+            binary=binary,
+            max_points=5_000,
+        )
+
+    def peakmem_scatterplot(self, n_rows, n_hue, binary):
+        ipychart.scatterplot(
+            self.data, x="y", y="value", hue=self.hue, binary=binary
+        )
+
+    def track_payload_bytes(self, n_rows, n_hue, binary):
+        return payload_bytes(
+            ipychart.scatterplot(
+                self.data, x="y", y="value", hue=self.hue, binary=binary
+            )
+        )
+
+    track_payload_bytes.unit = "bytes"
+
+
+class DistPlot:
+    params = [SIZES, ["fft", "sklearn"]]
+    param_names = ["n_rows", "method"]
+    timeout = 600
+
+    def setup(self, n_rows, method):
+        if method == "sklearn" and n_rows > 100_000:
+            raise NotImplementedError("Too slow to be benchmarked")
+        self.data = make_frame(n_rows)
+
+    def time_distplot(self, n_rows, method):
+        ipychart.distplot(self.data, x="y", bandwidth=0.5, method=method)
+
+    def time_distplot_isj(self, n_rows, method):
+        ipychart.distplot(self.data, x="y", bandwidth="isj", method=method)
+
+    def peakmem_distplot(self, n_rows, method):
+        ipychart.distplot(self.data, x="y", bandwidth=0.5, method=method)
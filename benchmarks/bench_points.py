@@ -0,0 +1,51 @@
+"""
+Benchmarks of the construction of scatter and bubble points.
+
+The row-by-row construction (DataFrame.apply) used by previous versions of
+ipychart is kept as a reference to measure the speedup of the vectorized
+construction of parallel point columns.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ipychart.utils.plots_utils import _create_chart_data_agg
+
+
+def _row_apply_points(data, x, y, r=None):
+    # Reference implementation: one Python call per row
+    if r is None:
+        return data.apply(lambda row: {"x": row[x], "y": row[y]}, 1).tolist()
+    return data.apply(
+        lambda row: {"x": row[x], "y": row[y], "r": row[r]}, 1
+    ).tolist()
+
+
+class ScatterPoints:
+    params = [[1_000, 100_000, 1_000_000], [False, True]]
+    param_names = ["n_rows", "binary"]
+
+    def setup(self, n_rows, binary):
+        rng = np.random.default_rng(0)
+        self.data = pd.DataFrame(
+            {
+                "x": rng.normal(size=n_rows),
+                "y": rng.normal(size=n_rows),
+                "r": rng.uniform(1, 10, size=n_rows),
+            }
+        )
+
+    def time_point_columns(self, n_rows, binary):
+        _create_chart_data_agg(
+            self.data, kind="scatter", x="x", y="y", binary=binary
+        )
+
+    def time_bubble_point_columns(self, n_rows, binary):
+        _create_chart_data_agg(
+            self.data, kind="bubble", x="x", y="y", r="r", binary=binary
+        )
+
+    def time_row_apply_reference(self, n_rows, binary):
+        if n_rows > 100_000:
+            raise NotImplementedError("Too slow to be benchmarked")
+        _row_apply_points(self.data, "x", "y")
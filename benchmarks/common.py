@@ -0,0 +1,82 @@
+"""
+Synthetic data shared by the benchmarks.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from ipywidgets.widgets.widget import _remove_buffers
+
+# Number of rows of the synthetic dataframes
+SIZES = [1_000, 100_000, 1_000_000, 10_000_000]
+
+# Dtypes of the x column of the synthetic dataframes
+DTYPES = ["numeric", "categorical", "datetime", "string"]
+
+
+def make_frame(
+    n_rows: int, n_hue: int = 1, dtype: str = "numeric", seed: int = 0
+) -> pd.DataFrame:
+    """
+    Create a synthetic dataframe.
+
+    Args:
+        n_rows (int): Number of rows.
+
+        n_hue (int, optional): Number of distinct values of the "hue"
+            column. Defaults to 1.
+
+        dtype (str, optional): Dtype of the "x" column, one of DTYPES. The
+            "x" column has about 500 distinct values. Defaults to
+            "numeric".
+
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: A dataframe with "x", "y", "r", "value" (numeric) and
+            "hue" columns.
+    """
+    rng = np.random.default_rng(seed)
+    codes = rng.integers(0, 500, size=n_rows)
+
+    if dtype == "numeric":
+        x = codes
+    elif dtype == "categorical":
+        x = pd.Categorical.from_codes(codes, [f"c{i}" for i in range(500)])
+    elif dtype == "datetime":
+        x = pd.Timestamp("2020-01-01") + pd.to_timedelta(codes, unit="D")
+    else:
+        x = np.array([f"s{i}" for i in range(500)], dtype=object)[codes]
+
+    return pd.DataFrame(
+        {
+            "x": x,
+            "y": rng.normal(size=n_rows),
+            "r": rng.uniform(1, 10, size=n_rows),
+            "value": rng.normal(size=n_rows).cumsum(),
+            "hue": pd.Categorical.from_codes(
+                rng.integers(0, n_hue, size=n_rows),
+                [f"h{i}" for i in range(n_hue)],
+            ),
+        }
+    )
+
+
+def payload_bytes(chart) -> int:
+    """
+    Compute the size of the state of a chart, as sent to the browser.
+
+    Args:
+        chart (ipychart.Chart): The chart.
+
+    Returns:
+        int: Number of bytes of the JSON message and of its binary buffers.
+    """
+    state, _, buffers = _remove_buffers(chart.get_state())
+
+    # Dates are sent as ISO strings, as in Jupyter messages
+    message = json.dumps(state, default=lambda d: d.isoformat())
+
+    return len(message) + sum(memoryview(b).nbytes for b in buffers)
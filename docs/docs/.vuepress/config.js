@@ -61,6 +61,7 @@ module.exports = ctx => ({
                 children: [
                     '/developer_guide/development_installation',
                     '/developer_guide/documentation',
+                    '/developer_guide/benchmarks',
                     '/developer_guide/publish',
                 ],
             },
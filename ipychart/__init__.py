@@ -1,7 +1,67 @@
 from ._version import version_info, __version__
 
+import importlib
+
 from .chart import Chart
-from .plots import *
+from .grid import ChartGrid
+from .rolling import RollingDataset
+from .profiler import (
+    set_profiling,
+    profiling,
+    add_profiling_hook,
+    remove_profiling_hook,
+)
+from .cache import set_cache, caching, cache_info, clear_cache
+from .export import export_report
+from .spec import ChartSpec, build_spec, build_many
+
+# Plot functions depend on pandas, they are imported on first access
+# (PEP 562) so that "import ipychart" stays fast when only Chart is used
+_PLOTS = (
+    'countplot',
+    'distplot',
+    'lineplot',
+    'barplot',
+    'radarplot',
+    'doughnutplot',
+    'pieplot',
+    'polarplot',
+    'scatterplot',
+    'bubbleplot',
+    'facetplot',
+)
+
+__all__ = [
+    'Chart',
+    'ChartGrid',
+    'RollingDataset',
+    'set_profiling',
+    'profiling',
+    'add_profiling_hook',
+    'remove_profiling_hook',
+    'set_cache',
+    'caching',
+    'cache_info',
+    'clear_cache',
+    'export_report',
+    'ChartSpec',
+    'build_spec',
+    'build_many',
+    *_PLOTS,
+]
+
+
+def __getattr__(name):
+    if name in _PLOTS:
+        plots = importlib.import_module('.plots', __name__)
+        globals().update({plot: getattr(plots, plot) for plot in _PLOTS})
+        return globals()[name]
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted([*globals(), *_PLOTS])
 
 
 def _jupyter_labextension_paths():
@@ -0,0 +1,359 @@
+import sys
+import copy
+import hashlib
+import inspect
+import functools
+
+import numpy as np
+
+from typing import Callable, Union
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# Default memory budget of the cache, in bytes
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+MSG_MAX_BYTES = "Cache max_bytes must be a positive integer."
+
+# Types of the arguments (other than data) which can be part of a cache key
+_SCALARS = (str, int, float, complex, bool, bytes, type(None), np.generic)
+
+
+class _Cache:
+    """
+    Global state of the cache of aggregated chart data.
+
+    Entries are evicted in least recently used order when their total size
+    exceeds max_bytes.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.max_bytes = DEFAULT_MAX_BYTES
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Get an entry and mark it as the most recently used.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The value of the entry, or None if it is not cached.
+        """
+        if key not in self.entries:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return self.entries[key][0]
+
+    def put(self, key, value):
+        """
+        Add an entry, evicting the least recently used ones if needed.
+        Values larger than the whole cache are not stored.
+
+        Args:
+            key: The key of the entry.
+
+            value: The value of the entry.
+        """
+        size = _sizeof(value)
+        if size > self.max_bytes:
+            return
+
+        self.entries[key] = (value, size)
+        self.bytes += size
+        self.shrink()
+
+    def shrink(self):
+        """
+        Evict the least recently used entries until the cache fits in
+        max_bytes.
+        """
+        while self.bytes > self.max_bytes:
+            _, (_, size) = self.entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Remove all the entries and reset the statistics.
+        """
+        self.entries.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+_CACHE = _Cache()
+
+
+def set_cache(enabled: bool = True, max_bytes: Union[int, None] = None):
+    """
+    Enable or disable the cache of aggregated chart data.
+
+    When enabled, the counts, aggregates and density estimates computed by
+    the plot functions are memoized, keyed by a fingerprint of the used
+    columns of the dataframe and by the arguments of the computation. Calling
+    a plot function again on the same data (e.g. to change the options or
+    the colorscheme of the chart) then skips the aggregation. Only pandas
+    dataframes are cached.
+
+    Args:
+        enabled (bool, optional): Whether to enable the cache. Defaults to
+            True.
+
+        max_bytes (int, optional): Memory budget of the cache, in bytes. The
+            least recently used entries are evicted beyond it. Defaults to
+            None (unchanged, 256 MiB initially).
+    """
+    if max_bytes is not None:
+        if isinstance(max_bytes, bool) or not isinstance(max_bytes, int):
+            raise ValueError(MSG_MAX_BYTES)
+        if max_bytes < 1:
+            raise ValueError(MSG_MAX_BYTES)
+        _CACHE.max_bytes = max_bytes
+        _CACHE.shrink()
+
+    _CACHE.enabled = bool(enabled)
+
+
+@contextmanager
+def caching(max_bytes: Union[int, None] = None):
+    """
+    Enable the cache of aggregated chart data inside a with block.
+
+    Args:
+        max_bytes (int, optional): Memory budget of the cache, in bytes (see
+            set_cache). Defaults to None.
+
+    Examples:
+        ```python
+        with ipychart.caching():
+            for colorscheme in colorschemes:
+                ipychart.barplot(df, x='x', y='y', colorscheme=colorscheme)
+        ```
+    """
+    previous = _CACHE.enabled, _CACHE.max_bytes
+    set_cache(True, max_bytes)
+    try:
+        yield
+    finally:
+        _CACHE.enabled, _CACHE.max_bytes = previous
+        _CACHE.shrink()
+
+
+def cache_info() -> dict:
+    """
+    Get the statistics of the cache of aggregated chart data.
+
+    Returns:
+        dict: The number of hits ("hits"), misses ("misses") and evicted
+            entries ("evictions"), the number of entries ("entries"), their
+            size in bytes ("bytes") and the memory budget ("max_bytes").
+    """
+    return {
+        "hits": _CACHE.hits,
+        "misses": _CACHE.misses,
+        "evictions": _CACHE.evictions,
+        "entries": len(_CACHE.entries),
+        "bytes": _CACHE.bytes,
+        "max_bytes": _CACHE.max_bytes,
+    }
+
+
+def clear_cache():
+    """
+    Remove all the entries of the cache of aggregated chart data, and reset
+    its statistics.
+    """
+    _CACHE.clear()
+
+
+def _sizeof(value) -> int:
+    """
+    Estimate the memory used by a cached value.
+
+    Args:
+        value: Dictionaries, lists and tuples of numpy arrays and scalars.
+
+    Returns:
+        int: The estimated size, in bytes.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            _sizeof(k) + _sizeof(v) for k, v in value.items()
+        )
+
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+
+    return sys.getsizeof(value)
+
+
+def _digest(values) -> str:
+    """
+    Compute a digest of the content of a numpy array or of a pandas Series.
+
+    Args:
+        values: A numpy array or a pandas Series.
+
+    Returns:
+        str: The digest.
+    """
+    import pandas as pd
+
+    if isinstance(values, pd.Series):
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Codes and categories are much faster to hash than the values
+            codes = _digest(values.cat.codes.to_numpy())
+            return codes + _digest(pd.Series(values.cat.categories))
+        if isinstance(values.dtype, np.dtype) and not values.dtype.hasobject:
+            values = values.to_numpy()
+        else:
+            # One 64 bits hash per value (strings, categories, ...)
+            values = pd.util.hash_pandas_object(values, index=False)
+            values = values.to_numpy()
+
+    # Bytes of numeric arrays are hashed as they are, with SHA-256 which is
+    # hardware accelerated on most CPUs
+    raw = np.ascontiguousarray(values).reshape(-1).view("uint8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _fingerprint(values) -> tuple:
+    """
+    Compute a fingerprint of the content of a dataframe or of an array.
+
+    Args:
+        values: A pandas DataFrame or a numpy array.
+
+    Returns:
+        tuple: The fingerprint.
+    """
+    import pandas as pd
+
+    if isinstance(values, np.ndarray) and values.dtype.hasobject:
+        values = pd.DataFrame({0: values.ravel()})
+
+    if isinstance(values, np.ndarray):
+        return values.dtype.str, values.shape, _digest(values)
+
+    return tuple(
+        (name, str(column.dtype), len(column), _digest(column))
+        for name, column in values.items()
+    )
+
+
+def _freeze(value):
+    """
+    Convert an argument to a hashable value.
+
+    Args:
+        value: A scalar, or a (nested) list, tuple or dictionary of
+            scalars.
+
+    Returns:
+        A hashable version of value.
+
+    Raises:
+        TypeError: If value can not be converted.
+    """
+    if isinstance(value, dict):
+        return tuple(
+            sorted(((k, _freeze(v)) for k, v in value.items()), key=repr)
+        )
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+
+    # Other objects (frames of other libraries, iterators, ...) may be
+    # hashed by identity, they are not cached
+    if not isinstance(value, _SCALARS):
+        raise TypeError(f"Can not freeze {type(value).__name__} objects")
+
+    return type(value).__name__, value
+
+
+def _memoized(columns: Callable[[dict], list]) -> Callable:
+    """
+    Decorate a function computing chart data to cache its results when the
+    cache is enabled.
+
+    The cache key is made of the fingerprints of the dataframe arguments
+    (projected on the used columns) and of the array arguments, and of the
+    other arguments. Calls with other kinds of data (polars or pyarrow
+    frames, chunks, ...) are not cached.
+
+    Args:
+        columns (Callable[[dict], list]): Function returning the columns of
+            the dataframe arguments used by the computation, given the
+            arguments of the call. None values are ignored.
+
+    Returns:
+        Callable: The decorator.
+    """
+    import pandas as pd
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def cache_key(arguments: dict) -> Union[tuple, None]:
+            used = [c for c in dict.fromkeys(columns(arguments)) if c]
+            key = [func.__module__, func.__qualname__]
+
+            for name, value in arguments.items():
+                try:
+                    if isinstance(value, pd.DataFrame):
+                        if not set(used).issubset(value.columns):
+                            return None
+                        value = _fingerprint(value[used])
+                    elif isinstance(value, pd.Series):
+                        value = _fingerprint(value.to_frame())
+                    elif isinstance(value, np.ndarray):
+                        value = _fingerprint(value)
+                    else:
+                        value = _freeze(value)
+                except TypeError:
+                    # Unhashable values (e.g. lists in an object column)
+                    return None
+
+                key.append((name, value))
+
+            return tuple(key)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _CACHE.enabled:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = cache_key(bound.arguments)
+
+            if key is None:
+                return func(*args, **kwargs)
+
+            # Charts modify their data, so copies are stored and returned
+            cached = _CACHE.get(key)
+            if cached is None:
+                result = func(*args, **kwargs)
+                _CACHE.put(key, copy.deepcopy(result))
+                return result
+
+            return copy.deepcopy(cached)
+
+        return wrapper
+
+    return decorator
@@ -1,17 +1,61 @@
 import json
-import random
+import asyncio
 
-import numpy as np
 import ipywidgets as widgets
 
+from time import perf_counter
 from typing import Union
+from contextlib import contextmanager
 from pydash import has, set_, merge
 from traitlets import Unicode, default, Dict, Bool
 from ipywidgets.embed import embed_minimal_html, dependency_state, embed_data
+from ipywidgets.widgets.widget import _remove_buffers
 
 from ._version import __version__
 
 from .values import KINDS, COLORSCHEMES
+from .utils.serialization import (
+    data_serialization,
+    _is_array_like,
+    _is_point_columns,
+    _serialize_values,
+    _serialize_dataset_values,
+    _serialize_chart_data,
+)
+from .utils.downsampling import _downsample_data
+from .utils.streaming import MSG_FPS, MSG_SOURCE, _StreamBuffer
+from .utils.ring import _RingBuffer
+from .rolling import RollingDataset
+from .utils.standalone import _encode_buffer, _standalone_html
+from .utils.compression import _check_precision, _compress_data
+from .profiler import (
+    _active_profile,
+    _is_profiling,
+    _profile,
+    _render_timings,
+    _stage,
+)
+from .utils.validation import (
+    ALLOWED_OPTIONS,
+    MSG_VALIDATE,
+    POINT_KEYS,
+    VALIDATION_MODES,
+    _has_immutable_items,
+    _valid_points,
+    _valid_values,
+)
+from .utils.colors import _palette_colors, _palette_key, _palette_table
+from .utils.data_utils import (
+    _as_values,
+    _concat_values,
+    _append_dataset_values,
+    _find_dataset_index,
+)
+
+MSG_ROLLING = (
+    "A rolling dataset needs a dataset of values (not point columns), and "
+    "all rolling datasets of a chart must have the same capacity."
+)
 
 MSG_FORMAT = (
     "Wrong input format for {} argument. See "
@@ -26,6 +70,11 @@ MSG_KIND = (
     "for more details"
 )
 
+MSG_PROPERTY = (
+    "Unknown chart property: {}. Chart properties are data, kind, options, "
+    "colorscheme, palette, zoom, binary and validate."
+)
+
 MSG_COLORSCHEME = (
     "Chart colorscheme must be one of the exposed colorschemes. See "
     "https://nagix.github.io/chartjs-plugin-colorschemes/colorchart.html "
@@ -56,10 +105,28 @@ class Chart(widgets.DOMWidget):
             found at:
             https://nagix.github.io/chartjs-plugin-colorschemes/colorchart.html.
 
+        palette (list, optional): Colors used by the default style of the
+            chart, when no colorscheme is provided. Colors can be given as
+            (r, g, b) tuples, hexadecimal strings ("#36a3eb") or CSS rgb
+            strings. They are cycled if there are more datasets than
+            colors. Defaults to None (ipychart palette).
+
+        validate (str, optional): How chart arguments are validated on each
+            update. "full" validates all arguments and the values of each
+            dataset, "fast" only validates the structure of the arguments
+            and "off" skips validation, for trusted pipelines. Defaults to
+            "full".
+
         zoom (bool, optional): Allow the user to zoom on the Chart once it is
             created. Disabled for Doughnut, Pie, PolarArea and Radar Charts.
             Defaults to True.
 
+        binary (bool, optional): Send numeric labels and dataset values
+            (including x, y and r columns of scatter and bubble datasets) to
+            the browser as binary buffers instead of JSON lists. This is much
+            faster for large datasets, especially when data are given as
+            numpy arrays or pandas objects. Defaults to False.
+
     Raises:
         ValueError: This exception is raised when the Chart reveive an
             unexpected argument.
@@ -86,7 +153,7 @@ class Chart(widgets.DOMWidget):
     _view_module_version = Unicode("^" + __version__).tag(sync=True)
     _model_module_version = Unicode("^" + __version__).tag(sync=True)
 
-    _data_sync = Dict().tag(sync=True)
+    _data_sync = Dict().tag(sync=True, **data_serialization)
     _options_sync = Dict().tag(sync=True)
     _kind_sync = Unicode().tag(sync=True)
     _colorscheme_sync = Unicode(allow_none=True).tag(sync=True)
@@ -99,6 +166,9 @@ class Chart(widgets.DOMWidget):
         options: Union[dict, None] = None,
         colorscheme: list[str, None] = None,
         zoom: bool = True,
+        binary: bool = False,
+        palette: Union[list, None] = None,
+        validate: str = "full",
     ):
         super().__init__()
 
@@ -106,11 +176,62 @@ class Chart(widgets.DOMWidget):
         self._kind = kind
         self._options = options if options else {}
         self._colorscheme = colorscheme
+        self._palette = palette
         self._zoom = zoom
+        self._binary = binary
+        self._validate = validate
+
+        # Lists of values already validated, by id
+        self._validation_cache = {}
+
+        # Profile of the last creation or update, if profiling is enabled
+        self._profile = None
+
+        # Timings of the last render, sent by the browser
+        self._render_stats = None
+        self._rendered_handlers = widgets.CallbackDispatcher()
+
+        # Number of partial updates drawn by the browser
+        self._delta_acks = 0
+        self.on_msg(self._handle_custom_msg)
+
+        # Deferred refreshes when updating the chart in a batch
+        self._batch_depth = 0
+        self._refresh_pending = False
 
         # Check inputs and sync to JS
         self._refresh_chart()
 
+    @classmethod
+    def from_spec(cls, spec) -> "Chart":
+        """
+        Create a chart from a ChartSpec, built by ipychart.build_spec or
+        ipychart.build_many.
+
+        Args:
+            spec (ipychart.ChartSpec): The spec of the chart.
+
+        Returns:
+            ipychart.Chart: The chart.
+        """
+        kwargs = dict(
+            data=spec.data,
+            kind=spec.kind,
+            options=spec.options,
+            colorscheme=spec.colorscheme,
+            zoom=spec.zoom,
+            binary=spec.binary,
+            palette=spec.palette,
+        )
+
+        # Specs of facetplot describe a grid of charts
+        if spec.panels is not None:
+            from .grid import ChartGrid
+
+            return ChartGrid(**kwargs, **spec.panels)
+
+        return cls(**kwargs)
+
     @property
     def data(self):
         return self._data
@@ -147,6 +268,20 @@ class Chart(widgets.DOMWidget):
         self._colorscheme = value
         self._refresh_chart()
 
+    @property
+    def palette(self):
+        return self._palette
+
+    @palette.setter
+    def palette(self, value):
+        # Default colors of the previous palette are replaced, in a new data
+        # dictionary for the change to be synced
+        datasets = [dict(ds) for ds in self._data["datasets"]]
+        self._data = {**self._data, "datasets": datasets}
+        self._clear_default_style()
+        self._palette = value
+        self._refresh_chart()
+
     @property
     def zoom(self):
         return self._zoom
@@ -156,20 +291,169 @@ class Chart(widgets.DOMWidget):
         self._zoom = value
         self._refresh_chart()
 
+    @property
+    def binary(self):
+        return self._binary
+
+    @binary.setter
+    def binary(self, value):
+        self._binary = value
+        self._refresh_chart()
+
+    @property
+    def stats(self) -> Union[dict, None]:
+        """
+        Statistics of the last profiled creation or update of the chart.
+
+        Only available if profiling is enabled (see ipychart.set_profiling).
+        Statistics hold the total duration of the operation ("total"), the
+        duration of each stage ("stages", nested stages being named after
+        their parent, e.g. "default_inputs.default_style") and the size in
+        bytes of the payloads sent to the browser ("bytes").
+        """
+        return self._profile.stats if self._profile is not None else None
+
+    @property
+    def render_stats(self) -> Union[dict, None]:
+        """
+        Timings of the last render of the chart in the browser.
+
+        Durations are in milliseconds: deserialization of the data
+        ("deserialize"), conversion of the options and of the data
+        ("convert_options", "convert_data"), creation or update of the
+        Chart.js chart ("chart"), first paint after the creation of the
+        chart ("first_paint") and overall duration ("total"). "method" is
+        "render" for the first render, "update" when the chart is redrawn
+        and "append" for live updates. "points" is the number of drawn
+        points. None until the chart has been displayed.
+        """
+        return self._render_stats
+
+    @property
+    def validate(self):
+        return self._validate
+
+    @validate.setter
+    def validate(self, value):
+        self._validate = value
+        self._refresh_chart()
+
     @default("layout")
     def _default_layout(self):
         return widgets.Layout(height="auto", align_self="stretch")
 
+    @contextmanager
+    def batch_update(self):
+        """
+        Update several properties of the chart at once.
+
+        Within this context, setting a property (data, kind, options, ...)
+        does not refresh the chart. Inputs are validated and synced with JS
+        only once, when leaving the context, in a single message which
+        triggers a single render. If an exception is raised within the
+        context, the properties set in it are rolled back and the chart is
+        not refreshed.
+
+        Examples:
+            ```python
+            with mychart.batch_update():
+                mychart.data = new_data
+                mychart.kind = 'line'
+                mychart.colorscheme = 'tableau.Tableau10'
+            ```
+        """
+        # Values of the properties, restored if the batch fails
+        if not self._batch_depth:
+            previous = {
+                name: getattr(self, name)
+                for name in self._settable_properties()
+            }
+
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._batch_depth == 1:
+                for name, value in previous.items():
+                    setattr(self, f"_{name}", value)
+                self._refresh_pending = False
+            raise
+        finally:
+            self._batch_depth -= 1
+
+        if not self._batch_depth and self._refresh_pending:
+            self._refresh_chart()
+
+    @classmethod
+    def _settable_properties(cls) -> list:
+        """
+        Get the properties of the chart which can be set.
+
+        Returns:
+            list: The names of the properties with a setter.
+        """
+        return [
+            name
+            for klass in cls.__mro__
+            for name, attr in vars(klass).items()
+            if isinstance(attr, property) and attr.fset is not None
+        ]
+
+    def set(self, **kwargs):
+        """
+        Set several properties of the chart with a single refresh.
+
+        Args:
+            kwargs: New values of the chart properties (data, kind, options,
+                colorscheme, palette, zoom, binary or validate).
+
+        Raises:
+            ValueError: If a keyword is not a property of the chart which can
+                be set.
+
+        Examples:
+            ```python
+            mychart.set(data=new_data, kind='line', options=new_options)
+            ```
+        """
+        settable = self._settable_properties()
+        for key in kwargs:
+            if key not in settable:
+                raise ValueError(MSG_PROPERTY.format(key))
+
+        with self.batch_update():
+            for key, value in kwargs.items():
+                setattr(self, key, value)
+
     def _refresh_chart(self):
         """
         Refresh chart data and sync it with JS.
 
         It checks inputted values, set some default options and style, and sync
-        the chart with the JS part.
+        the chart with the JS part. Within a batch update, the refresh is
+        deferred to the end of the batch.
         """
-        self._validate_current_arguments()
-        self._set_default_inputs()
-        self._set_synced_attributes()
+        if self._batch_depth:
+            self._refresh_pending = True
+            return
+
+        self._refresh_pending = False
+
+        if not _is_profiling():
+            self._validate_current_arguments()
+            self._set_default_inputs()
+            self._set_synced_attributes()
+            return
+
+        with _profile("refresh") as profile:
+            with profile.stage("validation"):
+                self._validate_current_arguments()
+            with profile.stage("default_inputs"):
+                self._set_default_inputs()
+            with profile.stage("sync"):
+                self._set_synced_attributes()
+
+        self._profile = profile
 
     def _validate_current_arguments(self):
         """
@@ -182,8 +466,15 @@ class Chart(widgets.DOMWidget):
 
         https://nicohlr.github.io/ipychart/user_guide/usage.html
         """
+        # Validate validate argument
+        if self._validate not in VALIDATION_MODES:
+            raise ValueError(MSG_VALIDATE)
+
+        if self._validate == "off":
+            return
+
         # Validate data argument
-        if "datasets" not in self._data:
+        if not isinstance(self._data, dict) or "datasets" not in self._data:
             raise ValueError(MSG_FORMAT.format("data"))
 
         datasets = self._data["datasets"]
@@ -191,26 +482,23 @@ class Chart(widgets.DOMWidget):
             raise ValueError(MSG_FORMAT.format("data"))
         if not len(datasets):
             raise ValueError(MSG_FORMAT.format("data"))
-        if not ["data" in ds for ds in datasets] == [True] * len(datasets):
-            raise ValueError(MSG_FORMAT.format("data"))
 
         for dataset in datasets:
-            if "kind" in ["bubble", "scatter"]:
-                if not all(isinstance(x, dict) for x in dataset["data"]):
-                    raise ValueError(MSG_FORMAT.format("data['datasets']"))
-                if not all(
-                    k in p for k in ("x", "y", "r") for p in self._data
-                ):
-                    raise ValueError(MSG_FORMAT.format("data"))
+            if not isinstance(dataset, dict) or "data" not in dataset:
+                raise ValueError(MSG_FORMAT.format("data"))
 
             if "datalabels" in dataset:
                 if not isinstance(dataset["datalabels"], dict):
                     raise ValueError(MSG_FORMAT.format("data"))
 
         if "labels" in self._data:
-            if not isinstance(self._data["labels"], list):
+            labels = self._data["labels"]
+            if not isinstance(labels, list) and not _is_array_like(labels):
                 raise ValueError(MSG_FORMAT.format("data"))
 
+        if self._validate == "full":
+            self._validate_datasets()
+
         # Validate kind argument
         if self._kind not in KINDS:
             raise ValueError(MSG_KIND)
@@ -219,22 +507,7 @@ class Chart(widgets.DOMWidget):
         if not isinstance(self._options, dict):
             raise ValueError(MSG_FORMAT.format("options"))
 
-        # Allowed options
-        all_options = [
-            "legend",
-            "title",
-            "scales",
-            "layout",
-            "animation",
-            "hover",
-            "plugins",
-            "legendCallback",
-            "indexAxis",
-            "aspectRatio",
-            "maintainAspectRatio",
-        ]
-
-        if not set(self._options.keys()).issubset(set(all_options)):
+        if not ALLOWED_OPTIONS.issuperset(self._options.keys()):
             raise ValueError(MSG_FORMAT.format("options"))
 
         # Validate colorscheme argument
@@ -244,10 +517,109 @@ class Chart(widgets.DOMWidget):
         ):
             raise ValueError(MSG_COLORSCHEME)
 
+        # Validate palette argument
+        if self._palette is not None:
+            if not isinstance(self._palette, (list, tuple)) or not len(
+                self._palette
+            ):
+                raise ValueError(MSG_FORMAT.format("palette"))
+            try:
+                _palette_table(_palette_key(self._palette))
+            except (TypeError, ValueError):
+                raise ValueError(MSG_FORMAT.format("palette"))
+
         # Validate zoom argument
         if not isinstance(self._zoom, bool):
             raise ValueError(MSG_FORMAT.format("zoom"))
 
+        # Validate binary argument
+        if not isinstance(self._binary, bool):
+            raise ValueError(MSG_FORMAT.format("binary"))
+
+    def _validate_datasets(self):
+        """
+        Validate the values of each dataset.
+
+        Points of scatter and bubble datasets must have all their
+        coordinates. Values backed by numpy arrays or pandas objects are
+        validated by dtype and shape, without iterating over them. Lists
+        of numbers (or of tuples of numbers) are only validated again if
+        they differ from a shallow copy taken at the last validation. Lists
+        of items which can be modified in place (e.g. {x, y} dictionaries)
+        are always validated again.
+        """
+        cache = {}
+
+        for dataset in self._data["datasets"]:
+            values = dataset["data"]
+
+            # Skip the datasets already validated, if they did not change
+            key = id(values)
+            if isinstance(values, list):
+                cached = self._validation_cache.get(key)
+                if cached and cached[0] is values and cached[1] == values:
+                    cache[key] = cached
+                    continue
+
+            self._validate_dataset_values(dataset)
+
+            if isinstance(values, list) and _has_immutable_items(values):
+                cache[key] = (values, list(values))
+
+        self._validation_cache = cache
+
+    def _validate_dataset_values(self, dataset: dict):
+        """
+        Validate the values of a dataset.
+
+        Args:
+            dataset (dict): The dataset.
+
+        Raises:
+            ValueError: If the values are not valid for the type of the
+                dataset.
+        """
+        values = dataset["data"]
+        ds_type = dataset["type"] if "type" in dataset else self._kind
+
+        if ds_type in POINT_KEYS and "parsing" not in dataset:
+            valid = _valid_points(values, POINT_KEYS[ds_type])
+        else:
+            valid = _valid_values(values)
+
+        if not valid:
+            raise ValueError(MSG_FORMAT.format("data['datasets']"))
+
+    def _send(self, msg: dict, buffers: Union[list, None] = None):
+        """
+        Send a message to the JS part, recording the size of the synced
+        data and options in the active profile, if any.
+
+        Args:
+            msg (dict): The message.
+
+            buffers (list, optional): The binary buffers of the message.
+                Defaults to None.
+        """
+        super()._send(msg, buffers=buffers)
+
+        profile = _active_profile()
+        if profile is None or msg.get("method") != "update":
+            return
+
+        # The payload is measured as it was sent, but not timed
+        with profile.untimed():
+            for key, name in [
+                ("_data_sync", "data"),
+                ("_options_sync", "options"),
+            ]:
+                if key in msg["state"]:
+                    content = json.dumps(msg["state"][key], default=str)
+                    profile.add_bytes(name, len(content))
+            profile.add_bytes(
+                "buffers", sum(memoryview(b).nbytes for b in buffers or [])
+            )
+
     def _set_synced_attributes(self):
         """
         Update JavaScript-synchronized variables based on chart attributes.
@@ -255,13 +627,15 @@ class Chart(widgets.DOMWidget):
         This method ensures that the attributes of the chart are synchronized
         with their corresponding JavaScript counterparts. Whenever these
         "_sync" variables are updated, their new values are automatically
-        propagated to the JavaScript side of the implementation.
+        propagated to the JavaScript side of the implementation. All changes
+        are sent in a single message.
         """
-        self._options_sync = self._options
-        self._data_sync = self._data
-        self._kind_sync = self._kind
-        self._colorscheme_sync = self._colorscheme
-        self._zoom_sync = self._zoom
+        with self.hold_sync():
+            self._options_sync = self._options
+            self._data_sync = self._data
+            self._kind_sync = self._kind
+            self._colorscheme_sync = self._colorscheme
+            self._zoom_sync = self._zoom
 
     def _set_default_inputs(self):
         """
@@ -278,10 +652,11 @@ class Chart(widgets.DOMWidget):
 
         # Disable legend by default for some charts
         no_legend = ["bar", "line", "bubble", "radar", "scatter"]
-        if (len(self._data["datasets"]) == 1) and (self._kind in no_legend):
+        if (self._datasets_per_chart() == 1) and (self._kind in no_legend):
             default_options = set_(default_options, "plugins.legend", False)
 
-        self._options = merge(default_options, self._options)
+        with _stage("options_merge"):
+            self._options = merge(default_options, self._options)
 
         # Disable zoom by default for some charts
         self._zoom = False if self._kind in radials else self._zoom
@@ -289,49 +664,75 @@ class Chart(widgets.DOMWidget):
         # Set default style is colorscheme is not provided
         cs_plugin_key = "plugins.colorschemes.scheme"
         if not self._colorscheme and not has(self._options, cs_plugin_key):
-            self._set_default_style()
+            with _stage("default_style"):
+                self._set_default_style()
 
-    def _set_default_style(self):
+    def _datasets_per_chart(self) -> int:
         """
-        Apply a default style to the chart.
+        Get the number of datasets drawn in each Chart.js chart.
 
-        Provides an aesthetically pleasing chart in ipychart without requiring
-        explicit styling options. For details on styling in ipychart, see:
+        Returns:
+            int: The number of datasets of the chart.
+        """
+        return len(self._data["datasets"])
 
-        https://nicohlr.github.io/ipychart/user_guide/charts.html
+    def _default_colors(self, idx: int, ds: dict) -> tuple:
         """
-        random_colors = [
-            "rgba({}, {}, {}, 0.2)".format(
-                *random.sample(
-                    list(np.random.choice(range(256), size=2))
-                    + list(np.random.choice(range(200, 256), size=1)),
-                    3,
+        Get the default background and border colors of a dataset.
+
+        Args:
+            idx (int): The position of the dataset in the chart.
+
+            ds (dict): The dataset.
+
+        Returns:
+            tuple: The background and border colors of the dataset. Each of
+                them is either a color or a list of colors (one per value).
+        """
+        backgrounds, borders = _palette_table(_palette_key(self._palette))
+        ds_type = ds["type"] if "type" in ds else self._kind
+
+        # Chart types lists
+        bars = ["bar"]
+        lrsb = ["line", "radar", "scatter", "bubble"]
+
+        # Set a mix of color if only one dataset
+        if self._datasets_per_chart() == 1:
+            if ds_type in lrsb:
+                return backgrounds[0], borders[0]
+            if ds_type in bars:
+                # Chart.js main colors for one dataset
+                size = len(ds["data"])
+                return (
+                    _palette_colors(backgrounds[:3], size),
+                    _palette_colors(borders[:3], size),
                 )
+
+        # Set one color per dataset if more than one dataset
+        elif ds_type in lrsb + bars:
+            return (
+                backgrounds[idx % len(backgrounds)],
+                borders[idx % len(borders)],
             )
-            for _ in range(100)
-        ]
 
-        # Chart.js main colors for one dataset
-        colors_unique = [
-            "rgba(54, 163, 235, 0.2)",
-            "rgba(254, 119, 124, 0.2)",
-            "rgba(255, 206, 87, 0.2)",
-        ]
+        size = len(ds["data"])
+        return (
+            _palette_colors(backgrounds, size),
+            _palette_colors(borders, size),
+        )
+
+    def _set_default_style(self):
+        """
+        Apply a default style to the chart.
 
-        # Chosen colors for the ten fist datasets then random colors
-        colors_all = [
-            "rgba(54, 163, 235, 0.2)",
-            "rgba(254, 119, 124, 0.2)",
-            "rgba(255, 206, 87, 0.2)",
-            "rgba(11, 255, 238, 0.2)",
-            "rgba(153, 102, 255, 0.2)",
-            "rgba(255, 159, 64, 0.2)",
-            "rgba(5, 169, 69, 0.2)",
-            "rgba(230, 120, 199, 0.2)",
-            "rgba(35, 120, 206, 0.2)",
-            "rgba(211, 216, 214, 0.2)",
-        ] + random_colors
+        Provides an aesthetically pleasing chart in ipychart without requiring
+        explicit styling options. Colors are taken from a precomputed palette
+        and only depend on the position of each dataset, so they do not
+        change when the chart is refreshed. For details on styling in
+        ipychart, see:
 
+        https://nicohlr.github.io/ipychart/user_guide/charts.html
+        """
         # Accessors for readability
         bgc = "backgroundColor"
         bdc = "borderColor"
@@ -339,30 +740,23 @@ class Chart(widgets.DOMWidget):
         pbgc = "pointBackgroundColor"
         pbdc = "pointBorderColor"
 
-        # Chart types lists
-        bars = ["bar"]
         lrsb = ["line", "radar", "scatter", "bubble"]
 
-        # Set a mix of color if only one dataset
-        if len(self._data["datasets"]) == 1:
-            ds = self._data["datasets"][0]
+        for idx, ds in enumerate(self._data["datasets"]):
             ds_type = ds["type"] if "type" in ds else self._kind
+            background, border = self._default_colors(idx, ds)
 
             if bgc not in ds:
-                if ds_type in lrsb:
-                    ds[bgc] = colors_unique[0]
-                elif ds_type in bars:
-                    size = int(len(ds["data"]))
-                    colors = colors_unique * (size + 1)
-                    ds[bgc] = colors[:size]
+                ds[bgc] = background
+            elif bdc not in ds:
+                # Match the border color with the user background color
+                if isinstance(ds[bgc], str):
+                    border = ds[bgc].replace("0.2", "1")
                 else:
-                    ds[bgc] = colors_all[: len(ds["data"])]
+                    border = [c.replace("0.2", "1") for c in ds[bgc]]
 
             if bdc not in ds:
-                if ds_type in lrsb:
-                    ds[bdc] = ds[bgc].replace("0.2", "1")
-                else:
-                    ds[bdc] = [c.replace("0.2", "1") for c in ds[bgc]]
+                ds[bdc] = border
 
             if bdw not in ds:
                 ds[bdw] = 1
@@ -373,52 +767,574 @@ class Chart(widgets.DOMWidget):
                 if pbdc not in ds:
                     ds[pbdc] = ds[bdc]
 
-        # Set one color per dataset if more than one dataset
-        else:
-            for idx, ds in enumerate(self._data["datasets"]):
-                ds_type = ds["type"] if "type" in ds else self._kind
+    def _clear_default_style(self):
+        """
+        Remove the default colors set by _set_default_style.
 
-                if bgc not in ds:
-                    if ds_type in lrsb + bars:
-                        ds[bgc] = colors_all[idx]
-                    else:
-                        ds[bgc] = colors_all[: len(ds["data"])]
+        Colors set by the user are kept.
+        """
+        for idx, ds in enumerate(self._data["datasets"]):
+            try:
+                background, border = self._default_colors(idx, ds)
+            except (TypeError, ValueError):
+                return
+
+            for key, color in [
+                ("backgroundColor", background),
+                ("pointBackgroundColor", background),
+                ("borderColor", border),
+                ("pointBorderColor", border),
+            ]:
+                if key in ds and ds[key] == color:
+                    del ds[key]
+
+    def downsample(self, max_points: int, method: str = "lttb"):
+        """
+        Downsample the datasets of the chart.
+
+        Each dataset is reduced to about max_points visually representative
+        points, which makes large charts much faster to send and to draw.
+        Datasets sharing the labels of the chart stay aligned on them, and
+        share max_points.
+
+        Args:
+            max_points (int): Maximum number of points to keep per dataset
+                (or in total, for datasets sharing the labels of the chart).
+
+            method (str, optional): The downsampling algorithm: 'lttb'
+                (Largest-Triangle-Three-Buckets), 'minmax' (keeps extrema)
+                or 'every_nth'. Defaults to 'lttb'.
+
+        Raises:
+            ValueError: If the method is unknown, or if max_points is not a
+                positive integer.
+        """
+        self.data = _downsample_data(self._data, max_points, method)
+
+    def append(
+        self,
+        dataset_index: Union[int, str],
+        points,
+        labels=None,
+        max_len: Union[int, None] = None,
+    ):
+        """
+        Append points to a dataset without redrawing the whole chart.
+
+        Only the appended points are sent to JS, where they are added to the
+        existing Chart.js instance. This is much cheaper than reassigning
+        the data of the chart, which resends everything.
+
+        Args:
+            dataset_index ([int, str]): Index (or label) of the dataset to
+                update.
+
+            points: Point(s) to append. It can be a single value, a list, a
+                numpy array or a pandas object. For scatter and bubble
+                charts, points can be dictionaries ({x, y[, r]}) or parallel
+                point columns.
+
+            labels (optional): Label(s) to append to the labels of the
+                chart. Defaults to None.
+
+            max_len (int, optional): If set, the oldest points (and labels)
+                are dropped so that at most max_len of them are kept. This
+                is useful to draw a rolling window. A dataset (or labels)
+                kept in a ring buffer by rolling_dataset is always limited
+                to its capacity. Defaults to None.
+
+        Raises:
+            IndexError: If the dataset does not exist.
+        """
+        index = _find_dataset_index(self._data, dataset_index)
+        points = _as_values(points)
+
+        # Values and labels in ring buffers are dropped beyond their capacity
+        values = self._data["datasets"][index]["data"]
+        if isinstance(values, _RingBuffer):
+            max_len = values.capacity
+
+        labels_max_len = max_len
+        if isinstance(self._data.get("labels"), _RingBuffer):
+            labels_max_len = self._data["labels"].capacity
+
+        _append_dataset_values(self._data["datasets"][index], points, max_len)
+
+        delta = {
+            "method": "append",
+            "index": index,
+            "data": _serialize_dataset_values(points, self._binary),
+            "max_len": max_len,
+        }
+
+        if labels is not None:
+            labels = _as_values(labels)
+            self._data["labels"] = _concat_values(
+                self._data.get("labels", []), labels, labels_max_len
+            )
+            delta["labels"] = _serialize_values(labels, self._binary)
+            delta["labels_max_len"] = labels_max_len
+
+        self._send_delta(delta)
+
+    def rolling_dataset(
+        self,
+        capacity: int,
+        dataset: Union[int, str] = 0,
+        labels: bool = True,
+        dtype="float64",
+        labels_dtype=object,
+    ) -> RollingDataset:
+        """
+        Keep the values of a dataset, and the labels of the chart, in
+        fixed-capacity ring buffers.
+
+        Values are then pushed in O(1) without allocating, and only the new
+        values are sent to the browser, which drops the oldest ones. The
+        memory used by the chart stays constant, which is useful for charts
+        left open for a long time (e.g. monitoring screens). The current
+        values of the dataset are kept (the last capacity ones).
+
+        Args:
+            capacity (int): The number of values kept.
+
+            dataset ([int, str], optional): Index (or label) of the dataset.
+                Defaults to 0.
+
+            labels (bool, optional): Whether the labels of the chart are
+                also kept in a ring buffer. Defaults to True.
+
+            dtype (optional): The numpy dtype of the values. Defaults to
+                "float64".
+
+            labels_dtype (optional): The numpy dtype of the labels. Defaults
+                to object.
+
+        Raises:
+            ValueError: If the capacity is not a positive integer, if the
+                dataset holds point columns, or if the labels are already
+                in a ring buffer of another capacity.
+
+        Returns:
+            ipychart.RollingDataset: The rolling dataset, to push values to.
+
+        Examples:
+            ```python
+            mychart = Chart({'datasets': [{'data': []}]}, 'line')
+            cpu = mychart.rolling_dataset(capacity=10_000)
+
+            cpu.push(psutil.cpu_percent(), label=time.time())
+            ```
+        """
+        index = _find_dataset_index(self._data, dataset)
+        ds = self._data["datasets"][index]
+        current_labels = self._data.get("labels", [])
+
+        if _is_point_columns(ds["data"]):
+            raise ValueError(MSG_ROLLING)
+        if (
+            labels
+            and isinstance(current_labels, _RingBuffer)
+            and current_labels.capacity != capacity
+        ):
+            raise ValueError(MSG_ROLLING)
+
+        values = ds["data"]
+        if not isinstance(values, _RingBuffer):
+            values = _RingBuffer(capacity, dtype, values)
+        elif values.capacity != capacity:
+            raise ValueError(MSG_ROLLING)
+
+        # A new data dictionary, for the change to be synced
+        datasets = list(self._data["datasets"])
+        datasets[index] = {**ds, "data": values}
+        data = {**self._data, "datasets": datasets}
+
+        if labels and not isinstance(current_labels, _RingBuffer):
+            data["labels"] = _RingBuffer(
+                capacity, labels_dtype, current_labels
+            )
+
+        # Values beyond the capacity are dropped in the browser too
+        self._data = data
+        self._refresh_chart()
+
+        return RollingDataset(self, index)
+
+    def update_dataset(self, index_or_label: Union[int, str], values):
+        """
+        Replace the data of a dataset without redrawing the whole chart.
+
+        Only the new values of the dataset are sent to JS, where they
+        replace the data of the dataset in the existing Chart.js instance.
+        Default colors set per value (e.g. for bar charts with a single
+        dataset) are computed again for the new values.
+
+        Args:
+            index_or_label ([int, str]): Index or label of the dataset to
+                update.
+
+            values: The new data of the dataset. It can be a list, a numpy
+                array, a pandas object or parallel point columns.
+
+        Raises:
+            IndexError: If the dataset does not exist.
+
+            ValueError: If the values are not valid (unless validation is
+                disabled).
+        """
+        index = _find_dataset_index(self._data, index_or_label)
+        ds = self._data["datasets"][index]
+
+        if self._validate == "full":
+            self._validate_dataset_values({**ds, "data": values})
+
+        previous = self._default_colors(index, ds)
+        ds["data"] = values
+
+        delta = {
+            "method": "update",
+            "index": index,
+            "data": _serialize_dataset_values(values, self._binary),
+        }
+
+        # Colors left to their default value follow the new values
+        style = {}
+        current = self._default_colors(index, ds)
+        for key, old, new in zip(
+            ["backgroundColor", "borderColor"], previous, current
+        ):
+            if key in ds and ds[key] == old and old != new:
+                ds[key] = style[key] = new
+        if style:
+            delta["style"] = style
+
+        self._send_delta(delta)
+
+    async def stream(
+        self,
+        source,
+        dataset: Union[int, str] = 0,
+        window: Union[int, None] = None,
+        fps: float = 10,
+        max_lag: float = 1.0,
+    ) -> dict:
+        """
+        Append the records of an async iterable to a dataset as they arrive.
+
+        Records are buffered and sent to the browser at most fps times per
+        second, as append deltas. While the browser has not drawn the
+        previous frame, frames are skipped and records keep being buffered
+        (latest wins). With a window, only the last window records are
+        buffered, so that the CPU and the bandwidth used are bounded
+        whatever the rate of the source.
 
-                if bdc not in ds:
-                    if ds_type in lrsb + bars:
-                        ds[bdc] = ds[bgc].replace("0.2", "1")
-                    else:
-                        ds[bdc] = [c.replace("0.2", "1") for c in ds[bgc]]
+        The browser acknowledges the frames it draws with messages, which
+        are only handled while the kernel is idle. To enable the
+        back-pressure, run the stream in a task
+        (asyncio.ensure_future(mychart.stream(source))) instead of awaiting
+        it in a cell: frames are otherwise only limited by fps.
 
-                if bdw not in ds:
-                    ds[bdw] = 1
+        Args:
+            source (AsyncIterable): The records. A record is a value (or a
+                point for scatter and bubble charts), or a (label, value)
+                tuple to also append a label to the chart.
 
-                if ds_type in lrsb:
-                    if pbgc not in ds:
-                        ds[pbgc] = ds[bgc]
-                    if pbdc not in ds:
-                        ds[pbdc] = ds[bdc]
+            dataset ([int, str], optional): Index (or label) of the dataset
+                to update. Defaults to 0.
 
-    def to_html(self, path):
+            window (int, optional): If set, at most window points (and
+                labels) are kept, as with the max_len argument of append.
+                Defaults to None.
+
+            fps (float, optional): Maximum number of frames sent per second.
+                Defaults to 10.
+
+            max_lag (float, optional): Maximum time, in seconds, to wait for
+                the browser to draw a frame before sending the next one.
+                Defaults to 1.
+
+        Raises:
+            ValueError: If the source is not an async iterable, or if fps or
+                max_lag is not positive.
+
+        Returns:
+            dict: The number of records consumed ("records"), of records
+                dropped from the buffer by the window ("dropped") and of
+                frames sent ("frames").
+
+        Examples:
+            ```python
+            async def metrics():
+                async for message in consumer:
+                    yield message.timestamp, message.value
+
+            task = asyncio.ensure_future(mychart.stream(metrics(), window=500))
+            ```
+        """
+        if not hasattr(source, "__aiter__"):
+            raise ValueError(MSG_SOURCE)
+        if not fps > 0 or not max_lag > 0:
+            raise ValueError(MSG_FPS)
+
+        index = _find_dataset_index(self._data, dataset)
+        buffer = _StreamBuffer(window)
+        frames = 0
+
+        async def consume():
+            async for record in source:
+                buffer.add(record)
+
+        reader = asyncio.ensure_future(consume())
+        start_acks = self._delta_acks
+        sent_at, sent_acks = None, None
+
+        try:
+            while not reader.done():
+                await asyncio.wait({reader}, timeout=1 / fps)
+
+                # Acknowledgements are only expected once one was received
+                drawing = (
+                    sent_at is not None
+                    and self._delta_acks > start_acks
+                    and self._delta_acks == sent_acks
+                    and perf_counter() - sent_at < max_lag
+                )
+                if not len(buffer) or (drawing and not reader.done()):
+                    continue
+
+                values, labels = buffer.pop()
+                sent_at, sent_acks = perf_counter(), self._delta_acks
+                self.append(index, values, labels=labels, max_len=window)
+                frames += 1
+
+            # Errors of the source are raised
+            reader.result()
+        finally:
+            reader.cancel()
+
+        return {
+            "records": buffer.records,
+            "dropped": buffer.dropped,
+            "frames": frames,
+        }
+
+    def on_rendered(self, callback, remove: bool = False):
+        """
+        Register a function called each time the chart is rendered.
+
+        Args:
+            callback (Callable): The function to call. It receives the chart
+                and its render statistics (see render_stats).
+
+            remove (bool, optional): If True, unregister the function
+                instead. Defaults to False.
+        """
+        self._rendered_handlers.register_callback(callback, remove=remove)
+
+    def _handle_custom_msg(self, _, content: dict, buffers: list):
+        """
+        Handle a custom message sent by the browser.
+
+        Args:
+            content (dict): The content of the message.
+
+            buffers (list): The binary buffers of the message.
+        """
+        if content.get("method") == "rendered":
+            self._render_stats = _render_timings(content.get("stats"))
+            if self._render_stats.get("method") in ("append", "update"):
+                self._delta_acks += 1
+            self._rendered_handlers(self, self._render_stats)
+
+    def _send_delta(self, delta: dict):
+        """
+        Send a partial update of the chart data to JS.
+
+        The data of the chart are updated in place on the Python side, so
+        the synced state stays up to date for views created later. Binary
+        buffers are extracted from the message and sent alongside it.
+
+        Args:
+            delta (dict): The update to apply on the JS side.
+        """
+        content, buffer_paths, buffers = _remove_buffers(delta)
+        content["buffer_paths"] = buffer_paths
+
+        if not _is_profiling():
+            self.send(content, buffers)
+            return
+
+        with _profile(delta["method"]) as profile:
+            with profile.stage("sync"):
+                self.send(content, buffers)
+            with profile.untimed():
+                content = json.dumps(content, default=str)
+                profile.add_bytes("data", len(content))
+                profile.add_bytes(
+                    "buffers", sum(memoryview(b).nbytes for b in buffers)
+                )
+
+        self._profile = profile
+
+    def _export_state(
+        self, compress: bool = False, precision=None, binary: bool = False
+    ) -> tuple:
+        """
+        Get the synced state of the chart to embed in an HTML export.
+
+        Args:
+            compress (bool, optional): Whether to compress numeric data.
+                Defaults to False.
+
+            precision (optional): Precision of the compressed data. Defaults
+                to None.
+
+            binary (bool, optional): Whether to export numeric data as binary
+                buffers, whatever the binary mode of the chart. Defaults to
+                False.
+
+        Returns:
+            tuple: The state without its buffers, the paths of the buffers
+                and the buffers.
+        """
+        keys = [
+            "_options_sync",
+            "_kind_sync",
+            "_colorscheme_sync",
+            "_zoom_sync",
+        ]
+        serialize = compress or (binary and not self._binary)
+        state = self.get_state(keys if serialize else ["_data_sync"] + keys)
+
+        if compress:
+            with _stage("compression"):
+                state["_data_sync"] = _compress_data(self._data, precision)
+        elif serialize:
+            state["_data_sync"] = _serialize_chart_data(self._data, True)
+
+        return _remove_buffers(state)
+
+    def _embed_state(self, compress: bool = False, precision=None) -> dict:
+        """
+        Get the widget manager state of the chart to embed in an HTML
+        export.
+
+        Args:
+            compress (bool, optional): Whether to compress numeric data.
+                Defaults to False.
+
+            precision (optional): Precision of the compressed data. Defaults
+                to None.
+
+        Returns:
+            dict: The state of the chart and of its dependencies.
+        """
+        state = dependency_state([self])
+
+        if compress:
+            synced, buffer_paths, buffers = self._export_state(
+                compress, precision
+            )
+            model = state[self.model_id]
+            model["state"].update(synced)
+            model["buffers"] = [
+                b
+                for b in model.get("buffers", [])
+                if b["path"][0] not in synced
+            ] + [
+                {"encoding": "base64", "path": path, "data": _encode_buffer(b)}
+                for path, b in zip(buffer_paths, buffers)
+            ]
+
+        return state
+
+    def to_html(
+        self,
+        path,
+        offline: bool = False,
+        compress: bool = False,
+        precision: Union[int, str, None] = None,
+    ):
         """
         Embed the chart widget into an HTML file at the specified path.
 
         For details on embedding an ipywidget, refer to:
 
         https://ipywidgets.readthedocs.io/en/latest/embedding.html
+
+        Args:
+            path (str): Path of the HTML file.
+
+            offline (bool, optional): Whether to write a self-contained file,
+                inlining Chart.js, the plugins used by the chart and its data.
+                Such a file can be opened without network access. Defaults
+                to False.
+
+            compress (bool, optional): Whether to store numeric labels and
+                dataset values as compressed binary buffers, decoded by the
+                browser. Defaults to False.
+
+            precision (Union[int, str, None], optional): Precision of the
+                compressed values: None to keep them as they are, "float32"
+                to store them as single precision floats or the number of
+                decimals to keep. Defaults to None.
         """
-        embed_minimal_html(path, views=[self], state=dependency_state([self]))
+        if not offline:
+            _check_precision(precision)
+            embed_minimal_html(
+                path,
+                views=[self],
+                state=self._embed_state(compress, precision),
+            )
+            return
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(
+                self.get_html_template(
+                    offline=True, compress=compress, precision=precision
+                )
+            )
 
-    def get_html_template(self) -> str:
+    def get_html_template(
+        self,
+        offline: bool = False,
+        compress: bool = False,
+        precision: Union[int, str, None] = None,
+    ) -> str:
         """
         Generate HTML code to embed the chart widget.
 
         For details on embedding an ipywidget, refer to:
         https://ipywidgets.readthedocs.io/en/latest/embedding.html
 
+        Args:
+            offline (bool, optional): Whether to generate a self-contained
+                HTML page, which does not load require.js nor the widget
+                manager from a CDN. Defaults to False.
+
+            compress (bool, optional): Whether to store numeric labels and
+                dataset values as compressed binary buffers, decoded by the
+                browser. Defaults to False.
+
+            precision (Union[int, str, None], optional): Precision of the
+                compressed values: None to keep them as they are, "float32"
+                to store them as single precision floats or the number of
+                decimals to keep. Defaults to None.
+
         Returns:
             str: HTML code for embedding the chart.
         """
+        _check_precision(precision)
+
+        if offline:
+            state, buffer_paths, buffers = self._export_state(
+                compress, precision
+            )
+            return _standalone_html(
+                state, buffer_paths, buffers, f"ipychart-{self.model_id}"
+            )
+
         html_template = (
             """<script src="https://cdnjs.cloudflare.com/ajax/libs/require."""
             """js/2.3.4/require.min.js" integrity="sha256-Ae2Vz/4ePdIu6ZyI/5"""
@@ -437,7 +1353,9 @@ class Chart(widgets.DOMWidget):
             """</script>"""
         )
 
-        data = embed_data(views=[self])
+        data = embed_data(
+            views=[self], state=self._embed_state(compress, precision)
+        )
         manager_state = json.dumps(data["manager_state"])
         widget_views = [json.dumps(view) for view in data["view_specs"]]
         rendered_template = html_template.format(
@@ -462,6 +1380,15 @@ class Chart(widgets.DOMWidget):
         if self._colorscheme:
             python_template += f", colorscheme='{self._colorscheme}'"
 
+        if self._palette is not None:
+            python_template += f", palette={self._palette}"
+
+        if self._binary:
+            python_template += ", binary=True"
+
+        if self._validate != "full":
+            python_template += f", validate='{self._validate}'"
+
         python_template += ")"
 
         return python_template
@@ -0,0 +1,247 @@
+import html
+import hashlib
+
+from typing import Iterable, Union
+
+from .chart import Chart
+from .utils.compression import _check_precision
+from .utils.standalone import (
+    CORE_BUNDLE,
+    PLUGIN_BUNDLES,
+    _encode_buffer,
+    _inline_script,
+    _read_bundle,
+    _required_plugins,
+    _script_json,
+)
+
+# Label lists shorter than this are embedded in each chart
+SHARED_MIN_LENGTH = 16
+
+MSG_CHARTS = "Charts of a report must be a non empty list of Chart objects."
+
+MSG_LAYOUT = (
+    "Report layout must be a positive integer (number of charts per row) "
+    "or a list of positive integers (number of charts of each row)."
+)
+
+REPORT_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+"""
+
+REPORT_ROW = (
+    '<div class="ipychart-row" style="display: grid; '
+    'grid-template-columns: repeat({columns}, minmax(0, 1fr));">\n'
+)
+
+
+def _report_rows(n_charts: int, layout: Union[int, list]) -> list:
+    """
+    Split the charts of a report into rows.
+
+    Args:
+        n_charts (int): The number of charts.
+
+        layout (Union[int, list]): The number of charts per row, or the
+            number of charts of each row. The last row size is repeated for
+            the remaining charts.
+
+    Returns:
+        list: The number of charts of each row.
+    """
+    sizes = [layout] if isinstance(layout, int) else list(layout)
+
+    if not sizes or any(
+        isinstance(s, bool) or not isinstance(s, int) or s < 1 for s in sizes
+    ):
+        raise ValueError(MSG_LAYOUT)
+
+    rows = []
+    while n_charts > 0:
+        size = min(sizes[min(len(rows), len(sizes) - 1)], n_charts)
+        rows.append(size)
+        n_charts -= size
+
+    return rows
+
+
+def _plugin_state(chart: Chart) -> dict:
+    """
+    Get the parts of the state of a chart used to select its plugins,
+    without serializing its data.
+
+    Args:
+        chart (Chart): The chart.
+
+    Returns:
+        dict: A partial synced state of the chart.
+    """
+    return {
+        "_options_sync": chart._options,
+        "_data_sync": {"datasets": chart._data.get("datasets", [])},
+        "_colorscheme_sync": chart._colorscheme,
+        "_zoom_sync": chart._zoom,
+    }
+
+
+def _shared_key(content: bytes) -> str:
+    """
+    Compute the key of an array shared by the charts of a report.
+
+    Args:
+        content (bytes): The content of the array.
+
+    Returns:
+        str: The key of the array.
+    """
+    return hashlib.sha1(content).hexdigest()
+
+
+class _ReportWriter:
+    """
+    Write the charts of a report one by one, embedding the arrays shared by
+    several charts only once.
+
+    Args:
+        file: The text file the report is written to.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.shared = set()
+
+    def _share(self, key: str, script) -> dict:
+        """
+        Embed a shared array, if it is not already embedded.
+
+        Args:
+            key (str): The key of the array.
+
+            script (Callable): Function returning the script embedding the
+                array, only called for new arrays.
+
+        Returns:
+            dict: The reference to the shared array.
+        """
+        if key not in self.shared:
+            self.shared.add(key)
+            self.file.write(f"<script>{script()}</script>\n")
+
+        return {"$shared": key}
+
+    def _share_buffer(self, buffer) -> dict:
+        content = memoryview(buffer).cast("B")
+        key = _shared_key(content)
+        return self._share(
+            key,
+            lambda: f'ipychart.shareBuffer("{key}", '
+            f'"{_encode_buffer(content)}");',
+        )
+
+    def _share_labels(self, labels: list) -> dict:
+        encoded = _script_json(labels)
+        key = _shared_key(encoded.encode("utf-8"))
+        return self._share(key, lambda: f'ipychart.share("{key}", {encoded});')
+
+    def write_chart(self, element_id: str, state, buffer_paths, buffers):
+        """
+        Write a chart and the shared arrays it uses.
+
+        Args:
+            element_id (str): The id of the element containing the chart.
+
+            state (dict): The synced state of the chart, without its
+                buffers.
+
+            buffer_paths (list): The paths of the buffers in the state.
+
+            buffers (list): The binary buffers of the state.
+        """
+        data = state.get("_data_sync") or {}
+        labels = data.get("labels")
+
+        if isinstance(labels, list) and len(labels) >= SHARED_MIN_LENGTH:
+            state["_data_sync"] = dict(data, labels=self._share_labels(labels))
+
+        spec = {
+            "state": state,
+            "buffer_paths": buffer_paths,
+            "buffers": [self._share_buffer(b) for b in buffers],
+        }
+
+        self.file.write(
+            f'<div id="{element_id}" style="position: relative;"></div>\n'
+            f'<script>ipychart.render("{element_id}", {_script_json(spec)});'
+            "</script>\n"
+        )
+
+
+def export_report(
+    charts: Iterable[Chart],
+    path: str,
+    layout: Union[int, list] = 1,
+    title: str = "ipychart report",
+    compress: bool = False,
+    precision: Union[int, str, None] = None,
+):
+    """
+    Export several charts into a single self-contained HTML document.
+
+    Chart.js and the plugins used by the charts are inlined once for the
+    whole document, and arrays shared by several charts (e.g. identical
+    labels) are embedded only once. Charts are serialized and written one
+    by one, so that the whole document is never held in memory.
+
+    Args:
+        charts (Iterable[Chart]): The charts to export.
+
+        path (str): Path of the HTML file.
+
+        layout (Union[int, list], optional): The number of charts per row,
+            or a list with the number of charts of each row (the last value
+            is used for the remaining rows). Defaults to 1.
+
+        title (str, optional): The title of the document. Defaults to
+            "ipychart report".
+
+        compress (bool, optional): Whether to store numeric data as
+            compressed binary buffers (see Chart.to_html). Defaults to False.
+
+        precision (Union[int, str, None], optional): Precision of the
+            compressed values (see Chart.to_html). Defaults to None.
+    """
+    charts = list(charts)
+
+    if not charts or not all(isinstance(c, Chart) for c in charts):
+        raise ValueError(MSG_CHARTS)
+
+    _check_precision(precision)
+    rows = _report_rows(len(charts), layout)
+
+    required = set()
+    for chart in charts:
+        required.update(_required_plugins(_plugin_state(chart)))
+    plugins = [name for name in PLUGIN_BUNDLES if name in required]
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(REPORT_HEAD.format(title=html.escape(title)))
+        for bundle in [CORE_BUNDLE] + plugins:
+            f.write(_inline_script(_read_bundle(bundle)) + "\n")
+        f.write("</head>\n<body>\n")
+
+        writer = _ReportWriter(f)
+        charts = iter(enumerate(charts))
+        for size in rows:
+            f.write(REPORT_ROW.format(columns=size))
+            for _ in range(size):
+                i, chart = next(charts)
+                writer.write_chart(
+                    f"ipychart-{i}",
+                    *chart._export_state(compress, precision, binary=True),
+                )
+            f.write("</div>\n")
+
+        f.write("</body>\n</html>\n")
@@ -0,0 +1,153 @@
+import ipywidgets as widgets
+
+from typing import Union
+from traitlets import Unicode, Dict
+
+from .chart import Chart
+
+MSG_PANELS = (
+    "A chart grid needs one title per panel, and its number of datasets "
+    "must be a multiple of its number of panels."
+)
+
+MSG_COLUMNS = (
+    "The number of columns of a chart grid must be None or a positive "
+    "integer."
+)
+
+
+@widgets.register
+class ChartGrid(Chart):
+    """
+    A grid of charts (small multiples) drawn by a single widget.
+
+    All panels share the labels, the kind and the options of the grid, and
+    draw the same number of datasets: the datasets of data are split, in
+    order, between the panels. Charts of a grid are usually created with
+    ipychart.facetplot.
+
+    Args:
+        data (dict): Data to draw. The labels are shared by all the panels,
+            the datasets of the first panel come first, then the datasets of
+            the second panel, etc.
+
+        kind (str): Type of the charts.
+
+        titles (list): The title of each panel.
+
+        columns (int, optional): The number of panels of each row of the
+            grid. Defaults to None (all panels in one row).
+
+        options, colorscheme, zoom, binary, palette, validate: See Chart.
+            Options are shared by all the panels.
+
+    Examples:
+        ```python
+        dataset = {
+            'labels': ['A', 'B', 'C'],
+            'datasets': [{'data': [1, 2, 3]}, {'data': [3, 2, 1]}]
+        }
+
+        mygrid = ChartGrid(data=dataset, kind='bar', titles=['2023', '2024'])
+        mygrid
+        ```
+    """
+
+    _view_name = Unicode("ChartGridView").tag(sync=True)
+    _model_name = Unicode("ChartGridModel").tag(sync=True)
+
+    _panels_sync = Dict().tag(sync=True)
+
+    def __init__(
+        self,
+        data: dict,
+        kind: str,
+        titles: list,
+        columns: Union[int, None] = None,
+        options: Union[dict, None] = None,
+        colorscheme: Union[str, None] = None,
+        zoom: bool = True,
+        binary: bool = False,
+        palette: Union[list, None] = None,
+        validate: str = "full",
+    ):
+        self._titles = titles
+        self._columns = columns
+
+        super().__init__(
+            data=data,
+            kind=kind,
+            options=options,
+            colorscheme=colorscheme,
+            zoom=zoom,
+            binary=binary,
+            palette=palette,
+            validate=validate,
+        )
+
+    @property
+    def titles(self):
+        return self._titles
+
+    @titles.setter
+    def titles(self, value):
+        self._titles = value
+        self._refresh_chart()
+
+    @property
+    def columns(self):
+        return self._columns
+
+    @columns.setter
+    def columns(self, value):
+        self._columns = value
+        self._refresh_chart()
+
+    def _validate_current_arguments(self):
+        """
+        Validate chart arguments, and the panels of the grid.
+        """
+        super()._validate_current_arguments()
+
+        if not isinstance(self._titles, (list, tuple)) or not self._titles:
+            raise ValueError(MSG_PANELS)
+
+        if len(self._data["datasets"]) % len(self._titles):
+            raise ValueError(MSG_PANELS)
+
+        if self._columns is not None and (
+            isinstance(self._columns, bool)
+            or not isinstance(self._columns, int)
+            or self._columns < 1
+        ):
+            raise ValueError(MSG_COLUMNS)
+
+    def _set_synced_attributes(self):
+        """
+        Update JavaScript-synchronized variables, panels included, in a
+        single message.
+        """
+        with self.hold_sync():
+            self._panels_sync = {
+                "titles": [str(t) for t in self._titles],
+                "columns": self._columns or len(self._titles),
+                "datasets": self._datasets_per_chart(),
+            }
+            super()._set_synced_attributes()
+
+    def _datasets_per_chart(self) -> int:
+        return len(self._data["datasets"]) // len(self._titles)
+
+    def _default_colors(self, idx: int, ds: dict) -> tuple:
+        # Datasets of each panel are colored as in a chart of their own
+        return super()._default_colors(idx % self._datasets_per_chart(), ds)
+
+    def _export_state(
+        self, compress: bool = False, precision=None, binary: bool = False
+    ) -> tuple:
+        state, buffer_paths, buffers = super()._export_state(
+            compress, precision, binary
+        )
+        state["_panels_sync"] = self._panels_sync
+
+        return state, buffer_paths, buffers
@@ -3,17 +3,23 @@ import numpy as np
 
 from typing import Union
 from pandas.api.types import is_numeric_dtype
-from sklearn.neighbors import KernelDensity
-from sklearn.model_selection import GridSearchCV
 
 from .chart import Chart
+from .grid import ChartGrid
+from .spec import _chart
+from .profiler import _profiled
+from .utils.kde import _kde
+from .utils.frames import _is_native_frame, _to_pandas
+from .utils.chunks import MSG_CHUNK_KIND, _is_chunked
 from .utils.plots_utils import (
     _create_chart_options,
     _create_chart_data_agg,
     _create_chart_data_count,
+    _create_facet_data,
 )
 
 
+@_profiled
 def countplot(
     data: pd.DataFrame,
     x: str,
@@ -21,13 +27,16 @@ def countplot(
     dataset_options: Union[dict, None] = None,
     options: Union[dict, None] = None,
     colorscheme: Union[str, None] = None,
+    palette: Union[list, None] = None,
     zoom: bool = True,
+    binary: bool = False,
 ) -> Chart:
     """
     Show the counts of observations in each categorical bin using bars.
 
     Args:
-        data (pd.DataFrame): The dataframe used to draw the chart.
+        data (pd.DataFrame): The dataframe used to draw the chart. Polars
+            DataFrames and LazyFrames and pyarrow Tables are also accepted.
 
         x (str): Column of the dataframe used as datapoints for x Axis.
 
@@ -44,9 +53,17 @@ def countplot(
         colorscheme (str, optional): Colorscheme to use when drawing the
             chart. Defaults to None.
 
+        palette (list, optional): Colors used to draw the datasets when no
+            colorscheme is provided, as (r, g, b) tuples or hexadecimal
+            strings. Defaults to None (ipychart palette).
+
         zoom (bool, optional): Allow the user to zoom on the Chart once it
             is created. Defaults to True.
 
+        binary (bool, optional): Send numeric values to the browser as binary
+            buffers instead of JSON lists, which is much faster for large
+            datasets. Defaults to False.
+
     Returns:
         ipychart.Chart: A chart which display the data using ipychart.
     """
@@ -54,31 +71,40 @@ def countplot(
         dataset_options = {}
 
     data = _create_chart_data_count(
-        data=data, x=x, hue=hue, dataset_options=dataset_options
+        data=data, x=x, hue=hue, dataset_options=dataset_options, binary=binary
     )
 
     options = _create_chart_options(
         kind="count", options=options, x=x, y="Count", hue=hue
     )
 
-    return Chart(
+    return _chart(
         data=data,
         kind="bar",
         options=options,
         colorscheme=colorscheme,
+        palette=palette,
         zoom=zoom,
+        binary=binary,
     )
 
 
+@_profiled
 def distplot(
     data: pd.DataFrame,
     x: str,
     bandwidth: Union[float, str] = "auto",
     gridsize: int = 1000,
+    method: str = "auto",
+    weights: Union[str, None] = None,
+    n_jobs: Union[int, None] = None,
+    max_samples: Union[int, None] = None,
     dataset_options: Union[dict, None] = None,
     options: Union[dict, None] = None,
     colorscheme: Union[str, None] = None,
+    palette: Union[list, None] = None,
     zoom: bool = True,
+    binary: bool = False,
     **kwargs,
 ) -> Chart:
     """
@@ -88,17 +114,39 @@ def distplot(
     data.
 
     Args:
-        data (pd.DataFrame): The dataframe used to draw the chart.
+        data (pd.DataFrame): The dataframe used to draw the chart. Polars
+            DataFrames and LazyFrames and pyarrow Tables are also accepted.
 
         x (str): Column of the dataframe used as datapoints for x Axis.
 
         bandwidth ([float, str], optional): Parameter which affect how
-        “smooth” the resulting curve is. If set to 'auto', the optimal
-        bandwidth is found using gridsearch. Defaults to 'auto'.
+            “smooth” the resulting curve is. It can be set to a number, or
+            to the method used to find it: 'scott' or 'silverman' (rules of
+            thumb), 'isj' (Improved Sheather-Jones, robust to multimodal
+            data, much faster) or 'auto' (cross-validated gridsearch).
+            Defaults to 'auto'.
 
         gridsize (int, optional): Number of discrete points in the
             evaluation grid. Defaults to 1000.
 
+        method (str, optional): Method used to estimate the density. "fft"
+            bins the data onto the grid and convolves it with the kernel,
+            which is much faster on large dataframes. "sklearn" uses
+            scikit-learn's KernelDensity. "auto" uses "fft" for gaussian
+            kernels whose bandwidth spans at least a few grid steps (where
+            both give the same curve), and "sklearn" otherwise. Defaults to
+            "auto".
+
+        weights (str, optional): Column of the dataframe used to weight the
+            observations. Defaults to None.
+
+        n_jobs (int, optional): Number of jobs used to run the gridsearch in
+            parallel when bandwidth is 'auto'. Defaults to None.
+
+        max_samples (int, optional): Maximum number of observations, drawn
+            at random, used by the gridsearch when bandwidth is 'auto'. If
+            None, all observations are used. Defaults to None.
+
         dataset_options (dict, optional): Options related to the dataset
             object (i.e. options concerning your data). Defaults to {}.
 
@@ -109,62 +157,59 @@ def distplot(
         colorscheme (str, optional): Colorscheme to use when drawing the chart.
             Defaults to None.
 
+        palette (list, optional): Colors used to draw the datasets when no
+            colorscheme is provided, as (r, g, b) tuples or hexadecimal
+            strings. Defaults to None (ipychart palette).
+
         zoom (bool, optional): Allow the user to zoom on the Chart once it
             is created. Defaults to True.
 
+        binary (bool, optional): Send numeric values to the browser as binary
+            buffers instead of JSON lists, which is much faster for large
+            datasets. Defaults to False.
+
         kwargs (optionnal): Other keyword arguments are passed down to
-            scikit-learn's KernelDensity class.
+            scikit-learn's KernelDensity class. With method="fft", only the
+            "kernel" argument is supported.
 
     Returns:
         ipychart.Chart: A chart which display the data using ipychart.
     """
+    if _is_chunked(data):
+        raise ValueError(MSG_CHUNK_KIND)
+
+    if _is_native_frame(data):
+        data = _to_pandas(data, [x, weights])
+
     assert is_numeric_dtype(data[x]), "x must be a numeric column"
-    if isinstance(bandwidth, str):
-        assert bandwidth == "auto", "bandwidth must be an int or 'auto'"
+    if weights:
+        assert is_numeric_dtype(data[weights]), "weights must be numeric"
 
     if dataset_options is None:
         dataset_options = {}
 
-    # Remove outliers to find max and min values for the x axis
-    iqr = data[x].quantile(0.95) - data[x].quantile(0.05)
-
-    data_truncated = data[x][
-        ~(
-            (data[x] < (data[x].quantile(0.05) - 0.5 * iqr))
-            | (data[x] > (data[x].quantile(0.95) + 0.5 * iqr))
-        )
-    ]
-
-    max_val, min_val = (
-        int(data_truncated.max()) + 1,
-        int(data_truncated.min()),
-    )
-
-    max_val, min_val = (
-        max_val + 0.05 * (max_val + abs(min_val)),
-        min_val - 0.05 * (max_val + abs(min_val)),
+    values = data[x].to_numpy()
+    sample_weight = data[weights].to_numpy() if weights else None
+
+    x_grid, pdf, bandwidth = _kde(
+        values,
+        gridsize=gridsize,
+        bandwidth=bandwidth,
+        weights=sample_weight,
+        method=method,
+        n_jobs=n_jobs,
+        max_samples=max_samples,
+        **kwargs,
     )
 
-    # Create grid which will be used to compute kde
-    _, step = np.linspace(min_val, max_val, num=gridsize, retstep=True)
-    x_grid = np.round(np.arange(min_val, max_val, step), 5)
-
-    # If bandwidth is 'auto', find the best bandwidh using gridsearch
-    if bandwidth == "auto":
-        grid = GridSearchCV(
-            KernelDensity(), {"bandwidth": np.linspace(0.1, 2, 30)}, cv=5
-        )
-        grid.fit(data[x].dropna().to_numpy()[:, None])
-        bandwidth = grid.best_params_["bandwidth"]
-
-    kde_skl = KernelDensity(bandwidth=bandwidth, **kwargs)
-    kde_skl.fit(data[x].dropna().to_numpy()[:, np.newaxis])
-    pdf = np.exp(kde_skl.score_samples(x_grid[:, np.newaxis]))
-
     data = {
-        "labels": x_grid.tolist(),
+        "labels": x_grid if binary else x_grid.tolist(),
         "datasets": [
-            {"data": pdf.tolist(), "pointRadius": 0, **dataset_options}
+            {
+                "data": pdf if binary else pdf.tolist(),
+                "pointRadius": 0,
+                **dataset_options,
+            }
         ],
     }
 
@@ -172,7 +217,7 @@ def distplot(
         kind="count",
         options=options,
         x=x,
-        y=f"Density (bandwidth: {bandwidth.round(4)})",
+        y=f"Density (bandwidth: {round(bandwidth, 4)})",
         hue=None,
     )
 
@@ -201,15 +246,18 @@ def distplot(
         if "callback" not in ticks_options:
             ticks_options["callback"] = ticks_format_function
 
-    return Chart(
+    return _chart(
         data=data,
         kind="line",
         options=options,
         colorscheme=colorscheme,
+        palette=palette,
         zoom=zoom,
+        binary=binary,
     )
 
 
+@_profiled
 def lineplot(
     data: pd.DataFrame,
     x: str,
@@ -219,7 +267,11 @@ def lineplot(
     dataset_options: Union[dict, list, None] = None,
     options: Union[dict, None] = None,
     colorscheme: Union[str, None] = None,
+    palette: Union[list, None] = None,
     zoom: bool = True,
+    binary: bool = False,
+    max_points: Union[int, None] = None,
+    downsample: str = "lttb",
 ) -> Chart:
     """
     Plot a line chart.
@@ -228,7 +280,8 @@ def lineplot(
     used to show a trend in the data, or the comparison of two data sets.
 
     Args:
-        data (pd.DataFrame): The dataframe used to draw the chart.
+        data (pd.DataFrame): The dataframe used to draw the chart. Polars
+            DataFrames and LazyFrames and pyarrow Tables are also accepted.
 
         x (str): Column of the dataframe used as datapoints for x Axis.
 
@@ -250,9 +303,25 @@ def lineplot(
         colorscheme (str, optional): Colorscheme to use when drawing the chart.
             Defaults to None.
 
+        palette (list, optional): Colors used to draw the datasets when no
+            colorscheme is provided, as (r, g, b) tuples or hexadecimal
+            strings. Defaults to None (ipychart palette).
+
         zoom (bool, optional): Allow the user to zoom on the Chart once it is
             created. Defaults to True.
 
+        binary (bool, optional): Send numeric values to the browser as binary
+            buffers instead of JSON lists, which is much faster for large
+            datasets. Defaults to False.
+
+        max_points (int, optional): If set, the datasets are downsampled to
+            about max_points visually representative points in total before
+            being sent to the browser. Defaults to None.
+
+        downsample (str, optional): The downsampling algorithm used when
+            max_points is set: 'lttb' (Largest-Triangle-Three-Buckets),
+            'minmax' (keeps extrema) or 'every_nth'. Defaults to 'lttb'.
+
     Returns:
         ipychart.Chart: A chart which display the data using ipychart.
     """
@@ -267,21 +336,27 @@ def lineplot(
         hue=hue,
         agg=agg,
         dataset_options=dataset_options,
+        binary=binary,
+        max_points=max_points,
+        downsample=downsample,
     )
 
     options = _create_chart_options(
         kind="line", options=options, x=x, y=y, hue=hue, agg=agg
     )
 
-    return Chart(
+    return _chart(
         data=data,
         kind="line",
         options=options,
         colorscheme=colorscheme,
+        palette=palette,
         zoom=zoom,
+        binary=binary,
     )
 
 
+@_profiled
 def barplot(
     data: pd.DataFrame,
     x: str,
@@ -291,7 +366,9 @@ def barplot(
     dataset_options: Union[dict, list, None] = None,
     options: Union[dict, None] = None,
     colorscheme: Union[str, None] = None,
+    palette: Union[list, None] = None,
     zoom: bool = True,
+    binary: bool = False,
 ) -> Chart:
     """
     Plot a bar chart.
@@ -301,7 +378,8 @@ def barplot(
     and the comparison of multiple data sets side by side.
 
     Args:
-        data (pd.DataFrame): The dataframe used to draw the chart.
+        data (pd.DataFrame): The dataframe used to draw the chart. Polars
+            DataFrames and LazyFrames and pyarrow Tables are also accepted.
 
         x (str): Column of the dataframe used as datapoints for x Axis.
 
@@ -323,9 +401,17 @@ def barplot(
         colorscheme (str, optional): Colorscheme to use when drawing the chart.
             Defaults to None.
 
+        palette (list, optional): Colors used to draw the datasets when no
+            colorscheme is provided, as (r, g, b) tuples or hexadecimal
+            strings. Defaults to None (ipychart palette).
+
         zoom (bool, optional): Allow the user to zoom on the Chart once it is
             created. Defaults to True.
 
+        binary (bool, optional): Send numeric values to the browser as binary
+            buffers instead of JSON lists, which is much faster for large
+            datasets. Defaults to False.
+
     Returns:
         ipychart.Chart: A chart which display the data using ipychart.
     """
@@ -340,21 +426,25 @@ def barplot(
         hue=hue,
         agg=agg,
         dataset_options=dataset_options,
+        binary=binary,
     )
 
     options = _create_chart_options(
         kind="bar", options=options, x=x, y=y, hue=hue, agg=agg
     )
 
-    return Chart(
+    return _chart(
         data=data,
         kind="bar",
         options=options,
         colorscheme=colorscheme,
+        palette=palette,
         zoom=zoom,
+        binary=binary,
     )
 
 
+@_profiled
 def radarplot(
     data: pd.DataFrame,
     x: str,
@@ -364,6 +454,8 @@ def radarplot(
     dataset_options: Union[dict, list, None] = None,
     options: Union[dict, None] = None,
     colorscheme: Union[str, None] = None,
+    palette: Union[list, None] = None,
+    binary: bool = False,
 ) -> Chart:
     """
     Plot a radar chart.
@@ -373,7 +465,8 @@ def radarplot(
     points of two or more different data sets.
 
     Args:
-        data (pd.DataFrame): The dataframe used to draw the chart.
+        data (pd.DataFrame): The dataframe used to draw the chart. Polars
+            DataFrames and LazyFrames and pyarrow Tables are also accepted.
 
         x (str): Column of the dataframe used as datapoints for x Axis.
 
@@ -395,6 +488,14 @@ def radarplot(
         colorscheme (str, optional): Colorscheme to use when drawing the chart.
             Defaults to None.
 
+        palette (list, optional): Colors used to draw the datasets when no
+            colorscheme is provided, as (r, g, b) tuples or hexadecimal
+            strings. Defaults to None (ipychart palette).
+
+        binary (bool, optional): Send numeric values to the browser as binary
+            buffers instead of JSON lists, which is much faster for large
+            datasets. Defaults to False.
+
     Returns:
         ipychart.Chart: A chart which display the data using ipychart.
     """
@@ -409,17 +510,24 @@ def radarplot(
         hue=hue,
         agg=agg,
         dataset_options=dataset_options,
+        binary=binary,
     )
 
     options = _create_chart_options(
         kind="radar", options=options, x=x, y=y, hue=hue, agg=agg
     )
 
-    return Chart(
-        data=data, kind="radar", options=options, colorscheme=colorscheme
+    return _chart(
+        data=data,
+        kind="radar",
+        options=options,
+        colorscheme=colorscheme,
+        palette=palette,
+        binary=binary,
     )
 
 
+@_profiled
 def doughnutplot(
     data: pd.DataFrame,
     x: str,
@@ -428,6 +536,8 @@ def doughnutplot(
     dataset_options: Union[dict, None] = None,
     options: Union[dict, None] = None,
     colorscheme: Union[str, None] = None,
+    palette: Union[list, None] = None,
+    binary: bool = False,
 ) -> Chart:
     """
     Plot a doughnut chart.
@@ -436,7 +546,8 @@ def doughnutplot(
     proportions between data.
 
     Args:
-        data (pd.DataFrame): The dataframe used to draw the chart.
+        data (pd.DataFrame): The dataframe used to draw the chart. Polars
+            DataFrames and LazyFrames and pyarrow Tables are also accepted.
 
         x (str): Column of the dataframe used as datapoints for x Axis.
 
@@ -455,6 +566,14 @@ def doughnutplot(
         colorscheme (str, optional): Colorscheme to use when drawing the chart.
             Defaults to None.
 
+        palette (list, optional): Colors used to draw the datasets when no
+            colorscheme is provided, as (r, g, b) tuples or hexadecimal
+            strings. Defaults to None (ipychart palette).
+
+        binary (bool, optional): Send numeric values to the browser as binary
+            buffers instead of JSON lists, which is much faster for large
+            datasets. Defaults to False.
+
     Returns:
         ipychart.Chart: A chart which display the data using ipychart.
     """
@@ -469,22 +588,29 @@ def doughnutplot(
             y=y,
             agg=agg,
             dataset_options=dataset_options,
+            binary=binary,
         )
 
     else:
         data = _create_chart_data_count(
-            data=data, x=x, dataset_options=dataset_options
+            data=data, x=x, dataset_options=dataset_options, binary=binary
         )
 
     options = _create_chart_options(
         kind="doughnut", options=options, x=x, y=y, hue=None, agg=agg
     )
 
-    return Chart(
-        data=data, kind="doughnut", options=options, colorscheme=colorscheme
+    return _chart(
+        data=data,
+        kind="doughnut",
+        options=options,
+        colorscheme=colorscheme,
+        palette=palette,
+        binary=binary,
     )
 
 
+@_profiled
 def pieplot(
     data: pd.DataFrame,
     x: str,
@@ -493,6 +619,8 @@ def pieplot(
     dataset_options: Union[dict, None] = None,
     options: Union[dict, None] = None,
     colorscheme: Union[str, None] = None,
+    palette: Union[list, None] = None,
+    binary: bool = False,
 ) -> Chart:
     """
     Plot a pie chart.
@@ -501,7 +629,8 @@ def pieplot(
     proportions between data.
 
     Args:
-        data (pd.DataFrame): The dataframe used to draw the chart.
+        data (pd.DataFrame): The dataframe used to draw the chart. Polars
+            DataFrames and LazyFrames and pyarrow Tables are also accepted.
 
         x (str): Column of the dataframe used as datapoints for x Axis.
 
@@ -521,6 +650,14 @@ def pieplot(
         colorscheme (str, optional): Colorscheme to use when drawing the chart.
             Defaults to None.
 
+        palette (list, optional): Colors used to draw the datasets when no
+            colorscheme is provided, as (r, g, b) tuples or hexadecimal
+            strings. Defaults to None (ipychart palette).
+
+        binary (bool, optional): Send numeric values to the browser as binary
+            buffers instead of JSON lists, which is much faster for large
+            datasets. Defaults to False.
+
     Returns:
         ipychart.Chart: A chart which display the data using ipychart.
     """
@@ -535,22 +672,29 @@ def pieplot(
             y=y,
             agg=agg,
             dataset_options=dataset_options,
+            binary=binary,
         )
 
     else:
         data = _create_chart_data_count(
-            data=data, x=x, dataset_options=dataset_options
+            data=data, x=x, dataset_options=dataset_options, binary=binary
         )
 
     options = _create_chart_options(
         kind="pie", options=options, x=x, y=y, hue=None, agg=agg
     )
 
-    return Chart(
-        data=data, kind="pie", options=options, colorscheme=colorscheme
+    return _chart(
+        data=data,
+        kind="pie",
+        options=options,
+        colorscheme=colorscheme,
+        palette=palette,
+        binary=binary,
     )
 
 
+@_profiled
 def polarplot(
     data: pd.DataFrame,
     x: str,
@@ -559,6 +703,8 @@ def polarplot(
     dataset_options: Union[dict, None] = None,
     options: Union[dict, None] = None,
     colorscheme: Union[str, None] = None,
+    palette: Union[list, None] = None,
+    binary: bool = False,
 ) -> Chart:
     """
     Plot a polar area chart.
@@ -567,7 +713,8 @@ def polarplot(
     same angle - the radius of the segment differs depending on the value.
 
     Args:
-        data (pd.DataFrame): The dataframe used to draw the chart.
+        data (pd.DataFrame): The dataframe used to draw the chart. Polars
+            DataFrames and LazyFrames and pyarrow Tables are also accepted.
 
         x (str): Column of the dataframe used as datapoints for x Axis.
 
@@ -586,6 +733,14 @@ def polarplot(
         colorscheme (str, optional): Colorscheme to use when drawing the chart.
             Defaults to None.
 
+        palette (list, optional): Colors used to draw the datasets when no
+            colorscheme is provided, as (r, g, b) tuples or hexadecimal
+            strings. Defaults to None (ipychart palette).
+
+        binary (bool, optional): Send numeric values to the browser as binary
+            buffers instead of JSON lists, which is much faster for large
+            datasets. Defaults to False.
+
     Returns:
         ipychart.Chart: A chart which display the data using ipychart.
     """
@@ -600,22 +755,29 @@ def polarplot(
             y=y,
             agg=agg,
             dataset_options=dataset_options,
+            binary=binary,
         )
 
     else:
         data = _create_chart_data_count(
-            data=data, x=x, dataset_options=dataset_options
+            data=data, x=x, dataset_options=dataset_options, binary=binary
         )
 
     options = _create_chart_options(
         kind="polarArea", options=options, x=x, y=y, hue=None, agg=agg
     )
 
-    return Chart(
-        data=data, kind="polarArea", options=options, colorscheme=colorscheme
+    return _chart(
+        data=data,
+        kind="polarArea",
+        options=options,
+        colorscheme=colorscheme,
+        palette=palette,
+        binary=binary,
     )
 
 
+@_profiled
 def scatterplot(
     data: pd.DataFrame,
     x: str,
@@ -624,7 +786,11 @@ def scatterplot(
     dataset_options: Union[dict, list, None] = None,
     options: Union[dict, None] = None,
     colorscheme: Union[str, None] = None,
+    palette: Union[list, None] = None,
     zoom: bool = True,
+    binary: bool = False,
+    max_points: Union[int, None] = None,
+    downsample: str = "lttb",
 ) -> Chart:
     """
     Plot a scatter chart.
@@ -633,7 +799,8 @@ def scatterplot(
     to a linear axis.
 
     Args:
-        data (pd.DataFrame): The dataframe used to draw the chart.
+        data (pd.DataFrame): The dataframe used to draw the chart. Polars
+            DataFrames and LazyFrames and pyarrow Tables are also accepted.
 
         x (str): Column of the dataframe used as datapoints for x Axis.
 
@@ -652,9 +819,25 @@ def scatterplot(
         colorscheme (str, optional): Colorscheme to use when drawing the chart.
             Defaults to None.
 
+        palette (list, optional): Colors used to draw the datasets when no
+            colorscheme is provided, as (r, g, b) tuples or hexadecimal
+            strings. Defaults to None (ipychart palette).
+
         zoom (bool, optional): Allow the user to zoom on the Chart once it is
             created. Defaults to True.
 
+        binary (bool, optional): Send numeric values to the browser as binary
+            buffers instead of JSON lists, which is much faster for large
+            datasets. Defaults to False.
+
+        max_points (int, optional): If set, each dataset is downsampled to
+            about max_points visually representative points before being
+            sent to the browser. Defaults to None.
+
+        downsample (str, optional): The downsampling algorithm used when
+            max_points is set: 'lttb' (Largest-Triangle-Three-Buckets),
+            'minmax' (keeps extrema) or 'every_nth'. Defaults to 'lttb'.
+
     Returns:
         ipychart.Chart: A chart which display the data using ipychart.
     """
@@ -668,21 +851,27 @@ def scatterplot(
         y=y,
         hue=hue,
         dataset_options=dataset_options,
+        binary=binary,
+        max_points=max_points,
+        downsample=downsample,
     )
 
     options = _create_chart_options(
         kind="scatter", options=options, x=x, y=y, hue=hue
     )
 
-    return Chart(
+    return _chart(
         data=data,
         kind="scatter",
         options=options,
         colorscheme=colorscheme,
+        palette=palette,
         zoom=zoom,
+        binary=binary,
     )
 
 
+@_profiled
 def bubbleplot(
     data: pd.DataFrame,
     x: str,
@@ -692,7 +881,9 @@ def bubbleplot(
     dataset_options: Union[dict, list, None] = None,
     options: Union[dict, None] = None,
     colorscheme: Union[str, None] = None,
+    palette: Union[list, None] = None,
     zoom: bool = True,
+    binary: bool = False,
 ) -> Chart:
     """
     Plot a bubble chart.
@@ -706,7 +897,8 @@ def bubbleplot(
     bubbles.
 
     Args:
-        data (pd.DataFrame): The dataframe used to draw the chart.
+        data (pd.DataFrame): The dataframe used to draw the chart. Polars
+            DataFrames and LazyFrames and pyarrow Tables are also accepted.
 
         x (str): Column of the dataframe used as datapoints for x Axis.
 
@@ -727,9 +919,17 @@ def bubbleplot(
         colorscheme (str, optional): Colorscheme to use when drawing the chart.
             Defaults to None.
 
+        palette (list, optional): Colors used to draw the datasets when no
+            colorscheme is provided, as (r, g, b) tuples or hexadecimal
+            strings. Defaults to None (ipychart palette).
+
         zoom (bool, optional): Allow the user to zoom on the Chart once it is
             created. Defaults to True.
 
+        binary (bool, optional): Send numeric values to the browser as binary
+            buffers instead of JSON lists, which is much faster for large
+            datasets. Defaults to False.
+
     Returns:
         ipychart.Chart: A chart which display the data using ipychart.
     """
@@ -744,16 +944,134 @@ def bubbleplot(
         r=r,
         hue=hue,
         dataset_options=dataset_options,
+        binary=binary,
     )
 
     options = _create_chart_options(
         kind="bubble", options=options, x=x, y=y, hue=hue
     )
 
-    return Chart(
+    return _chart(
         data=data,
         kind="bubble",
         options=options,
         colorscheme=colorscheme,
+        palette=palette,
+        zoom=zoom,
+        binary=binary,
+    )
+
+
+@_profiled
+def facetplot(
+    data: pd.DataFrame,
+    x: str,
+    y: Union[str, None] = None,
+    col: Union[str, None] = None,
+    row: Union[str, None] = None,
+    hue: Union[str, None] = None,
+    kind: str = "bar",
+    agg: str = "mean",
+    col_wrap: Union[int, None] = None,
+    dataset_options: Union[dict, list, None] = None,
+    options: Union[dict, None] = None,
+    colorscheme: Union[str, None] = None,
+    palette: Union[list, None] = None,
+    zoom: bool = True,
+    binary: bool = False,
+) -> ChartGrid:
+    """
+    Plot a grid of bar or line charts (small multiples), one for each value
+    of col (and/or row).
+
+    Data are aggregated in a single pass for all the panels, which share
+    their labels and options and are drawn by a single widget. This is much
+    cheaper than one chart per subset of the data.
+
+    Args:
+        data (pd.DataFrame): The dataframe used to draw the charts. Polars
+            DataFrames and LazyFrames, pyarrow Tables and iterables of
+            dataframe chunks are also accepted.
+
+        x (str): Column of the dataframe used as datapoints for x Axis.
+
+        y (str, optional): Column of the dataframe used as datapoints for y
+            Axis. If None, rows are counted. Defaults to None.
+
+        col (str, optional): Column whose values give the columns of the
+            grid. Defaults to None.
+
+        row (str, optional): Column whose values give the rows of the grid.
+            Defaults to None.
+
+        hue (str, optional): Grouping variable that will produce bars (or
+            lines) with different colors in each panel. Defaults to None.
+
+        kind (str, optional): The kind of the charts, "bar" or "line".
+            Defaults to "bar".
+
+        agg (str, optional): The aggregator used to gather data (ex: 'median'
+            or 'mean'). Defaults to "mean".
+
+        col_wrap (int, optional): The number of panels per row when only col
+            is given. Defaults to None (all panels in one row).
+
+        dataset_options ([dict, list], optional): Options related to the
+            dataset object (i.e. options concerning your data). Defaults to {}.
+
+        options (dict, optional): Options to configure the charts. This
+            dictionary corresponds to the "options" argument of Chart.js and
+            is shared by all the panels. Defaults to None.
+
+        colorscheme (str, optional): Colorscheme to use when drawing the
+            charts. Defaults to None.
+
+        palette (list, optional): Colors used to draw the datasets when no
+            colorscheme is provided, as (r, g, b) tuples or hexadecimal
+            strings. Defaults to None (ipychart palette).
+
+        zoom (bool, optional): Allow the user to zoom on the charts once they
+            are created. Defaults to True.
+
+        binary (bool, optional): Send numeric values to the browser as binary
+            buffers instead of JSON lists, which is much faster for large
+            datasets. Defaults to False.
+
+    Returns:
+        ipychart.ChartGrid: A grid of charts which display the data using
+            ipychart.
+    """
+    assert kind in ["bar", "line"], "kind must be one of : bar, line"
+
+    data, panels = _create_facet_data(
+        data=data,
+        x=x,
+        y=y,
+        col=col,
+        row=row,
+        hue=hue,
+        agg=None if y is None else agg,
+        col_wrap=col_wrap,
+        dataset_options=dataset_options,
+        binary=binary,
+    )
+
+    options = _create_chart_options(
+        kind=kind,
+        options=options,
+        x=x,
+        y="Count" if y is None else y,
+        hue=hue,
+        agg=None if y is None else agg,
+    )
+
+    return _chart(
+        data=data,
+        kind=kind,
+        options=options,
+        colorscheme=colorscheme,
+        palette=palette,
         zoom=zoom,
+        binary=binary,
+        panels=panels,
     )
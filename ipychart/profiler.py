@@ -0,0 +1,316 @@
+import math
+import functools
+
+from time import perf_counter
+from typing import Callable, Union
+from contextlib import contextmanager, nullcontext
+
+
+class _Profiler:
+    """
+    Global state of the profiling of ipychart.
+
+    Profiles are nested: a chart refreshed while a plot function is profiled
+    records its stages in the profile of the plot function.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.hooks = []
+        self.active = []
+
+
+_PROFILER = _Profiler()
+
+_NULL_STAGE = nullcontext()
+
+
+class _Profile:
+    """
+    Durations and payload sizes recorded while creating or updating a chart.
+
+    Args:
+        name (str): Name of the profiled operation (e.g. "lineplot" or
+            "refresh").
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stages = {}
+        self.bytes = {}
+        self.stats = None
+        self._start = perf_counter()
+
+        # Names of the running stages, and the untimed durations measured
+        # in each of them (the first one for the whole profile)
+        self._running = []
+        self._untimed = [0.0]
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Measure the duration of a stage. Durations of stages run several
+        times are summed.
+
+        Stages run inside another stage are named after it (e.g.
+        "default_inputs.default_style"), so that top-level stages are
+        disjoint.
+
+        Args:
+            name (str): Name of the stage.
+        """
+        qualified = ".".join(self._running + [name])
+        self._running.append(name)
+        self._untimed.append(0.0)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            untimed = self._untimed.pop()
+            self._untimed[-1] += untimed
+            self._running.pop()
+            duration = perf_counter() - start - untimed
+            self.stages[qualified] = self.stages.get(qualified, 0.0) + duration
+
+    @contextmanager
+    def untimed(self):
+        """
+        Exclude the duration of a block (e.g. the measure of a payload) from
+        the running stages and from the total duration.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._untimed[-1] += perf_counter() - start
+
+    def add_bytes(self, name: str, size: int):
+        """
+        Record a payload size.
+
+        Args:
+            name (str): Name of the payload.
+
+            size (int): Size of the payload, in bytes.
+        """
+        self.bytes[name] = self.bytes.get(name, 0) + size
+
+    def finish(self) -> dict:
+        """
+        Stop the profile and send its statistics to the hooks.
+
+        Returns:
+            dict: The statistics of the profile.
+        """
+        self.stats = {
+            "name": self.name,
+            "total": perf_counter() - self._start - self._untimed[0],
+            "stages": dict(self.stages),
+            "bytes": dict(self.bytes),
+        }
+
+        for hook in list(_PROFILER.hooks):
+            hook(self.stats)
+
+        return self.stats
+
+
+def set_profiling(enabled: bool = True):
+    """
+    Enable or disable the profiling of ipychart.
+
+    When enabled, the duration of each stage (aggregation, validation,
+    styling, serialization, ...) and the size of the payloads sent to the
+    browser are recorded for each plot function and each chart refresh. They
+    are available in the "stats" attribute of the charts and sent to the
+    profiling hooks.
+
+    Args:
+        enabled (bool, optional): Whether to enable profiling. Defaults to
+            True.
+    """
+    _PROFILER.enabled = bool(enabled)
+
+
+@contextmanager
+def profiling():
+    """
+    Enable the profiling of ipychart inside a with block.
+
+    Examples:
+        ```python
+        with ipychart.profiling():
+            mychart = ipychart.lineplot(df, x='x', y='y')
+
+        mychart.stats
+        ```
+    """
+    previous = _PROFILER.enabled
+    _PROFILER.enabled = True
+    try:
+        yield
+    finally:
+        _PROFILER.enabled = previous
+
+
+def add_profiling_hook(hook: Callable[[dict], None]):
+    """
+    Register a function called with the statistics of each profile.
+
+    Statistics are a dictionary with the name of the profiled operation
+    ("name"), its total duration in seconds ("total"), the duration of each
+    stage ("stages") and the size in bytes of each payload ("bytes").
+
+    Args:
+        hook (Callable[[dict], None]): The function to call.
+    """
+    _PROFILER.hooks.append(hook)
+
+
+def remove_profiling_hook(hook: Callable[[dict], None]):
+    """
+    Unregister a function registered with add_profiling_hook.
+
+    Args:
+        hook (Callable[[dict], None]): The function to remove.
+    """
+    _PROFILER.hooks.remove(hook)
+
+
+def _is_profiling() -> bool:
+    """
+    Check if the profiling is enabled.
+
+    Returns:
+        bool: True if the profiling is enabled.
+    """
+    return _PROFILER.enabled
+
+
+def _active_profile() -> Union[_Profile, None]:
+    """
+    Get the profile currently recording, if any.
+
+    Returns:
+        _Profile: The active profile, or None.
+    """
+    return _PROFILER.active[-1] if _PROFILER.active else None
+
+
+@contextmanager
+def _profile(name: str):
+    """
+    Record a profile, or extend the active one for nested operations.
+
+    Args:
+        name (str): Name of the profiled operation.
+
+    Yields:
+        _Profile: The recording profile.
+    """
+    if _PROFILER.active:
+        yield _PROFILER.active[-1]
+        return
+
+    profile = _Profile(name)
+    _PROFILER.active.append(profile)
+    try:
+        yield profile
+    finally:
+        _PROFILER.active.pop()
+        profile.finish()
+
+
+def _stage(name: str):
+    """
+    Measure the duration of a stage in the active profile, if any.
+
+    Args:
+        name (str): Name of the stage.
+
+    Returns:
+        A context manager measuring the stage.
+    """
+    if not _PROFILER.active:
+        return _NULL_STAGE
+
+    return _PROFILER.active[-1].stage(name)
+
+
+def _timed(name: str) -> Callable:
+    """
+    Decorate a function to record its duration as a stage of the active
+    profile.
+
+    Args:
+        name (str): Name of the stage.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _PROFILER.active:
+                return func(*args, **kwargs)
+            with _PROFILER.active[-1].stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _profiled(plot: Callable) -> Callable:
+    """
+    Decorate a plot function to profile it when profiling is enabled. The
+    statistics are attached to the returned chart.
+
+    Args:
+        plot (Callable): The plot function.
+
+    Returns:
+        Callable: The decorated function.
+    """
+
+    @functools.wraps(plot)
+    def wrapper(*args, **kwargs):
+        if not _PROFILER.enabled:
+            return plot(*args, **kwargs)
+
+        with _profile(plot.__name__) as profile:
+            chart = plot(*args, **kwargs)
+            chart._profile = profile
+
+        return chart
+
+    return wrapper
+
+
+def _render_timings(stats) -> dict:
+    """
+    Clean the render timings sent by the browser.
+
+    Durations which could not be measured are sent as null (NaN in
+    JavaScript) or may be negative: they are dropped.
+
+    Args:
+        stats: The timings of a "rendered" message.
+
+    Returns:
+        dict: The valid timings.
+    """
+    if not isinstance(stats, dict):
+        return {}
+
+    timings = {}
+    for key, value in stats.items():
+        if isinstance(value, bool) or value is None:
+            continue
+        if isinstance(value, (int, float)):
+            if not math.isfinite(value) or value < 0:
+                continue
+        timings[key] = value
+
+    return timings
@@ -0,0 +1,64 @@
+import numpy as np
+
+from typing import Union
+
+
+class RollingDataset:
+    """
+    A dataset of a chart whose values (and the labels of the chart) are
+    kept in fixed-capacity ring buffers. Created by Chart.rolling_dataset.
+
+    Pushing a value is O(1) and the memory used by the chart stays constant,
+    whatever the number of values pushed. Only the new values are sent to
+    the browser, which drops the oldest ones to keep capacity of them.
+
+    Args:
+        chart (ipychart.Chart): The chart of the dataset.
+
+        index (int): The index of the dataset in the chart.
+    """
+
+    def __init__(self, chart, index: int):
+        self._chart = chart
+        self._index = index
+
+    @property
+    def capacity(self) -> int:
+        return self._values.capacity
+
+    @property
+    def _values(self):
+        return self._chart.data["datasets"][self._index]["data"]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __array__(self, dtype=None, copy: Union[bool, None] = None):
+        return np.asarray(self._values, dtype=dtype)
+
+    def push(self, value, label=None):
+        """
+        Add a value to the dataset, and send it to the browser.
+
+        Args:
+            value: The value to add.
+
+            label (optional): The label to add to the chart. Defaults to
+                None.
+        """
+        self._chart.append(
+            self._index, [value], labels=None if label is None else [label]
+        )
+
+    def extend(self, values, labels=None):
+        """
+        Add several values to the dataset, and send them to the browser in a
+        single message.
+
+        Args:
+            values: A list or an array of values.
+
+            labels (optional): The labels to add to the chart. Defaults to
+                None.
+        """
+        self._chart.append(self._index, values, labels=labels)
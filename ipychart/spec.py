@@ -0,0 +1,183 @@
+import os
+import importlib
+
+from typing import Callable, Iterable, Union
+from contextvars import ContextVar
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+
+from .chart import Chart
+
+# Whether plot functions build a ChartSpec instead of a Chart
+_BUILDING_SPEC = ContextVar("building_spec", default=False)
+
+MSG_JOB = (
+    "A job must be a (plot, kwargs) tuple, plot being a plot function of "
+    "ipychart or its name and kwargs the arguments of the plot function."
+)
+
+
+@dataclass
+class ChartSpec:
+    """
+    Picklable description of a chart, which can be built in a worker process
+    and turned into a Chart with Chart.from_spec.
+
+    Args:
+        data (dict): The data of the chart.
+
+        kind (str): The kind of the chart.
+
+        options (dict, optional): The options of the chart. Defaults to None.
+
+        colorscheme (str, optional): The colorscheme of the chart. Defaults
+            to None.
+
+        zoom (bool, optional): Whether the chart can be zoomed. Defaults to
+            True.
+
+        binary (bool, optional): Whether the data are sent as binary buffers.
+            Defaults to False.
+
+        palette (list, optional): The default colors of the datasets.
+            Defaults to None.
+
+        panels (dict, optional): The titles and the number of columns of
+            the panels of a grid of charts (see facetplot). Defaults to None.
+    """
+
+    data: dict
+    kind: str
+    options: Union[dict, None] = None
+    colorscheme: Union[str, None] = None
+    zoom: bool = True
+    binary: bool = False
+    palette: Union[list, None] = None
+    panels: Union[dict, None] = None
+
+
+def _chart(**kwargs) -> Union[Chart, ChartSpec]:
+    """
+    Create the chart (or grid of charts) returned by a plot function, or its
+    spec when the plot function is called by build_spec.
+
+    Args:
+        kwargs: The arguments of the chart.
+
+    Returns:
+        Union[Chart, ChartSpec]: The chart or its spec.
+    """
+    if _BUILDING_SPEC.get():
+        return ChartSpec(**kwargs)
+
+    return Chart.from_spec(ChartSpec(**kwargs))
+
+
+def _plot_function(plot: Union[str, Callable]) -> Callable:
+    """
+    Get a plot function of ipychart from its name.
+
+    Args:
+        plot (Union[str, Callable]): The plot function or its name.
+
+    Returns:
+        Callable: The plot function.
+    """
+    if callable(plot):
+        return plot
+
+    package = importlib.import_module(__package__)
+    if plot not in package._PLOTS:
+        raise ValueError(f"Unknown plot function : {plot}.")
+
+    return getattr(package, plot)
+
+
+def build_spec(plot: Union[str, Callable], *args, **kwargs) -> ChartSpec:
+    """
+    Run a plot function and return the spec of its chart instead of the
+    chart widget.
+
+    Args:
+        plot (Union[str, Callable]): The plot function (e.g.
+            ipychart.lineplot) or its name (e.g. "lineplot").
+
+        args, kwargs: The arguments of the plot function.
+
+    Returns:
+        ChartSpec: The spec of the chart.
+    """
+    plot = _plot_function(plot)
+    token = _BUILDING_SPEC.set(True)
+    try:
+        spec = plot(*args, **kwargs)
+    finally:
+        _BUILDING_SPEC.reset(token)
+
+    # Set by the profiler, which is only relevant for widgets
+    spec.__dict__.pop("_profile", None)
+
+    return spec
+
+
+def _build_job(job: tuple) -> ChartSpec:
+    """
+    Build the spec of a job of build_many.
+
+    Args:
+        job (tuple): A (plot, kwargs) tuple.
+
+    Returns:
+        ChartSpec: The spec of the chart.
+    """
+    plot, kwargs = job
+    return build_spec(plot, **kwargs)
+
+
+def build_many(
+    jobs: Iterable[tuple],
+    n_jobs: Union[int, None] = -1,
+    chunksize: int = 1,
+) -> list:
+    """
+    Run many plot functions in a pool of processes, and return the specs of
+    their charts. Specs are turned into charts with Chart.from_spec.
+
+    Examples:
+        ```python
+        jobs = [('barplot', dict(data=df, x=x, y='price')) for x in columns]
+        charts = [Chart.from_spec(s) for s in ipychart.build_many(jobs)]
+        ```
+
+    Args:
+        jobs (Iterable[tuple]): (plot, kwargs) tuples, plot being a plot
+            function of ipychart or its name and kwargs the arguments of the
+            plot function (data included).
+
+        n_jobs (int, optional): The number of processes. -1 uses all the
+            CPUs, None or 1 builds the specs in the current process.
+            Defaults to -1.
+
+        chunksize (int, optional): The number of jobs sent at once to each
+            process. Defaults to 1.
+
+    Returns:
+        list: The specs of the charts, in the order of the jobs.
+    """
+    jobs = list(jobs)
+
+    for job in jobs:
+        if not isinstance(job, tuple) or len(job) != 2:
+            raise ValueError(MSG_JOB)
+        if not isinstance(job[1], dict):
+            raise ValueError(MSG_JOB)
+        _plot_function(job[0])
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+
+    if n_jobs is None or n_jobs <= 1 or len(jobs) <= 1:
+        return [_build_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=min(n_jobs, len(jobs))) as pool:
+        return list(pool.map(_build_job, jobs, chunksize=chunksize))
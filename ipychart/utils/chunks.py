@@ -0,0 +1,244 @@
+import numpy as np
+import pandas as pd
+
+from typing import Iterator, Union
+from pandas.api.types import is_numeric_dtype
+
+from .frames import COUNT_COLUMN, _is_native_frame, _to_pandas
+
+# Aggregators which can be computed chunk by chunk
+CHUNK_AGGREGATORS = ["sum", "count", "mean", "min", "max", "var", "std"]
+
+MSG_CHUNK_AGG = (
+    "Aggregator {} can not be computed on chunks of data, it must be one "
+    f"of : {', '.join(CHUNK_AGGREGATORS)}."
+)
+
+MSG_CHUNK_TYPE = (
+    "Data must be a dataframe, or chunks of pandas or polars DataFrames or "
+    "of pyarrow Tables or RecordBatches."
+)
+
+MSG_CHUNK_KIND = (
+    "Chunks of data can only be used to draw counted or aggregated charts "
+    "(not scatter, bubble nor dist charts)."
+)
+
+
+def _is_chunked(data) -> bool:
+    """
+    Check if data are given as an iterable of dataframe chunks (e.g. the
+    reader returned by pd.read_csv with a chunksize, or the record batches
+    of a Parquet file).
+
+    Iterators (and generators), lists, tuples and numpy arrays are chunks,
+    their items being checked while they are read: lists of records or
+    arrays of values are rejected on their first item.
+
+    Args:
+        data: The data passed to a plot function.
+
+    Returns:
+        bool: True if data is an iterable of chunks.
+    """
+    if isinstance(data, (list, tuple, np.ndarray)):
+        return True
+
+    return isinstance(data, Iterator) and not _is_native_frame(data)
+
+
+def _is_frame(chunk) -> bool:
+    """
+    Check if a chunk is a dataframe.
+
+    Args:
+        chunk: A chunk of data.
+
+    Returns:
+        bool: True for pandas and polars DataFrames and pyarrow Tables and
+            RecordBatches.
+    """
+    return isinstance(chunk, pd.DataFrame) or _is_native_frame(chunk)
+
+
+def _chunk_frame(chunk, columns: list) -> pd.DataFrame:
+    """
+    Get the columns used by a chart from a chunk.
+
+    Args:
+        chunk: A pandas DataFrame, a polars DataFrame or a pyarrow Table or
+            RecordBatch.
+
+        columns (list): The used columns. None values are ignored.
+
+    Returns:
+        pd.DataFrame: The projected chunk.
+
+    Raises:
+        ValueError: If the chunk is not a dataframe.
+    """
+    if not _is_frame(chunk):
+        raise ValueError(MSG_CHUNK_TYPE)
+
+    columns = [c for c in dict.fromkeys(columns) if c is not None]
+
+    if _is_native_frame(chunk):
+        return _to_pandas(chunk, columns)
+
+    for column in columns:
+        assert column in chunk.columns, f"{column} not found in dataframe"
+
+    return chunk[columns]
+
+
+def _partial_aggregates(
+    chunk: pd.DataFrame, keys: list, y: Union[str, None]
+) -> pd.DataFrame:
+    """
+    Compute the mergeable aggregates of a chunk.
+
+    Args:
+        chunk (pd.DataFrame): The chunk.
+
+        keys (list): The grouping columns.
+
+        y (str, optional): The aggregated column. If None, rows are counted.
+
+    Returns:
+        pd.DataFrame: For each group, the number of rows ("n") if y is None,
+            or the number of non missing values ("n"), their sum, minimum,
+            maximum and sum of squared deviations from their mean ("m2").
+    """
+    grouped = chunk.groupby(keys, sort=False, observed=True)
+
+    if y is None:
+        return grouped.size().to_frame("n")
+
+    assert is_numeric_dtype(chunk[y]), "y must be a numeric column"
+
+    partial = grouped[y].agg(["count", "sum", "min", "max"])
+    partial.columns = ["n", "sum", "min", "max"]
+    partial["m2"] = (grouped[y].var(ddof=0) * partial["n"]).fillna(0.0)
+
+    return partial
+
+
+def _merge_aggregates(
+    accumulated: Union[pd.DataFrame, None], partial: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Merge the aggregates of a chunk into the aggregates of the previous
+    chunks.
+
+    Sums of squared deviations are merged with the pairwise formula of Chan
+    et al., which is numerically stable.
+
+    Args:
+        accumulated (pd.DataFrame, optional): Aggregates of the previous
+            chunks, or None for the first chunk.
+
+        partial (pd.DataFrame): Aggregates of the chunk.
+
+    Returns:
+        pd.DataFrame: The merged aggregates. Groups keep their order of
+            appearance.
+    """
+    if accumulated is None:
+        return partial
+
+    parts = pd.concat([accumulated, partial])
+    levels = list(range(parts.index.nlevels))
+    grouped = parts.groupby(level=levels, sort=False)
+
+    if "sum" not in parts.columns:
+        return grouped.sum()
+
+    merged = grouped.agg(
+        {"n": "sum", "sum": "sum", "min": "min", "max": "max"}
+    )
+
+    # Deviation of the mean of each part from the mean of its group
+    mean = merged["sum"] / merged["n"]
+    delta = parts["sum"] / parts["n"] - mean.reindex(parts.index).to_numpy()
+    spread = (parts["n"] * delta**2).where(parts["n"] > 0, 0.0)
+    merged["m2"] = (
+        (parts["m2"] + spread).groupby(level=levels, sort=False).sum()
+    )
+
+    return merged
+
+
+def _final_aggregate(aggregates: pd.DataFrame, agg: str) -> pd.Series:
+    """
+    Compute an aggregator from merged aggregates.
+
+    Args:
+        aggregates (pd.DataFrame): The merged aggregates.
+
+        agg (str): The aggregator.
+
+    Returns:
+        pd.Series: The aggregated values of each group.
+    """
+    n = aggregates["n"]
+
+    if agg in ("sum", "min", "max"):
+        return aggregates[agg]
+
+    if agg == "count":
+        return n
+
+    if agg == "mean":
+        return aggregates["sum"] / n.where(n > 0)
+
+    var = aggregates["m2"] / (n - 1).where(n > 1)
+
+    return var if agg == "var" else np.sqrt(var)
+
+
+def _chunked_group(
+    chunks,
+    keys: list,
+    y: Union[str, None] = None,
+    agg: Union[str, None] = None,
+) -> pd.DataFrame:
+    """
+    Aggregate (or count) y for each group of keys, one chunk at a time.
+
+    Only the aggregates of each group are kept in memory, so that data
+    larger than the memory can be drawn.
+
+    Args:
+        chunks: An iterable of dataframe chunks.
+
+        keys (list): The grouping columns.
+
+        y (str, optional): The column to aggregate. If None, rows are
+            counted in a COUNT_COLUMN column. Defaults to None.
+
+        agg (str, optional): The aggregator used to gather data, one of
+            CHUNK_AGGREGATORS. Defaults to None.
+
+    Returns:
+        pd.DataFrame: One row per group, with the keys and the aggregated
+            column (named y, or COUNT_COLUMN).
+    """
+    if y is not None and agg not in CHUNK_AGGREGATORS:
+        raise ValueError(MSG_CHUNK_AGG.format(agg))
+
+    aggregates = None
+
+    for chunk in chunks:
+        chunk = _chunk_frame(chunk, keys + [y])
+        aggregates = _merge_aggregates(
+            aggregates, _partial_aggregates(chunk, keys, y)
+        )
+
+    assert aggregates is not None, "No chunk of data to draw"
+
+    if y is None:
+        values = aggregates["n"].rename(COUNT_COLUMN)
+    else:
+        values = _final_aggregate(aggregates, agg).rename(y)
+
+    return values.reset_index()
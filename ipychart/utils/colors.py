@@ -0,0 +1,144 @@
+import re
+import numpy as np
+
+from functools import lru_cache
+from typing import Tuple, Union
+
+from ..values import DEFAULT_COLORS
+
+# Number of colors of the default palette, colors are cycled beyond
+PALETTE_SIZE = 256
+
+_RGB_PATTERN = re.compile(
+    r"^rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*[\d.]+\s*)?\)$"
+)
+
+
+def _parse_color(color: Union[str, tuple, list]) -> Tuple[int, int, int]:
+    """
+    Convert a color to its red, green and blue components.
+
+    Args:
+        color ([str, tuple, list]): A (r, g, b) tuple, a "#rgb" or "#rrggbb"
+            hexadecimal string, or a "rgb(r, g, b)" or "rgba(r, g, b, a)"
+            string.
+
+    Raises:
+        ValueError: If the color can not be parsed.
+
+    Returns:
+        Tuple[int, int, int]: The red, green and blue components.
+    """
+    if isinstance(color, str):
+        color = color.strip()
+        match = _RGB_PATTERN.match(color)
+        if match:
+            rgb = tuple(int(c) for c in match.groups())
+        elif re.fullmatch(r"#[0-9a-fA-F]{3}", color):
+            rgb = tuple(int(c * 2, 16) for c in color[1:])
+        elif re.fullmatch(r"#[0-9a-fA-F]{6}", color):
+            rgb = tuple(int(color[i : i + 2], 16) for i in (1, 3, 5))
+        else:
+            raise ValueError(f"Invalid color: {color}")
+    elif isinstance(color, (tuple, list)) and len(color) == 3:
+        rgb = tuple(int(c) for c in color)
+    else:
+        raise ValueError(f"Invalid color: {color}")
+
+    if not all(0 <= c <= 255 for c in rgb):
+        raise ValueError(f"Invalid color: {color}")
+
+    return rgb
+
+
+def _generate_colors(n: int, seed: int = 0) -> list:
+    """
+    Generate light random colors, always the same for a given seed.
+
+    One of the three components is drawn in [200, 255] so that colors are
+    not too dark once made transparent.
+
+    Args:
+        n (int): Number of colors to generate.
+
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        list: The (r, g, b) components of the colors.
+    """
+    rng = np.random.default_rng(seed)
+    components = np.concatenate(
+        [rng.integers(0, 256, size=(n, 2)), rng.integers(200, 256, (n, 1))],
+        axis=1,
+    )
+
+    return rng.permuted(components, axis=1).tolist()
+
+
+def _palette_key(palette: Union[list, tuple, None]) -> Union[tuple, None]:
+    """
+    Convert a palette to a hashable key of the palette tables cache.
+
+    Args:
+        palette ([list, tuple], optional): The colors of the palette.
+
+    Returns:
+        tuple: The palette as a tuple, or None for the default palette.
+    """
+    if palette is None:
+        return None
+
+    return tuple(tuple(c) if isinstance(c, list) else c for c in palette)
+
+
+@lru_cache(maxsize=32)
+def _palette_table(
+    palette: Union[tuple, None] = None,
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Build the background and border colors of a palette.
+
+    Tables are built once per palette, so that styling a chart never formats
+    color strings. The default palette holds the ten ipychart colors
+    followed by deterministic random colors.
+
+    Args:
+        palette (tuple, optional): The colors of the palette (see
+            _parse_color). Defaults to None (default palette).
+
+    Returns:
+        Tuple[Tuple[str, ...], Tuple[str, ...]]: The background colors
+            (transparent) and the border colors (opaque).
+    """
+    if palette is None:
+        colors = DEFAULT_COLORS + _generate_colors(
+            PALETTE_SIZE - len(DEFAULT_COLORS)
+        )
+    else:
+        colors = [_parse_color(c) for c in palette]
+
+    backgrounds = tuple("rgba({}, {}, {}, 0.2)".format(*c) for c in colors)
+    borders = tuple("rgba({}, {}, {}, 1)".format(*c) for c in colors)
+
+    return backgrounds, borders
+
+
+def _palette_colors(table: tuple, n: int, start: int = 0) -> list:
+    """
+    Take n consecutive colors of a palette table, cycling if needed.
+
+    Args:
+        table (tuple): The colors of the palette.
+
+        n (int): Number of colors to take.
+
+        start (int, optional): Position of the first color. Defaults to 0.
+
+    Returns:
+        list: The colors.
+    """
+    size = len(table)
+    if start + n <= size:
+        return list(table[start : start + n])
+
+    return [table[(start + i) % size] for i in range(n)]
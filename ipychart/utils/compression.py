@@ -0,0 +1,207 @@
+import zlib
+import numpy as np
+
+from typing import Union
+
+from .serialization import _is_point_columns, _serialize_values
+
+# zlib compression level of the exported arrays
+COMPRESSION_LEVEL = 6
+
+# Largest integer (delta) stored in the int32 buffers of delta encoding
+_INT32_MAX = 2**31 - 1
+
+# Floats are integers exactly represented up to this value
+_FLOAT_INT_MAX = 2**53
+
+MSG_PRECISION = (
+    "Export precision must be None, 'float32' or a number of decimals "
+    "(positive integer)."
+)
+
+
+def _check_precision(precision):
+    """
+    Check the precision argument of the compressed export.
+
+    Args:
+        precision: None, "float32" or a number of decimals.
+    """
+    if precision is None or precision == "float32":
+        return
+
+    if isinstance(precision, bool) or not isinstance(precision, int):
+        raise ValueError(MSG_PRECISION)
+
+    if precision < 0:
+        raise ValueError(MSG_PRECISION)
+
+
+def _shuffle(arr: np.ndarray) -> bytes:
+    """
+    Group the bytes of an array by significance.
+
+    The most significant bytes of neighbouring values are often equal, so
+    storing them together makes the buffer much more compressible.
+
+    Args:
+        arr (np.ndarray): A contiguous numeric array.
+
+    Returns:
+        bytes: The shuffled bytes of the array.
+    """
+    raw = np.frombuffer(arr.tobytes(), dtype="uint8")
+    return raw.reshape(-1, arr.dtype.itemsize).T.tobytes()
+
+
+def _integer_steps(arr: np.ndarray, precision) -> Union[tuple, None]:
+    """
+    Quantize an array to integers, if it can be done with the requested
+    precision.
+
+    Args:
+        arr (np.ndarray): A numeric array.
+
+        precision: None, "float32" or a number of decimals.
+
+    Returns:
+        tuple: The integers and the number of decimals they represent, or
+            None if the array can not be quantized (missing values, too
+            large values, ...).
+    """
+    if arr.dtype.kind in "iu":
+        return arr.astype("int64"), 0
+
+    if not np.isfinite(arr).all():
+        return None
+
+    # A precision of 0 decimals rounds values to integers, no precision
+    # keeps them as they are
+    decimals = precision if isinstance(precision, int) else None
+    scaled = arr * 10**decimals if decimals else arr
+    steps = np.round(scaled)
+
+    if np.abs(steps).max() >= _FLOAT_INT_MAX:
+        return None
+
+    # Without a requested precision, only exact integers are quantized
+    if decimals is None and not np.array_equal(steps, scaled):
+        return None
+
+    return steps.astype("int64"), decimals or 0
+
+
+def _compress_array(arr: np.ndarray, precision=None) -> dict:
+    """
+    Compress a numeric array for the HTML export.
+
+    Arrays of integers (or of floats rounded to the requested number of
+    decimals) are delta encoded as int32. Other arrays are stored as float64
+    (or float32 if requested), rounded to the requested number of decimals
+    if any. Bytes are shuffled and deflated in both
+    cases, and decoded in the browser.
+
+    Args:
+        arr (np.ndarray): A contiguous numeric array.
+
+        precision (optional): None to keep values as they are, "float32" to
+            store them as single precision floats, or the number of decimals
+            to keep. Defaults to None.
+
+    Returns:
+        dict: The binary representation of the compressed array.
+    """
+    encoding = {
+        "compression": "deflate",
+        "shuffle": True,
+        "delta": False,
+        "base": 0,
+        "decimals": 0,
+    }
+
+    quantized = _integer_steps(arr, precision) if len(arr) else None
+
+    if quantized is not None:
+        steps, decimals = quantized
+        deltas = np.diff(steps, prepend=steps[0])
+        if np.abs(deltas).max() <= _INT32_MAX:
+            arr = deltas.astype("int32")
+            encoding.update(delta=True, base=int(steps[0]), decimals=decimals)
+
+    if not encoding["delta"]:
+        # Values which can not be quantized (missing or too large values)
+        # are still rounded to the requested number of decimals
+        if isinstance(precision, int) and arr.dtype.kind == "f":
+            arr = np.round(arr, precision)
+        dtype = "float32" if precision == "float32" else "float64"
+        arr = arr.astype(dtype)
+
+    buffer = zlib.compress(_shuffle(arr), COMPRESSION_LEVEL)
+
+    return {
+        "dtype": arr.dtype.name,
+        "shape": list(arr.shape),
+        "buffer": memoryview(buffer),
+        "encoding": encoding,
+    }
+
+
+def _compress_values(values, precision=None):
+    """
+    Serialize a column of values, compressing it if it is numeric.
+
+    Args:
+        values: A list, a numpy array or a pandas object.
+
+        precision (optional): See _compress_array. Defaults to None.
+
+    Returns:
+        The serialized values.
+    """
+    serialized = _serialize_values(values, binary=True)
+
+    if isinstance(serialized, dict) and "buffer" in serialized:
+        return _compress_array(np.asarray(serialized["buffer"]), precision)
+
+    return serialized
+
+
+def _compress_data(data: dict, precision=None) -> dict:
+    """
+    Serialize the data of a chart for a compressed HTML export.
+
+    Numeric labels and dataset values are compressed, other values are
+    serialized as JSON lists.
+
+    Args:
+        data (dict): The data dictionary of the chart.
+
+        precision (optional): See _compress_array. Defaults to None.
+
+    Returns:
+        dict: The data dictionary to embed in the HTML export.
+    """
+    if not data:
+        return data
+
+    compressed = dict(data)
+
+    if "labels" in data:
+        compressed["labels"] = _compress_values(data["labels"], precision)
+
+    if isinstance(data.get("datasets"), list):
+        compressed["datasets"] = []
+        for dataset in data["datasets"]:
+            if isinstance(dataset, dict) and "data" in dataset:
+                dataset = dict(dataset)
+                values = dataset["data"]
+                if _is_point_columns(values):
+                    dataset["data"] = {
+                        k: _compress_values(v, precision)
+                        for k, v in values.items()
+                    }
+                else:
+                    dataset["data"] = _compress_values(values, precision)
+            compressed["datasets"].append(dataset)
+
+    return compressed
@@ -0,0 +1,161 @@
+import numpy as np
+
+from typing import Union
+
+from .ring import _RingBuffer
+from .serialization import _is_array_like, _is_point_columns, POINT_COLUMNS
+
+
+def _as_values(values) -> Union[list, np.ndarray, dict]:
+    """
+    Normalize values appended to a dataset or to the labels of a chart.
+
+    Args:
+        values: A single value, a single point ({x, y[, r]}), a list, a numpy
+            array, a pandas object or parallel point columns.
+
+    Returns:
+        [list, np.ndarray, dict]: The values as a list, a numpy array or a
+            dictionary of point columns.
+    """
+    if _is_point_columns(values):
+        return {k: _as_values(v) for k, v in values.items()}
+    if isinstance(values, dict):
+        return [values]
+    if isinstance(values, (list, tuple)):
+        return list(values)
+    if _is_array_like(values):
+        return np.asarray(values)
+
+    return [values]
+
+
+def _points_to_columns(points: list, keys: tuple) -> dict:
+    """
+    Convert a list of points ({x, y[, r]}) to parallel point columns.
+
+    Args:
+        points (list): The points to convert.
+
+        keys (tuple): The keys of the columns to create.
+
+    Returns:
+        dict: The parallel point columns.
+    """
+    return {k: [p[k] for p in points] for k in keys}
+
+
+def _columns_to_points(columns: dict) -> list:
+    """
+    Convert parallel point columns to a list of points ({x, y[, r]}).
+
+    Args:
+        columns (dict): The point columns to convert.
+
+    Returns:
+        list: The points.
+    """
+    keys = [k for k in POINT_COLUMNS if k in columns]
+    values = [
+        v.tolist() if isinstance(v, np.ndarray) else list(v)
+        for v in (columns[k] for k in keys)
+    ]
+    return [dict(zip(keys, point)) for point in zip(*values)]
+
+
+def _concat_values(target, values, max_len: Union[int, None] = None):
+    """
+    Append values at the end of a list or a numpy array.
+
+    Lists are extended in place. Numpy arrays are concatenated, keeping the
+    dtype of the target when possible.
+
+    Args:
+        target ([list, np.ndarray]): The values to extend.
+
+        values ([list, np.ndarray]): The values to append.
+
+        max_len (int, optional): If set, the oldest values are dropped so
+            that the result holds at most max_len values. Defaults to None.
+
+    Returns:
+        [list, np.ndarray]: The extended values.
+    """
+    # Ring buffers are written in place and keep their capacity
+    if isinstance(target, _RingBuffer):
+        target.extend(values)
+        return target
+
+    if isinstance(target, list):
+        target.extend(
+            values.tolist() if isinstance(values, np.ndarray) else values
+        )
+        if max_len is not None and len(target) > max_len:
+            del target[: len(target) - max_len]
+        return target
+
+    target = np.concatenate([np.asarray(target), np.asarray(values)])
+    if max_len is not None and len(target) > max_len:
+        target = target[len(target) - max_len :]
+
+    return target
+
+
+def _append_dataset_values(
+    dataset: dict, values, max_len: Union[int, None] = None
+):
+    """
+    Append values to the "data" entry of a dataset.
+
+    Values are converted to the format already used by the dataset (list of
+    values, list of points, numpy array or parallel point columns).
+
+    Args:
+        dataset (dict): The dataset to update.
+
+        values: The values to append (see _as_values).
+
+        max_len (int, optional): Maximum number of values to keep in the
+            dataset. Defaults to None.
+    """
+    current = dataset["data"]
+    values = _as_values(values)
+
+    if _is_point_columns(current):
+        if not _is_point_columns(values):
+            values = _points_to_columns(values, tuple(current.keys()))
+        for key in current:
+            current[key] = _concat_values(current[key], values[key], max_len)
+    else:
+        if _is_point_columns(values):
+            values = _columns_to_points(values)
+        dataset["data"] = _concat_values(current, values, max_len)
+
+
+def _find_dataset_index(data: dict, index_or_label: Union[int, str]) -> int:
+    """
+    Find the position of a dataset from its index or from its label.
+
+    Args:
+        data (dict): The data dictionary of the chart.
+
+        index_or_label ([int, str]): Index or label of the dataset.
+
+    Raises:
+        IndexError: If the dataset does not exist.
+
+    Returns:
+        int: The position of the dataset in data["datasets"].
+    """
+    datasets = data["datasets"]
+
+    if isinstance(index_or_label, str):
+        for i, dataset in enumerate(datasets):
+            if dataset.get("label") == index_or_label:
+                return i
+        raise IndexError(f"No dataset with label {index_or_label}")
+
+    if not -len(datasets) <= index_or_label < len(datasets):
+        raise IndexError(f"No dataset at index {index_or_label}")
+
+    return index_or_label % len(datasets)
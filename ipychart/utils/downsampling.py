@@ -0,0 +1,325 @@
+import numpy as np
+
+from ..profiler import _timed
+from .serialization import _is_point_columns, _to_numeric_array
+
+DOWNSAMPLING_METHODS = ["lttb", "minmax", "every_nth"]
+
+MSG_DOWNSAMPLING = (
+    "Downsampling method must be one of : lttb, minmax, every_nth. See "
+    "https://nicohlr.github.io/ipychart/user_guide/advanced.html "
+    "for more details"
+)
+
+MSG_MAX_POINTS = "max_points must be None or a positive integer."
+
+
+def _check_max_points(max_points):
+    """
+    Check the maximum number of points of a downsampling.
+
+    Args:
+        max_points: The maximum number of points to keep.
+
+    Raises:
+        ValueError: If max_points is not a positive integer.
+    """
+    if isinstance(max_points, bool) or not isinstance(
+        max_points, (int, np.integer)
+    ):
+        raise ValueError(MSG_MAX_POINTS)
+
+    if max_points < 1:
+        raise ValueError(MSG_MAX_POINTS)
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm.
+
+    Points are split into n_out - 2 buckets of equal size. In each bucket,
+    the point forming the largest triangle with the point selected in the
+    previous bucket and the average point of the next bucket is kept. The
+    first and last points are always kept.
+
+    Args:
+        x (np.ndarray): Sorted x coordinates of the points.
+
+        y (np.ndarray): y coordinates of the points.
+
+        n_out (int): Number of points to select.
+
+    Returns:
+        np.ndarray: Sorted indices of the selected points.
+    """
+    n = len(x)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1][:n_out], dtype=np.int64)
+
+    # Bucket i holds the points edges[i]:edges[i + 1]
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    avg_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+
+    # The average point of the bucket after the last one is the last point
+    avg_x = np.append(avg_x[1:], x[-1])
+    avg_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - avg_x[i]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y[i] - y[a])
+        )
+        a = lo + np.argmax(area)
+        selected[i + 1] = a
+
+    return selected
+
+
+def _minmax_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select the minimum and maximum points of buckets of equal size.
+
+    This preserves the extrema of the series (e.g. peaks in a signal), at
+    the cost of a less smooth shape than LTTB.
+
+    Args:
+        x (np.ndarray): Sorted x coordinates of the points.
+
+        y (np.ndarray): y coordinates of the points.
+
+        n_out (int): Number of points to select.
+
+    Returns:
+        np.ndarray: Sorted indices of the selected points.
+    """
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+
+    bin_size = int(np.ceil(n / max((n_out - 2) // 2, 1)))
+    n_bins = int(np.ceil(n / bin_size))
+
+    padded = np.full(n_bins * bin_size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(n_bins, bin_size)
+
+    offsets = np.arange(n_bins) * bin_size
+    selected = np.concatenate(
+        [
+            [0, n - 1],
+            offsets + np.nanargmin(padded, axis=1),
+            offsets + np.nanargmax(padded, axis=1),
+        ]
+    )
+
+    return np.unique(selected)
+
+
+def _every_nth_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select one point every n points.
+
+    Args:
+        x (np.ndarray): Sorted x coordinates of the points.
+
+        y (np.ndarray): y coordinates of the points.
+
+        n_out (int): Number of points to select.
+
+    Returns:
+        np.ndarray: Sorted indices of the selected points.
+    """
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+
+    return np.arange(0, n, int(np.ceil(n / max(n_out, 1))))
+
+
+def _downsample_indices(
+    x: np.ndarray, y: np.ndarray, max_points: int, method: str = "lttb"
+) -> np.ndarray:
+    """
+    Select at most max_points visually representative points of a series.
+
+    Points with a missing (or infinite) coordinate are never selected.
+
+    Args:
+        x (np.ndarray): Sorted x coordinates of the points.
+
+        y (np.ndarray): y coordinates of the points.
+
+        max_points (int): Maximum number of points to select.
+
+        method (str, optional): Downsampling algorithm, one of "lttb",
+            "minmax" or "every_nth". Defaults to "lttb".
+
+    Raises:
+        ValueError: If the method is unknown.
+
+    Returns:
+        np.ndarray: Sorted indices of the selected points.
+    """
+    if method not in DOWNSAMPLING_METHODS:
+        raise ValueError(MSG_DOWNSAMPLING)
+
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+
+    finite = np.isfinite(x) & np.isfinite(y)
+    if finite.all():
+        positions = None
+    else:
+        positions = np.flatnonzero(finite)
+        x, y = x[finite], y[finite]
+
+    if len(y) <= max_points:
+        selected = np.arange(len(y))
+    elif method == "lttb":
+        selected = _lttb_indices(x, y, max_points)
+    elif method == "minmax":
+        selected = _minmax_indices(x, y, max_points)
+    else:
+        selected = _every_nth_indices(x, y, max_points)
+
+    return selected if positions is None else positions[selected]
+
+
+def _downsample_points(
+    x, y, max_points: int, method: str = "lttb"
+) -> np.ndarray:
+    """
+    Select at most max_points representative points of a cloud of points.
+
+    Unlike _downsample_indices, points do not need to be sorted.
+
+    Args:
+        x: x coordinates of the points.
+
+        y: y coordinates of the points.
+
+        max_points (int): Maximum number of points to select.
+
+        method (str, optional): Downsampling algorithm. Defaults to "lttb".
+
+    Returns:
+        np.ndarray: Indices of the selected points, sorted by x.
+    """
+    _check_max_points(max_points)
+
+    y = _to_numeric_array(y)
+    x = _to_numeric_array(x)
+    if y is None:
+        # Non numeric values can not be ranked, all points are kept
+        return np.arange(len(x) if x is not None else 0)
+    if x is None:
+        x = np.arange(len(y), dtype="float64")
+
+    order = np.argsort(x, kind="stable")
+    y = y[order]
+
+    return order[_downsample_indices(x[order], y, max_points, method)]
+
+
+def _take(values, indices: np.ndarray):
+    """
+    Select values at the given positions, keeping the type of values.
+
+    Args:
+        values ([list, np.ndarray]): The values to select from.
+
+        indices (np.ndarray): Positions of the values to select.
+
+    Returns:
+        [list, np.ndarray]: The selected values.
+    """
+    if isinstance(values, list):
+        return [values[i] for i in indices]
+
+    return np.asarray(values)[indices]
+
+
+@_timed("downsampling")
+def _downsample_data(
+    data: dict, max_points: int, method: str = "lttb"
+) -> dict:
+    """
+    Downsample the datasets of a chart data dictionary.
+
+    Datasets made of points ({x, y} dictionaries or parallel point columns)
+    are downsampled independently. Datasets made of values sharing the
+    labels of the chart are downsampled together: max_points is split
+    between them and the union of the points selected in each dataset is
+    kept, so that all datasets stay aligned on the labels.
+
+    Args:
+        data (dict): The data dictionary of a chart.
+
+        max_points (int): Maximum number of points to keep per dataset (or
+            in total, for datasets sharing the labels of the chart).
+
+        method (str, optional): Downsampling algorithm, one of "lttb",
+            "minmax" or "every_nth". Defaults to "lttb".
+
+    Returns:
+        dict: The downsampled data dictionary.
+    """
+    if method not in DOWNSAMPLING_METHODS:
+        raise ValueError(MSG_DOWNSAMPLING)
+    _check_max_points(max_points)
+
+    data = dict(data)
+    datasets = [dict(ds) for ds in data["datasets"]]
+    data["datasets"] = datasets
+
+    labels = data.get("labels")
+
+    aligned = []
+    for ds in datasets:
+        values = ds["data"]
+
+        if _is_point_columns(values):
+            idx = _downsample_points(
+                values["x"], values["y"], max_points, method
+            )
+            ds["data"] = {k: _take(v, idx) for k, v in values.items()}
+
+        elif len(values) and isinstance(values[0], dict):
+            x = [p.get("x") for p in values]
+            y = [p.get("y") for p in values]
+            idx = _downsample_points(x, y, max_points, method)
+            ds["data"] = _take(values, idx)
+
+        else:
+            aligned.append(ds)
+
+    if any(len(ds["data"]) > max_points for ds in aligned):
+        # The union of the points selected in the datasets is kept, so
+        # max_points is shared between them
+        budget = max(max_points // len(aligned), 1)
+        kept = []
+        for ds in aligned:
+            y = _to_numeric_array(ds["data"])
+            if y is None:
+                kept.append(np.arange(len(ds["data"])))
+            else:
+                # Labels are evenly spaced on the (category) x axis
+                x = np.arange(len(y), dtype="float64")
+                kept.append(_downsample_indices(x, y, budget, method))
+
+        idx = np.unique(np.concatenate(kept))
+        for ds in aligned:
+            ds["data"] = _take(ds["data"], idx[idx < len(ds["data"])])
+        if labels is not None:
+            data["labels"] = _take(labels, idx[idx < len(labels)])
+
+    return data
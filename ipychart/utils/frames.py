@@ -0,0 +1,269 @@
+import pandas as pd
+
+from typing import Union
+
+# Name of the column holding the row counts computed by _native_group
+COUNT_COLUMN = "__ipychart_count__"
+
+# Aggregators supported by _native_group, with their polars method and their
+# pyarrow function (pyarrow only has an approximate median, the exact one is
+# computed by pandas)
+POLARS_AGGREGATORS = {
+    "mean": "mean",
+    "median": "median",
+    "sum": "sum",
+    "min": "min",
+    "max": "max",
+    "count": "count",
+    "std": "std",
+    "var": "var",
+    "first": "first",
+    "last": "last",
+    "nunique": "n_unique",
+}
+
+ARROW_AGGREGATORS = {
+    "mean": "mean",
+    "median": None,
+    "sum": "sum",
+    "min": "min",
+    "max": "max",
+    "count": "count",
+    "std": "stddev",
+    "var": "variance",
+    "first": "first",
+    "last": "last",
+    "nunique": "count_distinct",
+}
+
+MSG_NATIVE_AGG = (
+    "Aggregator {} is not supported for {} data, it must be one of : {}."
+)
+
+
+def _frame_engine(data) -> Union[str, None]:
+    """
+    Get the engine of a dataframe.
+
+    Polars and pyarrow are optional: their objects are detected by module
+    name, without importing them.
+
+    Args:
+        data: A pandas DataFrame, a polars DataFrame or LazyFrame, or a
+            pyarrow Table.
+
+    Returns:
+        str: "polars" or "arrow", or None for pandas (and other) objects.
+    """
+    module = type(data).__module__.split(".")[0]
+
+    if module == "polars":
+        return "polars"
+
+    if module == "pyarrow":
+        return "arrow"
+
+    return None
+
+
+def _is_native_frame(data) -> bool:
+    """
+    Check if a dataframe is a polars or a pyarrow one, aggregated in its own
+    engine instead of pandas.
+
+    Args:
+        data: A dataframe.
+
+    Returns:
+        bool: True for polars DataFrames and LazyFrames and pyarrow Tables.
+    """
+    return _frame_engine(data) is not None
+
+
+def _polars_schema(data) -> dict:
+    """
+    Get the schema of a polars DataFrame or LazyFrame, without collecting
+    it.
+
+    Args:
+        data: A polars DataFrame or LazyFrame.
+
+    Returns:
+        dict: The dtype of each column.
+    """
+    if hasattr(data, "collect_schema"):
+        return dict(data.collect_schema())
+
+    return dict(data.schema)
+
+
+def _frame_columns(data) -> list:
+    """
+    Get the columns of a polars or pyarrow dataframe.
+
+    Args:
+        data: A polars DataFrame or LazyFrame, or a pyarrow Table.
+
+    Returns:
+        list: The names of the columns.
+    """
+    if _frame_engine(data) == "polars":
+        return list(_polars_schema(data))
+
+    return list(data.column_names)
+
+
+def _is_numeric_column(data, column: str) -> bool:
+    """
+    Check if a column of a polars or pyarrow dataframe is numeric.
+
+    Args:
+        data: A polars DataFrame or LazyFrame, or a pyarrow Table.
+
+        column (str): The column to check.
+
+    Returns:
+        bool: True if the column is numeric (booleans excluded).
+    """
+    if _frame_engine(data) == "polars":
+        return _polars_schema(data)[column].is_numeric()
+
+    import pyarrow as pa
+
+    dtype = data.schema.field(column).type
+    return (
+        pa.types.is_integer(dtype)
+        or pa.types.is_floating(dtype)
+        or pa.types.is_decimal(dtype)
+    )
+
+
+def _check_columns(data, columns: list):
+    """
+    Check that columns exist in a polars or pyarrow dataframe.
+
+    Args:
+        data: A polars DataFrame or LazyFrame, or a pyarrow Table.
+
+        columns (list): The columns to check. None values are ignored.
+    """
+    names = _frame_columns(data)
+
+    for column in columns:
+        if column is not None:
+            assert column in names, f"{column} not found in dataframe"
+
+
+def _to_pandas(data, columns: list) -> pd.DataFrame:
+    """
+    Convert only some columns of a polars or pyarrow dataframe to pandas.
+
+    Lazy frames are collected after the projection, so that other columns
+    are never read. Numeric columns without missing values are converted
+    without copy when the engine allows it.
+
+    Args:
+        data: A polars DataFrame or LazyFrame, or a pyarrow Table.
+
+        columns (list): The columns to convert. None values and duplicates
+            are ignored.
+
+    Returns:
+        pd.DataFrame: The projected dataframe.
+    """
+    columns = list(dict.fromkeys(c for c in columns if c is not None))
+    _check_columns(data, columns)
+
+    if _frame_engine(data) == "polars":
+        frame = data.lazy().select(columns).collect()
+        return pd.DataFrame({c: frame[c].to_numpy() for c in columns})
+
+    return data.select(columns).to_pandas()
+
+
+def _native_group(
+    data,
+    keys: list,
+    y: Union[str, None] = None,
+    agg: Union[str, None] = None,
+) -> pd.DataFrame:
+    """
+    Aggregate (or count) y for each group of keys in the engine of the
+    dataframe. Only the aggregated table is converted to pandas.
+
+    Rows with missing keys are dropped, like pandas groupby does. Groups
+    keep the order of appearance of their keys.
+
+    Args:
+        data: A polars DataFrame or LazyFrame, or a pyarrow Table.
+
+        keys (list): The grouping columns.
+
+        y (str, optional): The column to aggregate. If None, rows are
+            counted in a COUNT_COLUMN column. Defaults to None.
+
+        agg (str, optional): The aggregator used to gather data (ex:
+            'median' or 'mean'). Defaults to None.
+
+    Returns:
+        pd.DataFrame: One row per group, with the keys and the aggregated
+            column (named y, or COUNT_COLUMN).
+    """
+    _check_columns(data, keys + [y])
+    name = COUNT_COLUMN if y is None else y
+
+    if _frame_engine(data) == "polars":
+        import polars as pl
+
+        if y is None:
+            expr = pl.len()
+        elif agg in POLARS_AGGREGATORS:
+            expr = getattr(pl.col(y), POLARS_AGGREGATORS[agg])()
+        else:
+            raise ValueError(
+                MSG_NATIVE_AGG.format(agg, "polars", list(POLARS_AGGREGATORS))
+            )
+
+        grouped = (
+            data.lazy()
+            .select(list(dict.fromkeys(keys + [y or keys[0]])))
+            .drop_nulls(keys)
+            .group_by(keys, maintain_order=True)
+            .agg(expr.alias(name))
+            .collect()
+        )
+        return pd.DataFrame({c: grouped[c].to_numpy() for c in keys + [name]})
+
+    import pyarrow.compute as pc
+
+    table = data.select(list(dict.fromkeys(keys + [y or keys[0]])))
+    for key in keys:
+        table = table.filter(pc.is_valid(table[key]))
+
+    if y is not None and agg == "median":
+        # Only the projected columns are converted
+        frame = table.to_pandas()
+        grouped = frame.groupby(keys, sort=False, observed=True)[y].median()
+        return grouped.reset_index()[keys + [name]]
+
+    if y is None:
+        aggregation = (keys[0], "count", pc.CountOptions(mode="all"))
+        result = f"{keys[0]}_count"
+    elif agg in ARROW_AGGREGATORS:
+        func = ARROW_AGGREGATORS[agg]
+        aggregation = (y, func)
+        if agg in ("std", "var"):
+            # Sample variance, as pandas
+            aggregation = (y, func, pc.VarianceOptions(ddof=1))
+        result = f"{y}_{func}"
+    else:
+        raise ValueError(
+            MSG_NATIVE_AGG.format(agg, "pyarrow", list(ARROW_AGGREGATORS))
+        )
+
+    # Without threads, groups keep the order of appearance of their keys
+    grouped = table.group_by(keys, use_threads=False).aggregate([aggregation])
+    grouped = grouped.rename_columns(
+        [name if c == result else c for c in grouped.column_names]
+    )
+    return grouped.select(keys + [name]).to_pandas()
@@ -0,0 +1,677 @@
+import numpy as np
+
+from typing import Tuple, Union
+
+from ..cache import _memoized
+from ..profiler import _timed
+
+KDE_METHODS = ["auto", "fft", "sklearn"]
+
+# Minimum bandwidth (in grid steps) of a gaussian kernel for the binned FFT
+# estimate to match the exact one (within 0.1% of the peak density) when the
+# method is "auto"
+FFT_MIN_STEPS = 5
+
+KERNELS = [
+    "gaussian",
+    "tophat",
+    "epanechnikov",
+    "exponential",
+    "linear",
+    "cosine",
+]
+
+BANDWIDTH_METHODS = ["auto", "scott", "silverman", "isj"]
+
+MSG_KDE_METHOD = "KDE method must be one of : auto, fft, sklearn"
+
+MSG_BANDWIDTH = (
+    "bandwidth must be a positive number or one of : auto, scott, "
+    "silverman, isj"
+)
+
+MSG_KERNEL = (
+    "Kernel must be one of : gaussian, tophat, epanechnikov, exponential, "
+    "linear, cosine"
+)
+
+# Distance (in bandwidths) beyond which a kernel is considered null
+_KERNEL_SUPPORT = {
+    "gaussian": 6.1,
+    "tophat": 1.0,
+    "epanechnikov": 1.0,
+    "exponential": 18.5,
+    "linear": 1.0,
+    "cosine": 1.0,
+}
+
+# Canonical bandwidth of each kernel, (R(K) / mu_2(K) ** 2) ** (1 / 5), used
+# to convert a bandwidth found for a gaussian kernel to an equivalent one
+_CANONICAL_BANDWIDTH = {
+    "gaussian": 0.7764,
+    "tophat": 1.3510,
+    "epanechnikov": 1.7188,
+    "exponential": 0.5743,
+    "linear": 1.8882,
+    "cosine": 1.7666,
+}
+
+
+def _kernel(d: np.ndarray, bandwidth: float, kernel: str) -> np.ndarray:
+    """
+    Evaluate a normalized 1D kernel at the given distances.
+
+    Kernels are parametrized as in scikit-learn's KernelDensity, so that both
+    KDE methods give the same density for the same bandwidth.
+
+    Args:
+        d (np.ndarray): Distances at which the kernel is evaluated.
+
+        bandwidth (float): The bandwidth of the kernel.
+
+        kernel (str): The name of the kernel.
+
+    Returns:
+        np.ndarray: The values of the kernel.
+    """
+    u = np.abs(d) / bandwidth
+    inside = u < 1
+
+    if kernel == "gaussian":
+        values = np.exp(-0.5 * u**2) / np.sqrt(2 * np.pi)
+    elif kernel == "tophat":
+        values = np.where(inside, 0.5, 0.0)
+    elif kernel == "epanechnikov":
+        values = np.where(inside, 0.75 * (1 - u**2), 0.0)
+    elif kernel == "exponential":
+        values = 0.5 * np.exp(-u)
+    elif kernel == "linear":
+        values = np.where(inside, 1 - u, 0.0)
+    else:
+        values = np.where(inside, np.pi / 4 * np.cos(np.pi / 2 * u), 0.0)
+
+    return values / bandwidth
+
+
+def _kde_grid(values: np.ndarray, gridsize: int) -> np.ndarray:
+    """
+    Create the grid on which the density is evaluated.
+
+    Outliers are ignored to find the bounds of the grid, which is then
+    widened by 5% on each side.
+
+    Args:
+        values (np.ndarray): The observations, without missing values.
+
+        gridsize (int): Number of discrete points in the grid.
+
+    Returns:
+        np.ndarray: The evaluation grid.
+    """
+    # Remove outliers to find max and min values for the x axis
+    q05, q95 = np.quantile(values, [0.05, 0.95])
+    iqr = q95 - q05
+    truncated = values[
+        (values >= q05 - 0.5 * iqr) & (values <= q95 + 0.5 * iqr)
+    ]
+
+    max_val, min_val = int(truncated.max()) + 1, int(truncated.min())
+    max_val, min_val = (
+        max_val + 0.05 * (max_val + abs(min_val)),
+        min_val - 0.05 * (max_val + abs(min_val)),
+    )
+
+    _, step = np.linspace(min_val, max_val, num=gridsize, retstep=True)
+
+    return np.round(np.arange(min_val, max_val, step), 5)
+
+
+def _linear_binning(
+    values: np.ndarray,
+    weights: np.ndarray,
+    start: float,
+    step: float,
+    n_bins: int,
+) -> np.ndarray:
+    """
+    Spread the weight of each observation on its two nearest grid points.
+
+    Args:
+        values (np.ndarray): The observations.
+
+        weights (np.ndarray): The weights of the observations.
+
+        start (float): The first point of the grid.
+
+        step (float): The spacing of the grid.
+
+        n_bins (int): The number of points of the grid.
+
+    Returns:
+        np.ndarray: The weight accumulated on each point of the grid.
+    """
+    pos = (values - start) / step
+    keep = (pos >= 0) & (pos <= n_bins - 1)
+    pos, weights = pos[keep], weights[keep]
+
+    left = np.minimum(np.floor(pos).astype(np.int64), n_bins - 2)
+    frac = pos - left
+
+    return np.bincount(
+        left, weights=weights * (1 - frac), minlength=n_bins
+    ) + np.bincount(left + 1, weights=weights * frac, minlength=n_bins)
+
+
+def _kde_fft(
+    values: np.ndarray,
+    grid: np.ndarray,
+    bandwidth: float,
+    kernel: str = "gaussian",
+    weights: Union[np.ndarray, None] = None,
+) -> np.ndarray:
+    """
+    Estimate a density by binning the observations and convolving the bins
+    with the kernel using FFT.
+
+    The complexity is O(n + g log g), where n is the number of observations
+    and g the size of the grid, instead of O(n × g) for a direct evaluation.
+
+    Args:
+        values (np.ndarray): The observations.
+
+        grid (np.ndarray): The evaluation grid, evenly spaced.
+
+        bandwidth (float): The bandwidth of the kernel.
+
+        kernel (str, optional): The name of the kernel. Defaults to
+            "gaussian".
+
+        weights (np.ndarray, optional): The weights of the observations.
+            Defaults to None.
+
+    Returns:
+        np.ndarray: The density evaluated on the grid.
+    """
+    if weights is None:
+        weights = np.ones(len(values))
+
+    if len(grid) < 2:
+        return (
+            _kernel(grid[:, None] - values, bandwidth, kernel).dot(weights)
+            / weights.sum()
+        )
+
+    step = (grid[-1] - grid[0]) / (len(grid) - 1)
+    support = _KERNEL_SUPPORT[kernel] * bandwidth
+
+    # Observations close to the grid contribute to the density on the grid
+    lo = max(values.min(), grid[0] - support)
+    hi = min(values.max(), grid[-1] + support)
+    n_lo = max(int(np.ceil((grid[0] - lo) / step)), 0)
+    n_hi = max(int(np.ceil((hi - grid[-1]) / step)), 0)
+    n_bins = n_lo + len(grid) + n_hi
+
+    bins = _linear_binning(
+        values, weights, grid[0] - n_lo * step, step, n_bins
+    )
+
+    n_kernel = min(int(np.ceil(support / step)), n_bins - 1)
+    kernel_values = _kernel(
+        np.arange(-n_kernel, n_kernel + 1) * step, bandwidth, kernel
+    )
+
+    n_fft = 1 << (n_bins + 2 * n_kernel).bit_length()
+    density = np.fft.irfft(
+        np.fft.rfft(bins, n_fft) * np.fft.rfft(kernel_values, n_fft), n_fft
+    )
+    density = density[n_kernel + n_lo : n_kernel + n_lo + len(grid)]
+
+    return np.clip(density, 0, None) / weights.sum()
+
+
+def _kde_sklearn(
+    values: np.ndarray,
+    grid: np.ndarray,
+    bandwidth: float,
+    kernel: str = "gaussian",
+    weights: Union[np.ndarray, None] = None,
+    **kwargs,
+) -> np.ndarray:
+    """
+    Estimate a density with scikit-learn's KernelDensity.
+
+    Args:
+        values (np.ndarray): The observations.
+
+        grid (np.ndarray): The evaluation grid.
+
+        bandwidth (float): The bandwidth of the kernel.
+
+        kernel (str, optional): The name of the kernel. Defaults to
+            "gaussian".
+
+        weights (np.ndarray, optional): The weights of the observations.
+            Defaults to None.
+
+        kwargs (optionnal): Other keyword arguments are passed down to
+            scikit-learn's KernelDensity class.
+
+    Returns:
+        np.ndarray: The density evaluated on the grid.
+    """
+    # scikit-learn is slow to import, it is only loaded when needed
+    from sklearn.neighbors import KernelDensity
+
+    kde_skl = KernelDensity(bandwidth=bandwidth, kernel=kernel, **kwargs)
+    kde_skl.fit(values[:, np.newaxis], sample_weight=weights)
+
+    return np.exp(kde_skl.score_samples(grid[:, np.newaxis]))
+
+
+def _effective_size(weights: Union[np.ndarray, None], n: int) -> float:
+    """
+    Compute the effective number of observations of a weighted sample.
+
+    Args:
+        weights (np.ndarray, optional): The weights of the observations.
+
+        n (int): The number of observations.
+
+    Returns:
+        float: The effective sample size (Kish's formula).
+    """
+    if weights is None:
+        return float(n)
+
+    return weights.sum() ** 2 / (weights**2).sum()
+
+
+def _rule_of_thumb(
+    values: np.ndarray,
+    weights: Union[np.ndarray, None] = None,
+    rule: str = "scott",
+) -> float:
+    """
+    Compute the Scott or Silverman bandwidth of a gaussian kernel.
+
+    Args:
+        values (np.ndarray): The observations.
+
+        weights (np.ndarray, optional): The weights of the observations.
+            Defaults to None.
+
+        rule (str, optional): "scott" or "silverman". Defaults to "scott".
+
+    Returns:
+        float: The bandwidth.
+    """
+    mean = np.average(values, weights=weights)
+    std = np.sqrt(np.average((values - mean) ** 2, weights=weights))
+    n = _effective_size(weights, len(values))
+
+    if rule == "scott":
+        return 1.059 * std * n ** (-1 / 5)
+
+    q25, q75 = np.quantile(values, [0.25, 0.75])
+    spread = min(std, (q75 - q25) / 1.349) or std
+
+    return 0.9 * spread * n ** (-1 / 5)
+
+
+def _dct(x: np.ndarray) -> np.ndarray:
+    """
+    Compute the (unnormalized) type II discrete cosine transform using FFT.
+
+    Args:
+        x (np.ndarray): The input signal.
+
+    Returns:
+        np.ndarray: The DCT of the signal.
+    """
+    n = len(x)
+    v = np.concatenate([x[::2], x[1::2][::-1]])
+    phase = np.exp(-1j * np.pi * np.arange(n) / (2 * n))
+
+    return 2 * np.real(phase * np.fft.fft(v))
+
+
+def _isj_fixed_point(t: float, n: float, i_sq: np.ndarray, a2: np.ndarray):
+    """
+    Compute the fixed point equation of the Improved Sheather-Jones method.
+
+    Args:
+        t (float): The squared bandwidth, relative to the data range.
+
+        n (float): The number of observations.
+
+        i_sq (np.ndarray): The squared indices of the DCT coefficients.
+
+        a2 (np.ndarray): The squared DCT coefficients of the binned data.
+
+    Returns:
+        float: t - xi * gamma(t), which is zero at the optimal bandwidth.
+    """
+    ell = 7
+    f = (
+        2
+        * np.pi ** (2 * ell)
+        * np.sum(i_sq**ell * a2 * np.exp(-i_sq * np.pi**2 * t))
+    )
+
+    for s in range(ell - 1, 1, -1):
+        k0 = np.prod(np.arange(1, 2 * s, 2)) / np.sqrt(2 * np.pi)
+        const = (1 + (1 / 2) ** (s + 1 / 2)) / 3
+        time = (2 * const * k0 / (n * f)) ** (2 / (3 + 2 * s))
+        f = (
+            2
+            * np.pi ** (2 * s)
+            * np.sum(i_sq**s * a2 * np.exp(-i_sq * np.pi**2 * time))
+        )
+
+    return t - (2 * n * np.sqrt(np.pi) * f) ** (-2 / 5)
+
+
+def _isj(
+    values: np.ndarray,
+    weights: Union[np.ndarray, None] = None,
+    n_bins: int = 2**10,
+) -> float:
+    """
+    Compute the bandwidth of a gaussian kernel with the Improved
+    Sheather-Jones method (Botev et al., 2010).
+
+    The data is binned once and the method only works on the DCT of the
+    bins, which makes it fast on large samples. It is also much more robust
+    than rules of thumb on multimodal data. If the fixed point equation has
+    no solution, the Silverman bandwidth is returned.
+
+    Args:
+        values (np.ndarray): The observations.
+
+        weights (np.ndarray, optional): The weights of the observations.
+            Defaults to None.
+
+        n_bins (int, optional): Number of bins. Defaults to 1024.
+
+    Returns:
+        float: The bandwidth.
+    """
+    if weights is None:
+        weights = np.ones(len(values))
+
+    lo, hi = values.min(), values.max()
+    data_range = hi - lo
+    if data_range == 0:
+        return _rule_of_thumb(values, weights, "silverman")
+
+    lo, hi = lo - data_range / 10, hi + data_range / 10
+    step = (hi - lo) / (n_bins - 1)
+    bins = _linear_binning(values, weights, lo, step, n_bins)
+
+    a = _dct(bins / bins.sum())
+    i_sq = np.arange(1, n_bins, dtype="float64") ** 2
+    a2 = (a[1:] / 2) ** 2
+    n = _effective_size(weights, len(values))
+
+    # Find the root of the fixed point equation by bisection
+    low, high = 0.0, 0.1
+    if _isj_fixed_point(high, n, i_sq, a2) < 0:
+        return _rule_of_thumb(values, weights, "silverman")
+
+    for _ in range(100):
+        mid = (low + high) / 2
+        if _isj_fixed_point(mid, n, i_sq, a2) < 0:
+            low = mid
+        else:
+            high = mid
+
+    return np.sqrt(high) * (hi - lo)
+
+
+def _bandwidth_cv(
+    values: np.ndarray,
+    kernel: str = "gaussian",
+    weights: Union[np.ndarray, None] = None,
+    n_jobs: Union[int, None] = None,
+    max_samples: Union[int, None] = None,
+) -> float:
+    """
+    Find the bandwidth maximizing the cross-validated likelihood of a
+    KernelDensity with a gridsearch.
+
+    Args:
+        values (np.ndarray): The observations.
+
+        kernel (str, optional): The name of the kernel. Defaults to
+            "gaussian".
+
+        weights (np.ndarray, optional): The weights of the observations.
+            Defaults to None.
+
+        n_jobs (int, optional): Number of jobs to run in parallel. Defaults
+            to None.
+
+        max_samples (int, optional): If set, the search is run on a random
+            subsample of at most max_samples observations. Defaults to None.
+
+    Returns:
+        float: The bandwidth.
+    """
+    # scikit-learn is slow to import, it is only loaded when needed
+    from sklearn.neighbors import KernelDensity
+    from sklearn.model_selection import GridSearchCV
+
+    if max_samples is not None and len(values) > max_samples:
+        rng = np.random.default_rng(0)
+        idx = rng.choice(len(values), size=max_samples, replace=False)
+        values = values[idx]
+        weights = None if weights is None else weights[idx]
+
+    grid = GridSearchCV(
+        KernelDensity(kernel=kernel),
+        {"bandwidth": np.linspace(0.1, 2, 30)},
+        cv=5,
+        n_jobs=n_jobs,
+    )
+    grid.fit(values[:, np.newaxis], sample_weight=weights)
+
+    return grid.best_params_["bandwidth"]
+
+
+def _bandwidth(
+    values: np.ndarray,
+    bandwidth: Union[float, str] = "scott",
+    kernel: str = "gaussian",
+    weights: Union[np.ndarray, None] = None,
+    n_jobs: Union[int, None] = None,
+    max_samples: Union[int, None] = None,
+) -> float:
+    """
+    Select the bandwidth of a kernel density estimate.
+
+    Args:
+        values (np.ndarray): The observations, without missing values.
+
+        bandwidth ([float, str], optional): A bandwidth, or the method used
+            to select it: "scott" or "silverman" (rules of thumb), "isj"
+            (Improved Sheather-Jones) or "auto" (cross-validated
+            gridsearch). Defaults to "scott".
+
+        kernel (str, optional): The name of the kernel. Defaults to
+            "gaussian".
+
+        weights (np.ndarray, optional): The weights of the observations.
+            Defaults to None.
+
+        n_jobs (int, optional): Number of jobs used by the gridsearch.
+            Defaults to None.
+
+        max_samples (int, optional): Maximum number of observations used by
+            the gridsearch. Defaults to None.
+
+    Raises:
+        ValueError: If the bandwidth is invalid.
+
+    Returns:
+        float: The bandwidth.
+    """
+    if not isinstance(bandwidth, str):
+        if not bandwidth > 0:
+            raise ValueError(MSG_BANDWIDTH)
+        return float(bandwidth)
+
+    if bandwidth not in BANDWIDTH_METHODS:
+        raise ValueError(MSG_BANDWIDTH)
+
+    if bandwidth == "auto":
+        return float(
+            _bandwidth_cv(values, kernel, weights, n_jobs, max_samples)
+        )
+
+    if bandwidth == "isj":
+        h = _isj(values, weights)
+    else:
+        h = _rule_of_thumb(values, weights, bandwidth)
+
+    # Rules are derived for a gaussian kernel
+    ratio = _CANONICAL_BANDWIDTH[kernel] / _CANONICAL_BANDWIDTH["gaussian"]
+
+    return float(h * ratio)
+
+
+@_timed("kde")
+@_memoized(lambda args: [])
+def _kde(
+    values,
+    gridsize: int,
+    bandwidth: Union[float, str] = "scott",
+    kernel: str = "gaussian",
+    weights=None,
+    method: str = "auto",
+    n_jobs: Union[int, None] = None,
+    max_samples: Union[int, None] = None,
+    **kwargs,
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Estimate the density of a sample on an evenly spaced grid.
+
+    Args:
+        values: The observations. Missing values are ignored.
+
+        gridsize (int): Number of discrete points in the evaluation grid.
+
+        bandwidth ([float, str], optional): The bandwidth of the kernel, or
+            the method used to select it (see _bandwidth). Defaults to
+            "scott".
+
+        kernel (str, optional): The name of the kernel. Defaults to
+            "gaussian".
+
+        weights (optional): The weights of the observations. Defaults to
+            None.
+
+        method (str, optional): "fft" to bin the observations and convolve
+            them with the kernel, "sklearn" to use scikit-learn's
+            KernelDensity, or "auto" to use "fft" only when it matches the
+            exact estimate (see _kde_method). Defaults to "auto".
+
+        n_jobs (int, optional): Number of jobs used by the gridsearch when
+            bandwidth is "auto". Defaults to None.
+
+        max_samples (int, optional): Maximum number of observations used by
+            the gridsearch when bandwidth is "auto". Defaults to None.
+
+        kwargs (optionnal): Other keyword arguments are passed down to
+            scikit-learn's KernelDensity class (only with method="sklearn").
+
+    Raises:
+        ValueError: If the method, the kernel or the bandwidth is invalid,
+            or if keyword arguments are given with method="fft".
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, float]: The evaluation grid, the
+            density and the bandwidth.
+    """
+    if method not in KDE_METHODS:
+        raise ValueError(MSG_KDE_METHOD)
+    if kernel not in KERNELS:
+        raise ValueError(MSG_KERNEL)
+    if method == "fft" and kwargs:
+        raise ValueError(
+            f"Arguments {', '.join(kwargs)} are only supported with "
+            "method='sklearn'"
+        )
+
+    values, weights = _drop_missing(values, weights)
+    grid = _kde_grid(values, gridsize)
+    bandwidth = _bandwidth(
+        values, bandwidth, kernel, weights, n_jobs, max_samples
+    )
+
+    if method == "auto":
+        method = _kde_method(grid, bandwidth, kernel, kwargs)
+
+    if method == "fft":
+        density = _kde_fft(values, grid, bandwidth, kernel, weights)
+    else:
+        density = _kde_sklearn(
+            values, grid, bandwidth, kernel, weights, **kwargs
+        )
+
+    return grid, density, bandwidth
+
+
+def _kde_method(
+    grid: np.ndarray, bandwidth: float, kernel: str, kwargs: dict
+) -> str:
+    """
+    Choose the method estimating a density when it is "auto".
+
+    The binned FFT estimate only matches the exact one for a gaussian
+    kernel whose bandwidth spans a few grid steps: other kernels are not
+    smooth enough to be binned.
+
+    Args:
+        grid (np.ndarray): The evaluation grid, evenly spaced.
+
+        bandwidth (float): The bandwidth of the kernel.
+
+        kernel (str): The name of the kernel.
+
+        kwargs (dict): Other arguments of scikit-learn's KernelDensity.
+
+    Returns:
+        str: "fft" or "sklearn".
+    """
+    if kernel != "gaussian" or kwargs or len(grid) < 2:
+        return "sklearn"
+
+    step = (grid[-1] - grid[0]) / (len(grid) - 1)
+    return "fft" if bandwidth >= FFT_MIN_STEPS * step else "sklearn"
+
+
+def _drop_missing(
+    values, weights=None
+) -> Tuple[np.ndarray, Union[np.ndarray, None]]:
+    """
+    Remove the observations with a missing value or a missing weight.
+
+    Args:
+        values: The observations.
+
+        weights (optional): The weights of the observations. Defaults to
+            None.
+
+    Returns:
+        Tuple[np.ndarray, Union[np.ndarray, None]]: The observations and
+            their weights, as float arrays.
+    """
+    values = np.asarray(values, dtype="float64")
+    keep = np.isfinite(values)
+
+    if weights is not None:
+        weights = np.asarray(weights, dtype="float64")
+        keep &= np.isfinite(weights)
+        weights = weights[keep]
+
+    return values[keep], weights
@@ -1,10 +1,214 @@
+import numpy as np
 import pandas as pd
 
-from typing import Union
+from typing import Tuple, Union
 from pydash import set_, merge
-from pandas.api.types import is_numeric_dtype
+from pandas.api.types import is_numeric_dtype, is_bool_dtype
+
+from ..cache import _memoized
+from ..profiler import _timed
+from .downsampling import _downsample_data, _downsample_points
+from .frames import (
+    COUNT_COLUMN,
+    _check_columns,
+    _is_native_frame,
+    _is_numeric_column,
+    _native_group,
+    _to_pandas,
+)
+from .chunks import MSG_CHUNK_KIND, _chunked_group, _is_chunked
+
+
+def _to_values(values: Union[pd.Series, pd.Index], binary: bool = False):
+    """
+    Extract the values of a pandas object to put them in a chart dataset.
+
+    Args:
+        values ([pd.Series, pd.Index]): The values to extract.
+
+        binary (bool, optional): If True, values are returned as a numpy
+            array which will be sent to JS as a binary buffer. Otherwise,
+            they are returned as a list. Defaults to False.
+
+    Returns:
+        [list, np.ndarray]: The extracted values.
+    """
+    if not binary:
+        if values.hasnans:
+            # Missing values (e.g. gaps between datasets) are sent as null
+            values = values.astype(object).where(values.notna(), None)
+        return values.tolist()
+
+    if is_numeric_dtype(values.dtype) and not is_bool_dtype(values.dtype):
+        return values.to_numpy(dtype="float64", na_value=np.nan)
+
+    return values.to_numpy()
+
+
+def _arrays_to_lists(data_dict: dict) -> dict:
+    """
+    Convert the numpy arrays of a data dictionary to lists.
+
+    Args:
+        data_dict (dict): data dictionary with labels and datasets values
+            stored as numpy arrays.
+
+    Returns:
+        dict: data dictionary with labels and datasets values stored as
+            lists.
+    """
+    if isinstance(data_dict.get("labels"), np.ndarray):
+        data_dict["labels"] = data_dict["labels"].tolist()
+
+    for dataset in data_dict["datasets"]:
+        if isinstance(dataset["data"], np.ndarray):
+            dataset["data"] = dataset["data"].tolist()
+
+    return data_dict
+
+
+@_timed("downsampling")
+def _downsample_frame(
+    data: pd.DataFrame,
+    x: str,
+    y: str,
+    hue: Union[str, None],
+    max_points: int,
+    method: str,
+) -> pd.DataFrame:
+    """
+    Keep at most max_points representative rows for each value of hue.
+
+    Args:
+        data (pd.DataFrame): The dataframe used to draw the chart.
+
+        x (str): Column of the dataframe used as datapoints for x Axis.
+
+        y (str): Column of the dataframe used as datapoints for y Axis.
+
+        hue (str, optional): Grouping variable that will produce points with
+            different colors. Each group is downsampled independently.
+
+        max_points (int): Maximum number of rows to keep per group.
+
+        method (str): The downsampling algorithm, one of "lttb", "minmax" or
+            "every_nth".
+
+    Returns:
+        pd.DataFrame: The downsampled dataframe, rows keep their order.
+    """
+    if hue:
+        groups = data.groupby(hue, sort=False).indices.values()
+    else:
+        groups = [np.arange(len(data))]
+
+    xs, ys = data[x].to_numpy(), data[y].to_numpy()
+    kept = [
+        pos[_downsample_points(xs[pos], ys[pos], max_points, method)]
+        for pos in groups
+    ]
+
+    return data.iloc[np.sort(np.concatenate(kept))]
+
+
+def _group_by_hue(
+    data: pd.DataFrame,
+    x: str,
+    y: Union[str, None] = None,
+    hue: Union[str, None] = None,
+    agg: Union[str, None] = None,
+    sort_hue: bool = True,
+) -> Tuple[pd.DataFrame, list]:
+    """
+    Aggregate (or count) the values of y for each couple of hue and x values.
+
+    All hue values are computed in a single groupby pass. The hue column is
+    encoded as integer codes first (categorical codes are reused), which
+    makes the grouping much cheaper than one boolean mask per hue value.
+
+    Args:
+        data (pd.DataFrame): The dataframe used to draw the chart.
+
+        x (str): Column of the dataframe used as datapoints for x Axis.
+
+        y (str, optional): Column of the dataframe to aggregate. If None,
+            rows are counted. Defaults to None.
+
+        hue (str, optional): Grouping variable that will produce one dataset
+            for each of its values. Defaults to None.
+
+        agg (str, optional): The aggregator used to gather data (ex: 'median'
+            or 'mean'). Defaults to None.
+
+        sort_hue (bool, optional): If True, hue values are sorted. Otherwise,
+            they keep their order of appearance. Defaults to True.
+
+    Returns:
+        Tuple[pd.DataFrame, list]: A table with one row per value of x
+            (sorted) and one column per hue value (the i-th column holds the
+            values of the i-th hue value), and the list of hue values. Gaps
+            are filled with NaN.
+    """
+    values = data[x] if y is None else data[y]
+
+    if hue:
+        codes, uniques = pd.factorize(data[hue], sort=sort_hue)
+        keys = [codes, data[x]]
+    else:
+        uniques = [None]
+        keys = [data[x]]
+
+    grouped = values.groupby(keys, sort=True, observed=True)
+    table = grouped.size() if y is None else grouped.agg(agg).round(4)
+
+    if hue:
+        # Missing hue values (code -1) are dropped by the reindex
+        table = table.unstack(0).reindex(columns=range(len(uniques)))
+    else:
+        table = table.to_frame(0)
+
+    return table, list(uniques)
+
+
+def _create_hue_datasets(
+    table: pd.DataFrame,
+    uniques: list,
+    dataset_options: Union[dict, list],
+    binary: bool = False,
+) -> list:
+    """
+    Create one dataset for each column of a table computed by _group_by_hue.
+
+    Args:
+        table (pd.DataFrame): Values of each hue value, aligned on the labels.
+
+        uniques (list): The hue values, used as labels of the datasets.
+
+        dataset_options ([dict, list]): These are options related to the
+            dataset object. If a list is given, the i-th element is used for
+            the i-th hue value.
+
+        binary (bool, optional): If True, values are kept as numpy arrays to
+            be sent to JS as binary buffers. Defaults to False.
+
+    Returns:
+        list: The datasets of the chart.
+    """
+    datasets = []
+    for i, v in enumerate(uniques):
+        if isinstance(dataset_options, list):
+            options = dataset_options[i]
+        else:
+            options = dataset_options
 
+        datasets.append(
+            {"data": _to_values(table[i], binary), "label": str(v), **options}
+        )
 
+    return datasets
+
+
+@_timed("options")
 def _create_chart_options(
     kind: str, x: str, y: str, hue: str, options: dict, agg: str = None
 ) -> dict:
@@ -95,57 +299,14 @@ def _create_chart_options(
     return options
 
 
-def _create_counted_data_dict(
-    data: pd.DataFrame,
-    x: str,
-    dataset_options: dict,
-    label: Union[str, None] = None,
-) -> dict:
-    """
-    Prepare an ipychart dataset with counted data from a pandas dataframe.
-
-    Args:
-        data (pd.DataFrame): The dataframe used to draw the chart.
-
-        x (str): Column of the dataframe used as datapoints for x Axis.
-
-        dataset_options (dict, optional): These are options related to the
-            dataset object (i.e. options concerning your data). Defaults to {}.
-
-        label (str, optional): The label of the dataset. Defaults to None.
-
-    Returns:
-        dict: data dictionary ready to be inputted into a Chart class (i.e.
-            match ipychart data format).
-    """
-    if is_numeric_dtype(data[x]):
-        dataset = {
-            "data": data[x]
-            .value_counts(sort=False)
-            .sort_index(ascending=True)
-            .round(4)
-            .tolist(),
-            **dataset_options,
-        }
-    else:
-        dataset = {
-            "data": data[x]
-            .value_counts(ascending=False, sort=True)
-            .round(4)
-            .tolist(),
-            **dataset_options,
-        }
-    if label:
-        dataset["label"] = label
-
-    return dataset
-
-
+@_timed("aggregation")
+@_memoized(lambda args: [args["x"], args["hue"]])
 def _create_chart_data_count(
     data: pd.DataFrame,
     x: str,
     hue: Union[str, None] = None,
     dataset_options: Union[dict, list, None] = None,
+    binary: bool = False,
 ) -> dict:
     """
     Prepare all the arguments to create a chart from user's input.
@@ -164,10 +325,27 @@ def _create_chart_data_count(
             the dataset object (i.e. options concerning your data). Defaults
             to {}.
 
+        binary (bool, optional): If True, values are kept as numpy arrays to
+            be sent to JS as binary buffers. Defaults to False.
+
     Returns:
         dict: data dictionary ready to be inputted into a Chart class (i.e.
             match ipychart data format).
     """
+    weights = None
+
+    if _is_native_frame(data):
+        # Rows are counted by polars or pyarrow, only the counts are
+        # converted to pandas and counted again (weighted) below
+        numeric = _is_numeric_column(data, x)
+        data = _native_group(data, [hue, x] if hue else [x])
+        weights = COUNT_COLUMN
+    elif _is_chunked(data):
+        # Rows are counted chunk by chunk
+        data = _chunked_group(data, [hue, x] if hue else [x])
+        numeric = is_numeric_dtype(data[x])
+        weights = COUNT_COLUMN
+
     assert x in data.columns, f"Column {x} not found in dataframe"
 
     if hue:
@@ -177,53 +355,34 @@ def _create_chart_data_count(
     if dataset_options is None:
         dataset_options = {}
 
-    data_dict = {"datasets": []}
-
-    if is_numeric_dtype(data[x]):
-        data_dict["labels"] = (
-            data[x]
-            .value_counts(sort=False)
-            .sort_index(ascending=True)
-            .index.tolist()
-        )
+    # Numeric labels are sorted, others by decreasing number of occurrences
+    if weights is None:
+        numeric = is_numeric_dtype(data[x])
+        counts = data[x].value_counts(sort=not numeric, ascending=False)
     else:
-        data_dict["labels"] = (
-            data[x].value_counts(ascending=False, sort=True).index.tolist()
-        )
-
-    if hue:
-        # Create one dataset for each unique value of the hue column
-        for i, v in enumerate(sorted(data[hue].unique())):
-            if isinstance(dataset_options, list):
-                data_dict["datasets"].append(
-                    _create_counted_data_dict(
-                        data=data[data[hue] == v],
-                        x=x,
-                        dataset_options=dataset_options[i],
-                        label=str(v),
-                    )
-                )
+        counts = data.groupby(x, sort=True)[weights].sum()
+        if not numeric:
+            counts = counts.sort_values(ascending=False, kind="stable")
+    if numeric:
+        counts = counts.sort_index(ascending=True)
 
-            else:
-                data_dict["datasets"].append(
-                    _create_counted_data_dict(
-                        data=data[data[hue] == v],
-                        x=x,
-                        dataset_options=dataset_options,
-                        label=str(v),
-                    )
-                )
+    data_dict = {"labels": _to_values(counts.index, binary and numeric)}
 
-    else:
-        data_dict["datasets"].append(
-            _create_counted_data_dict(
-                data=data, x=x, dataset_options=dataset_options
-            )
+    if hue:
+        table, uniques = _group_by_hue(data, x, weights, hue, agg="sum")
+        data_dict["datasets"] = _create_hue_datasets(
+            table.reindex(counts.index), uniques, dataset_options, binary
         )
+    else:
+        data_dict["datasets"] = [
+            {"data": _to_values(counts, binary), **dataset_options}
+        ]
 
     return data_dict
 
 
+@_timed("aggregation")
+@_memoized(lambda args: [args["x"], args["y"], args["r"], args["hue"]])
 def _create_chart_data_agg(
     data: pd.DataFrame,
     kind: str,
@@ -233,6 +392,9 @@ def _create_chart_data_agg(
     hue: Union[str, None] = None,
     agg: Union[str, None] = None,
     dataset_options: Union[dict, list, None] = None,
+    binary: bool = False,
+    max_points: Union[int, None] = None,
+    downsample: str = "lttb",
 ) -> dict:
     """
     Prepare all the arguments to create a chart from user's input.
@@ -262,10 +424,38 @@ def _create_chart_data_agg(
             the dataset object (i.e. options concerning your data). Defaults
             to {}.
 
+        binary (bool, optional): If True, values are kept as numpy arrays to
+            be sent to JS as binary buffers. Defaults to False.
+
+        max_points (int, optional): If set, each dataset is downsampled to
+            about max_points points. Only used for line and scatter charts.
+            Defaults to None.
+
+        downsample (str, optional): The downsampling algorithm, one of
+            "lttb", "minmax" or "every_nth". Defaults to "lttb".
+
     Returns:
         dict: data dictionary ready to be inputted into a Chart class (i.e.
          match ipychart data format).
     """
+    # Aggregator of _group_by_hue, data of polars or pyarrow (or chunks of
+    # data) being aggregated first
+    group_agg = agg
+
+    if _is_native_frame(data):
+        _check_columns(data, [x, y, r, hue])
+        assert _is_numeric_column(data, y), "y must be a numeric column"
+        if kind in ["scatter", "bubble"]:
+            data = _to_pandas(data, [x, y, r, hue])
+        else:
+            data = _native_group(data, [hue, x] if hue else [x], y, agg)
+            group_agg = "first"
+    elif _is_chunked(data):
+        if kind in ["scatter", "bubble"]:
+            raise ValueError(MSG_CHUNK_KIND)
+        data = _chunked_group(data, [hue, x] if hue else [x], y, agg)
+        group_agg = "first"
+
     assert x in data.columns, f"{x} not found in dataframe"
     assert y in data.columns, f"{y} not found in dataframe"
     assert is_numeric_dtype(data[y]), "y must be a numeric column"
@@ -297,161 +487,261 @@ def _create_chart_data_agg(
     data_dict = {"datasets": []}
 
     if kind not in ["scatter", "bubble", "radar"]:
-        data_dict["labels"] = (
-            data[x].value_counts(ascending=True, sort=False).index.tolist()
-        )
+        # Values are kept as arrays to be downsampled before any conversion
+        as_arrays = binary or max_points is not None
 
-        if hue:
-            # Create one dataset for each unique value of the hue column
-            for i, v in enumerate(sorted(data[hue].unique())):
-                if isinstance(dataset_options, list):
-                    data_dict["datasets"].append(
-                        {
-                            "data": data[data[hue] == v]
-                            .groupby(x)
-                            .agg(agg)[y]
-                            .round(4)
-                            .tolist(),
-                            "label": str(v),
-                            **dataset_options[i],
-                        }
-                    )
+        table, uniques = _group_by_hue(data, x, y, hue, group_agg)
+        data_dict["labels"] = _to_values(table.index, as_arrays)
 
-                else:
-                    data_dict["datasets"].append(
-                        {
-                            "data": data[data[hue] == v]
-                            .groupby(x)
-                            .agg(agg)[y]
-                            .round(4)
-                            .tolist(),
-                            "label": str(v),
-                            **dataset_options,
-                        }
-                    )
+        if hue:
+            data_dict["datasets"] = _create_hue_datasets(
+                table, uniques, dataset_options, as_arrays
+            )
         else:
             data_dict["datasets"] = [
                 {
-                    "data": data.groupby(x).agg(agg)[y].round(4).tolist(),
+                    "data": _to_values(table[0], as_arrays),
                     "label": y,
                     **dataset_options,
                 }
             ]
 
-    elif kind == "bubble":
-        assert is_numeric_dtype(data[r]), "r must be a numeric column"
-        assert is_numeric_dtype(data[x]), "x must be a numeric column"
-
-        data_dict["labels"] = data[x].tolist()
+        if max_points is not None:
+            data_dict = _downsample_data(data_dict, max_points, downsample)
+            if not binary:
+                data_dict = _arrays_to_lists(data_dict)
 
-        def row2dictxyr(row):
-            return {"x": row[x], "y": row[y], "r": row[r]}
-
-        if hue:
-            # Create one dataset for each unique value of the hue column
-            for i, v in enumerate(data[hue].unique()):
-                mask = data[hue] == v
-                if isinstance(dataset_options, list):
-                    data_dict["datasets"].append(
-                        {
-                            "data": data[mask].apply(row2dictxyr, 1).tolist(),
-                            "label": str(v),
-                            **dataset_options[i],
-                        }
-                    )
+    elif kind in ["scatter", "bubble"]:
+        assert is_numeric_dtype(data[x]), "x must be a numeric column"
 
-                else:
-                    data_dict["datasets"].append(
-                        {
-                            "data": data[mask].apply(row2dictxyr, 1).tolist(),
-                            "label": str(v),
-                            **dataset_options,
-                        }
-                    )
-        else:
-            data_dict["datasets"] = [
-                {
-                    "data": data.apply(row2dictxyr, 1).tolist(),
-                    **dataset_options,
-                }
-            ]
+        columns = {"x": x, "y": y}
+        if kind == "bubble":
+            assert is_numeric_dtype(data[r]), "r must be a numeric column"
+            columns["r"] = r
 
-    elif kind == "scatter":
-        assert is_numeric_dtype(data[x]), "x must be a numeric column"
+        elif max_points is not None:
+            data = _downsample_frame(data, x, y, hue, max_points, downsample)
 
-        data_dict["labels"] = data[x].tolist()
+        data_dict["labels"] = _to_values(data[x], binary)
 
-        def row2dictxy(row):
-            return {"x": row[x], "y": row[y]}
+        def to_points(frame):
+            # Parallel point columns, zipped into {x, y[, r]} points in JS
+            return {
+                k: _to_values(frame[c], binary) for k, c in columns.items()
+            }
 
         if hue:
-            # Create one dataset for each unique value of the hue column
-            for i, v in enumerate(data[hue].unique()):
-                mask = data[hue] == v
-                if isinstance(dataset_options, list):
-                    data_dict["datasets"].append(
-                        {
-                            "data": data[mask].apply(row2dictxy, 1).tolist(),
-                            "label": str(v),
-                            **dataset_options[i],
-                        }
-                    )
+            # Positions of the rows of each hue value, in a single pass
+            codes, uniques = pd.factorize(data[hue], sort=False)
+            groups = data.groupby(codes, sort=True).indices
+            frame = data[list(columns.values())]
 
+            for i, v in enumerate(uniques):
+                if isinstance(dataset_options, list):
+                    options = dataset_options[i]
                 else:
-                    data_dict["datasets"].append(
-                        {
-                            "data": data[mask].apply(row2dictxy, 1).tolist(),
-                            "label": str(v),
-                            **dataset_options,
-                        }
-                    )
+                    options = dataset_options
+
+                data_dict["datasets"].append(
+                    {
+                        "data": to_points(frame.iloc[groups[i]]),
+                        "label": str(v),
+                        **options,
+                    }
+                )
         else:
             data_dict["datasets"] = [
-                {"data": data.apply(row2dictxy, 1).tolist(), **dataset_options}
+                {"data": to_points(data), **dataset_options}
             ]
 
     else:
         agg_label = "" if not agg else " (" + agg + ")"
-        data_dict["labels"] = (
-            data[x].value_counts(ascending=True, sort=False).index.tolist()
+        table, uniques = _group_by_hue(
+            data, x, y, hue, group_agg, sort_hue=False
         )
+        data_dict["labels"] = _to_values(table.index, binary)
 
         if hue:
-            # Create one dataset for each unique value of the hue column
-            for i, v in enumerate(data[hue].unique()):
-                mask = data[hue] == v
-                if isinstance(dataset_options, list):
-                    data_dict["datasets"].append(
-                        {
-                            "data": data[mask]
-                            .groupby(x)
-                            .agg(agg)[y]
-                            .round(4)
-                            .tolist(),
-                            "label": str(v),
-                            **dataset_options[i],
-                        }
-                    )
-
-                else:
-                    data_dict["datasets"].append(
-                        {
-                            "data": data[mask]
-                            .groupby(x)
-                            .agg(agg)[y]
-                            .round(4)
-                            .tolist(),
-                            "label": str(v),
-                            **dataset_options,
-                        }
-                    )
+            data_dict["datasets"] = _create_hue_datasets(
+                table, uniques, dataset_options, binary
+            )
         else:
             data_dict["datasets"] = [
                 {
-                    "data": data.groupby(x).agg(agg)[y].round(4).tolist(),
+                    "data": _to_values(table[0], binary),
                     "label": y + agg_label,
                     **dataset_options,
                 }
             ]
 
     return data_dict
+
+
+@_timed("aggregation")
+@_memoized(lambda args: [args[k] for k in ("x", "y", "col", "row", "hue")])
+def _create_facet_data(
+    data: pd.DataFrame,
+    x: str,
+    y: Union[str, None] = None,
+    col: Union[str, None] = None,
+    row: Union[str, None] = None,
+    hue: Union[str, None] = None,
+    agg: Union[str, None] = None,
+    col_wrap: Union[int, None] = None,
+    dataset_options: Union[dict, list, None] = None,
+    binary: bool = False,
+) -> Tuple[dict, dict]:
+    """
+    Prepare the data of a grid of charts, with one panel for each value of
+    col (and/or row).
+
+    Data are aggregated (or counted) in a single groupby pass over the
+    row, col, hue and x columns. The result is then split into panels, all
+    aligned on the same labels.
+
+    Args:
+        data (pd.DataFrame): The dataframe used to draw the charts.
+
+        x (str): Column of the dataframe used as datapoints for x Axis.
+
+        y (str, optional): Column of the dataframe to aggregate. If None,
+            rows are counted. Defaults to None.
+
+        col (str, optional): Column whose values give the columns of the
+            grid. Defaults to None.
+
+        row (str, optional): Column whose values give the rows of the grid.
+            Defaults to None.
+
+        hue (str, optional): Grouping variable that will produce one dataset
+            per panel for each of its values. Defaults to None.
+
+        agg (str, optional): The aggregator used to gather data (ex: 'median'
+            or 'mean'). Defaults to None.
+
+        col_wrap (int, optional): The number of panels per row when only col
+            is given. Defaults to None (all panels in one row).
+
+        dataset_options ([dict, list], optional): These are options related to
+            the dataset object (i.e. options concerning your data). Defaults
+            to {}.
+
+        binary (bool, optional): If True, values are kept as numpy arrays to
+            be sent to JS as binary buffers. Defaults to False.
+
+    Returns:
+        Tuple[dict, dict]: The data dictionary of the grid (labels and the
+            datasets of all panels, panel by panel), and its panels (titles
+            and number of columns).
+    """
+    assert col or row, "At least one of col and row must be given"
+
+    facets = [k for k in (row, col) if k]
+    keys = list(dict.fromkeys(facets + ([hue] if hue else []) + [x]))
+    label = "Count" if y is None else y + ("" if not agg else f" ({agg})")
+
+    # Aggregator of the groupby below, data of polars or pyarrow (or chunks
+    # of data) being aggregated first
+    group_agg = agg
+
+    if _is_native_frame(data) or _is_chunked(data):
+        # Groups are first reduced by polars or pyarrow (or chunk by chunk),
+        # counts are summed and aggregated values kept below
+        if _is_native_frame(data):
+            if y is not None:
+                _check_columns(data, [y])
+                assert _is_numeric_column(
+                    data, y
+                ), "y must be a numeric column"
+            data = _native_group(data, keys, y, agg)
+        else:
+            data = _chunked_group(data, keys, y, agg)
+        group_agg = "sum" if y is None else "first"
+        y = COUNT_COLUMN if y is None else y
+
+    for key in keys + ([] if y is None else [y]):
+        assert key in data.columns, f"{key} not found in dataframe"
+
+    if y is not None:
+        assert is_numeric_dtype(data[y]), "y must be a numeric column"
+
+    if dataset_options is None:
+        dataset_options = {}
+
+    # Facet and hue values are encoded as sorted integer codes
+    codes, uniques = [], {}
+    for key in facets + ([hue] if hue else []):
+        key_codes, uniques[key] = pd.factorize(data[key], sort=True)
+        codes.append(key_codes)
+
+    if hue:
+        assert len(uniques[hue]) <= 20, "Too much values in hue (>20)"
+        if isinstance(dataset_options, list):
+            msg = (
+                "The number of dataset_options elements must be equal to "
+                "the number of unique values in the hue column."
+            )
+            assert len(dataset_options) == len(uniques[hue]), msg
+    else:
+        msg = (
+            "For multiple dataset options, you must choose a column for hue "
+            "that will create multiple datasets."
+        )
+        assert isinstance(dataset_options, dict), msg
+
+    # Rows with a missing facet or hue value are dropped
+    valid = np.logical_and.reduce([c >= 0 for c in codes])
+
+    values = data[x] if y is None else data[y]
+    grouped = values[valid].groupby(
+        [c[valid] for c in codes] + [data[x][valid]], sort=True, observed=True
+    )
+    table = grouped.size() if y is None else grouped.agg(group_agg).round(4)
+
+    # Labels are shared by all panels
+    labels = table.index.get_level_values(-1).unique().sort_values()
+
+    if hue:
+        table = table.unstack(-2).reindex(columns=range(len(uniques[hue])))
+        hue_values = list(uniques[hue])
+    else:
+        table = table.to_frame(0)
+        hue_values = [label]
+
+    # One panel per facet value (or per couple of row and col values), even
+    # if it has no data
+    sizes = [len(uniques[key]) for key in facets]
+    panels = list(np.ndindex(*sizes))
+    table = table.reindex(
+        pd.MultiIndex.from_product([range(s) for s in sizes] + [labels])
+    )
+
+    data_dict = {
+        "labels": _to_values(labels, binary and is_numeric_dtype(labels)),
+        "datasets": [],
+    }
+
+    n_labels = len(labels)
+    for i in range(len(panels)):
+        data_dict["datasets"] += _create_hue_datasets(
+            table.iloc[i * n_labels : (i + 1) * n_labels],
+            hue_values,
+            dataset_options,
+            binary,
+        )
+
+    titles = [
+        " | ".join(
+            f"{key} = {uniques[key][code]}" for key, code in zip(facets, panel)
+        )
+        for panel in panels
+    ]
+
+    if row and col:
+        columns = sizes[1]
+    elif col:
+        columns = col_wrap if col_wrap else len(panels)
+    else:
+        columns = 1
+
+    return data_dict, {"titles": titles, "columns": columns}
@@ -0,0 +1,119 @@
+import numpy as np
+
+from typing import Union
+
+MSG_CAPACITY = "The capacity of a rolling dataset must be a positive integer."
+
+
+class _RingBuffer:
+    """
+    Fixed-capacity buffer of values, backed by a numpy array.
+
+    Values are written in place: pushing a value is O(1) and never
+    allocates. Once the buffer is full, the oldest values are overwritten.
+    The ordered values are only copied when the buffer is converted to an
+    array (e.g. when the chart is serialized).
+
+    Args:
+        capacity (int): The maximum number of values.
+
+        dtype (optional): The dtype of the values. Defaults to "float64".
+
+        values (optional): Initial values. Only the last capacity values
+            are kept. Defaults to None.
+    """
+
+    def __init__(self, capacity: int, dtype="float64", values=None):
+        if isinstance(capacity, bool) or not isinstance(capacity, int):
+            raise ValueError(MSG_CAPACITY)
+        if capacity < 1:
+            raise ValueError(MSG_CAPACITY)
+
+        self._array = np.empty(capacity, dtype=dtype)
+        self._start = 0
+        self._size = 0
+
+        if values is not None:
+            self.extend(values)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._array)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._array.dtype
+
+    @property
+    def shape(self) -> tuple:
+        return (self._size,)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"_RingBuffer({self.tolist()!r}, capacity={self.capacity})"
+
+    def push(self, value):
+        """
+        Add a value, overwriting the oldest one if the buffer is full.
+
+        Args:
+            value: The value to add.
+        """
+        end = (self._start + self._size) % self.capacity
+        self._array[end] = value
+
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+    def extend(self, values):
+        """
+        Add several values, overwriting the oldest ones if needed.
+
+        Args:
+            values: A list or an array of values.
+        """
+        values = np.asarray(values, dtype=self.dtype).reshape(-1)
+        capacity, n = self.capacity, len(values)
+
+        if n >= capacity:
+            self._array[:] = values[n - capacity :]
+            self._start, self._size = 0, capacity
+            return
+
+        # Values are written after the last one, wrapping around the end
+        end = (self._start + self._size) % capacity
+        first = min(n, capacity - end)
+        self._array[end : end + first] = values[:first]
+        self._array[: n - first] = values[first:]
+
+        overflow = max(0, self._size + n - capacity)
+        self._start = (self._start + overflow) % capacity
+        self._size = min(capacity, self._size + n)
+
+    def _ordered(self) -> np.ndarray:
+        """
+        Get the values from the oldest to the newest.
+
+        Returns:
+            np.ndarray: A view of the values if they are contiguous in the
+                buffer, or a new array.
+        """
+        end = self._start + self._size
+
+        if end <= self.capacity:
+            return self._array[self._start : end]
+
+        return np.concatenate(
+            [self._array[self._start :], self._array[: end - self.capacity]]
+        )
+
+    def __array__(self, dtype=None, copy: Union[bool, None] = None):
+        # Always a copy: the buffer is overwritten by the next values
+        return np.array(self._ordered(), dtype=dtype, copy=True)
+
+    def tolist(self) -> list:
+        return self._ordered().tolist()
@@ -0,0 +1,313 @@
+import numpy as np
+
+from typing import Union
+
+# Numpy dtypes which have a JavaScript TypedArray counterpart
+TYPED_ARRAY_DTYPES = {
+    "int8",
+    "uint8",
+    "int16",
+    "uint16",
+    "int32",
+    "uint32",
+    "float32",
+    "float64",
+}
+
+# Keys of a dataset "data" dictionary holding parallel point columns
+POINT_COLUMNS = ("x", "y", "r")
+
+
+def _is_array_like(values) -> bool:
+    """
+    Check if values are backed by a numpy array (numpy, pandas, ...).
+
+    Args:
+        values: Any value found in a chart data dictionary.
+
+    Returns:
+        bool: True if values can be converted to a numpy array without
+            iterating over Python objects.
+    """
+    return (
+        isinstance(values, np.ndarray)
+        or (hasattr(values, "to_numpy") or hasattr(values, "__array__"))
+        and not isinstance(values, (list, tuple, dict, str))
+    )
+
+
+def _is_point_columns(values) -> bool:
+    """
+    Check if a dataset "data" entry is made of parallel point columns.
+
+    Scatter and bubble datasets can be given as {"x": [...], "y": [...]}
+    (and "r" for bubbles) instead of a list of points. The columns are
+    zipped into points on the JS side.
+
+    Args:
+        values: The "data" entry of a dataset.
+
+    Returns:
+        bool: True if values is a dictionary of point columns.
+    """
+    return (
+        isinstance(values, dict)
+        and "x" in values
+        and "y" in values
+        and set(values.keys()).issubset(POINT_COLUMNS)
+    )
+
+
+def _to_numeric_array(values) -> Union[np.ndarray, None]:
+    """
+    Convert values to a numeric numpy array that can be sent as a buffer.
+
+    Missing values are converted to NaN (Chart.js draws NaN as a gap) and
+    datetimes are converted to milliseconds since epoch, which is the
+    numeric format understood by Chart.js time scales.
+
+    Args:
+        values: A list, a numpy array or a pandas object.
+
+    Returns:
+        np.ndarray: A contiguous numeric array, or None if values are not
+            numeric (e.g. string labels).
+    """
+    if hasattr(values, "to_numpy") and not isinstance(values, np.ndarray):
+        values = values.to_numpy()
+
+    arr = np.asarray(values)
+
+    if arr.ndim != 1:
+        return None
+
+    if arr.dtype.kind == "M":
+        missing = np.isnat(arr)
+        arr = arr.astype("datetime64[ms]").astype("int64").astype("float64")
+        arr[missing] = np.nan
+    elif arr.dtype.kind == "b":
+        arr = arr.astype("uint8")
+    elif arr.dtype.kind == "O":
+        try:
+            arr = np.array(
+                [np.nan if v is None or v != v else v for v in arr],
+                dtype="float64",
+            )
+        except (TypeError, ValueError):
+            return None
+    elif arr.dtype.kind not in "iuf":
+        return None
+
+    if arr.dtype.name not in TYPED_ARRAY_DTYPES:
+        arr = arr.astype("float64")
+
+    return np.ascontiguousarray(arr)
+
+
+def _encode_array(arr: np.ndarray) -> dict:
+    """
+    Wrap a numeric numpy array into its binary representation.
+
+    The memoryview is extracted by ipywidgets and sent as a binary buffer of
+    the comm message. On the JS side, it is rebuilt as a TypedArray.
+
+    Args:
+        arr (np.ndarray): A contiguous numeric array.
+
+    Returns:
+        dict: The binary representation of the array.
+    """
+    return {
+        "dtype": arr.dtype.name,
+        "shape": list(arr.shape),
+        "buffer": memoryview(arr),
+    }
+
+
+def _array_to_list(values) -> list:
+    """
+    Convert a numpy-backed array to a JSON compatible list.
+
+    Args:
+        values: A numpy array or a pandas object.
+
+    Returns:
+        list: Values as a list, NaN and NaT being converted to None.
+    """
+    if hasattr(values, "to_numpy") and not isinstance(values, np.ndarray):
+        values = values.to_numpy()
+
+    arr = np.asarray(values)
+
+    if arr.dtype.kind == "M":
+        missing = np.isnat(arr)
+        arr = np.datetime_as_string(arr).astype(object)
+        arr[missing] = None
+    elif arr.dtype.kind == "f":
+        missing = np.isnan(arr)
+        if missing.any():
+            arr = arr.astype(object)
+            arr[missing] = None
+
+    return arr.tolist()
+
+
+def _serialize_values(values, binary: bool):
+    """
+    Serialize a column of values (labels, data or point coordinates).
+
+    Args:
+        values: A list, a numpy array or a pandas object.
+
+        binary (bool): If True, numeric values are sent as binary buffers.
+
+    Returns:
+        The serialized values.
+    """
+    if binary:
+        # Lists of strings or points cannot be sent as buffers
+        if isinstance(values, (list, tuple)) and (
+            not values or isinstance(values[0], (str, dict, list, tuple))
+        ):
+            return values
+
+        arr = _to_numeric_array(values)
+        if arr is not None:
+            return _encode_array(arr)
+        if _is_array_like(values):
+            return _array_to_list(values)
+        return values
+
+    if _is_array_like(values):
+        return _array_to_list(values)
+
+    return values
+
+
+def _serialize_dataset_values(values, binary: bool):
+    """
+    Serialize the "data" entry of a dataset.
+
+    Args:
+        values: A list, a numpy array, a pandas object or a dictionary of
+            parallel point columns.
+
+        binary (bool): If True, numeric values are sent as binary buffers.
+
+    Returns:
+        The serialized values.
+    """
+    if _is_point_columns(values):
+        return {k: _serialize_values(v, binary) for k, v in values.items()}
+
+    return _serialize_values(values, binary)
+
+
+def _serialize_data(data: dict, widget) -> dict:
+    """
+    Serialize the data of a chart before sending it to JS.
+
+    Args:
+        data (dict): The data dictionary of the chart.
+
+        widget (ipychart.Chart): The chart being synced.
+
+    Returns:
+        dict: The data dictionary to send to JS.
+    """
+    return _serialize_chart_data(data, getattr(widget, "_binary", False))
+
+
+def _serialize_chart_data(data: dict, binary: bool) -> dict:
+    """
+    Serialize a chart data dictionary.
+
+    In binary mode, numeric labels and dataset values are sent as binary
+    buffers instead of JSON lists. Otherwise, numpy-backed values are
+    converted to lists so that they can be JSON encoded.
+
+    Args:
+        data (dict): The data dictionary of the chart.
+
+        binary (bool): If True, numeric values are sent as binary buffers.
+
+    Returns:
+        dict: The serialized data dictionary.
+    """
+    if not data:
+        return data
+
+    serialized = dict(data)
+
+    if "labels" in data:
+        serialized["labels"] = _serialize_values(data["labels"], binary)
+
+    if isinstance(data.get("datasets"), list):
+        serialized["datasets"] = []
+        for dataset in data["datasets"]:
+            if isinstance(dataset, dict) and "data" in dataset:
+                dataset = dict(dataset)
+                dataset["data"] = _serialize_dataset_values(
+                    dataset["data"], binary
+                )
+            serialized["datasets"].append(dataset)
+
+    return serialized
+
+
+def _deserialize_values(values):
+    """
+    Rebuild a column of values received from JS.
+
+    Args:
+        values: A list or a binary representation of an array.
+
+    Returns:
+        The deserialized values.
+    """
+    if isinstance(values, dict) and "buffer" in values and "dtype" in values:
+        arr = np.frombuffer(values["buffer"], dtype=values["dtype"])
+        return arr.reshape(values["shape"])
+
+    return values
+
+
+def _deserialize_data(data: dict, widget) -> dict:
+    """
+    Deserialize the data of a chart received from JS.
+
+    Args:
+        data (dict): The data dictionary received from JS.
+
+        widget (ipychart.Chart): The chart being synced.
+
+    Returns:
+        dict: The data dictionary, binary buffers being rebuilt as numpy
+            arrays.
+    """
+    if not data:
+        return data
+
+    deserialized = dict(data)
+
+    if "labels" in data:
+        deserialized["labels"] = _deserialize_values(data["labels"])
+
+    if isinstance(data.get("datasets"), list):
+        deserialized["datasets"] = []
+        for dataset in data["datasets"]:
+            if isinstance(dataset, dict) and "data" in dataset:
+                dataset = dict(dataset)
+                values = dataset["data"]
+                if _is_point_columns(values):
+                    dataset["data"] = {
+                        k: _deserialize_values(v) for k, v in values.items()
+                    }
+                else:
+                    dataset["data"] = _deserialize_values(values)
+            deserialized["datasets"].append(dataset)
+
+    return deserialized
+
+
+data_serialization = dict(to_json=_serialize_data, from_json=_deserialize_data)
@@ -0,0 +1,200 @@
+import json
+import base64
+
+from pathlib import Path
+
+# Directory of the bundles of the offline HTML export, built by webpack
+STANDALONE_DIR = Path(__file__).resolve().parent.parent / "standalone"
+
+# Core bundle (Chart.js and the conversion code of ipychart)
+CORE_BUNDLE = "ipychart"
+
+# Plugin bundles, in the order they must be loaded
+PLUGIN_BUNDLES = ("time", "colorschemes", "datalabels", "zoom")
+
+# Scale types requiring a date adapter
+TIME_SCALES = frozenset(["time", "timeseries"])
+
+MSG_BUNDLE = (
+    "The bundle {} of the offline HTML export was not found. Build the "
+    "JavaScript of ipychart (`yarn run build:prod` in the js directory) or "
+    "reinstall ipychart."
+)
+
+STANDALONE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+{scripts}
+</head>
+<body>
+<div id="{element_id}" style="position: relative;"></div>
+<script>
+ipychart.render("{element_id}", {spec});
+</script>
+</body>
+</html>
+"""
+
+
+def _required_plugins(state: dict) -> list:
+    """
+    List the plugin bundles needed to draw a chart.
+
+    Args:
+        state (dict): The synced state of the chart.
+
+    Returns:
+        list: The names of the required plugin bundles, in loading order.
+    """
+    options = state.get("_options_sync") or {}
+    data = state.get("_data_sync") or {}
+    plugins = options.get("plugins") or {}
+    datasets = data.get("datasets") or []
+    scales = options.get("scales") or {}
+
+    required = set()
+
+    if state.get("_zoom_sync"):
+        required.add("zoom")
+
+    if "datalabels" in plugins or any(
+        isinstance(ds, dict) and "datalabels" in ds for ds in datasets
+    ):
+        required.add("datalabels")
+
+    if state.get("_colorscheme_sync") or "colorschemes" in plugins:
+        required.add("colorschemes")
+
+    if any(
+        isinstance(scale, dict) and scale.get("type") in TIME_SCALES
+        for scale in scales.values()
+    ):
+        required.add("time")
+
+    return [name for name in PLUGIN_BUNDLES if name in required]
+
+
+def _read_bundle(name: str) -> str:
+    """
+    Read a bundle of the offline HTML export.
+
+    Args:
+        name (str): The name of the bundle.
+
+    Returns:
+        str: The JavaScript code of the bundle.
+    """
+    path = STANDALONE_DIR / f"{name}.js"
+
+    if not path.is_file():
+        raise FileNotFoundError(MSG_BUNDLE.format(path))
+
+    return path.read_text(encoding="utf-8")
+
+
+def _inline_script(code: str) -> str:
+    """
+    Wrap JavaScript code into a script tag.
+
+    Args:
+        code (str): The JavaScript code.
+
+    Returns:
+        str: The script tag.
+    """
+    return (
+        "<script>\n" + code.replace("</script", "<\\/script") + "\n</script>"
+    )
+
+
+def _script_json(value) -> str:
+    """
+    Encode a value as JSON which can be inlined in a script tag.
+
+    Args:
+        value: A JSON serializable value.
+
+    Returns:
+        str: The JSON string.
+    """
+    return json.dumps(value, default=str).replace("</", "<\\/")
+
+
+def _encode_buffer(buffer) -> str:
+    """
+    Encode a binary buffer as a base64 string.
+
+    Args:
+        buffer: A bytes-like object.
+
+    Returns:
+        str: The base64 encoded buffer.
+    """
+    return base64.b64encode(memoryview(buffer).cast("B")).decode("ascii")
+
+
+def _standalone_spec(state: dict, buffer_paths: list, buffers: list) -> str:
+    """
+    Encode the state of a chart for the offline HTML export.
+
+    Binary buffers are base64 encoded and put back in place on the JS side.
+
+    Args:
+        state (dict): The synced state of the chart, without its buffers.
+
+        buffer_paths (list): The paths of the buffers in the state.
+
+        buffers (list): The binary buffers of the state.
+
+    Returns:
+        str: The JSON spec, safe to be inlined in a script tag.
+    """
+    spec = {
+        "state": state,
+        "buffer_paths": buffer_paths,
+        "buffers": [_encode_buffer(b) for b in buffers],
+    }
+
+    return _script_json(spec)
+
+
+def _standalone_html(
+    state: dict,
+    buffer_paths: list,
+    buffers: list,
+    element_id: str,
+    title: str = "ipychart",
+) -> str:
+    """
+    Build a self-contained HTML page drawing a chart.
+
+    The page inlines the core bundle, the plugin bundles used by the chart
+    and the state of the chart, so that it can be opened without network
+    access nor Jupyter.
+
+    Args:
+        state (dict): The synced state of the chart, without its buffers.
+
+        buffer_paths (list): The paths of the buffers in the state.
+
+        buffers (list): The binary buffers of the state.
+
+        element_id (str): The id of the element containing the chart.
+
+        title (str, optional): The title of the page. Defaults to
+            "ipychart".
+
+    Returns:
+        str: The HTML page.
+    """
+    bundles = [CORE_BUNDLE] + _required_plugins(state)
+    scripts = "\n".join(_inline_script(_read_bundle(b)) for b in bundles)
+
+    return STANDALONE_TEMPLATE.format(
+        title=title,
+        scripts=scripts,
+        element_id=element_id,
+        spec=_standalone_spec(state, buffer_paths, buffers),
+    )
@@ -0,0 +1,79 @@
+from collections import deque
+from typing import Union
+
+MSG_SOURCE = "The source of a stream must be an async iterable of records."
+
+MSG_RECORD = (
+    "Records of a stream must all be values (or points), or all be "
+    "(label, value) tuples."
+)
+
+MSG_FPS = "fps and max_lag must be positive numbers."
+
+
+class _StreamBuffer:
+    """
+    Records of a stream received since the last frame sent to the browser.
+
+    With a window, only the last window records are kept: older ones would
+    be dropped from the chart anyway.
+
+    Args:
+        window (int, optional): The number of points kept in the chart, or
+            None to keep all of them.
+    """
+
+    def __init__(self, window: Union[int, None] = None):
+        self.values = deque(maxlen=window)
+        self.labels = deque(maxlen=window)
+        self.labelled = None
+        self.records = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, record):
+        """
+        Buffer a record.
+
+        Args:
+            record: A value (or a point), or a (label, value) tuple.
+
+        Raises:
+            ValueError: If the record does not have the format of the
+                previous ones.
+        """
+        labelled = isinstance(record, tuple)
+
+        if labelled and len(record) != 2:
+            raise ValueError(MSG_RECORD)
+        if self.labelled is None:
+            self.labelled = labelled
+        elif labelled != self.labelled:
+            raise ValueError(MSG_RECORD)
+
+        if len(self.values) == self.values.maxlen:
+            self.dropped += 1
+
+        if labelled:
+            label, record = record
+            self.labels.append(label)
+
+        self.values.append(record)
+        self.records += 1
+
+    def pop(self) -> tuple:
+        """
+        Take all the buffered records.
+
+        Returns:
+            tuple: The values, and the labels (None if records have no
+                label).
+        """
+        values = list(self.values)
+        labels = list(self.labels) if self.labelled else None
+        self.values.clear()
+        self.labels.clear()
+
+        return values, labels
@@ -0,0 +1,165 @@
+import operator
+import numpy as np
+
+from typing import Union
+from itertools import repeat
+
+from .serialization import _is_array_like, _is_point_columns
+
+VALIDATION_MODES = ["full", "fast", "off"]
+
+MSG_VALIDATE = "Chart validation mode must be one of : full, fast, off."
+
+# Top-level keys of the "options" argument accepted by a chart
+ALLOWED_OPTIONS = frozenset(
+    [
+        "legend",
+        "title",
+        "scales",
+        "layout",
+        "animation",
+        "hover",
+        "plugins",
+        "legendCallback",
+        "indexAxis",
+        "aspectRatio",
+        "maintainAspectRatio",
+    ]
+)
+
+# Keys required in each point of the datasets of point charts
+POINT_KEYS = {"scatter": ("x", "y"), "bubble": ("x", "y", "r")}
+
+# Numpy dtype kinds which can not be drawn (strings, bytes and void)
+_INVALID_DTYPE_KINDS = frozenset("SUV")
+
+# Types of the items of lists which can not be modified in place
+_IMMUTABLE_ITEMS = (int, float, complex, str, bytes, type(None), np.generic)
+
+
+def _column_length(values) -> Union[int, None]:
+    """
+    Get the length of a column of values, without iterating over it.
+
+    Args:
+        values: A list, a tuple, a numpy array or a pandas object.
+
+    Returns:
+        int: The length of the column, or None if values are not a valid
+            one dimensional column of values.
+    """
+    if isinstance(values, (list, tuple)):
+        return len(values)
+
+    if _is_array_like(values):
+        shape = getattr(values, "shape", None)
+        kind = getattr(getattr(values, "dtype", None), "kind", "O")
+        if shape is None or len(shape) != 1:
+            return None
+        if kind in _INVALID_DTYPE_KINDS:
+            return None
+        return shape[0]
+
+    return None
+
+
+def _is_point(point, keys: tuple) -> bool:
+    """
+    Check if a point has all the required coordinates.
+
+    Args:
+        point: A {x, y[, r]} dictionary or a [x, y[, r]] list.
+
+        keys (tuple): The required coordinates.
+
+    Returns:
+        bool: True if the point is valid.
+    """
+    if isinstance(point, dict):
+        return all(k in point for k in keys)
+
+    return isinstance(point, (list, tuple)) and len(point) >= len(keys)
+
+
+def _valid_points(values, keys: tuple) -> bool:
+    """
+    Check the data of a dataset made of points (scatter and bubble charts).
+
+    Columns backed by numpy arrays are checked by dtype and shape only.
+
+    Args:
+        values: The "data" entry of the dataset.
+
+        keys (tuple): The required coordinates of each point.
+
+    Returns:
+        bool: True if the data is valid.
+    """
+    if isinstance(values, dict):
+        if not _is_point_columns(values) or not all(k in values for k in keys):
+            return False
+        lengths = {_column_length(v) for v in values.values()}
+        return None not in lengths and len(lengths) == 1
+
+    if _is_array_like(values):
+        shape = getattr(values, "shape", None)
+        return shape is not None and len(shape) == 2 and shape[1] >= len(keys)
+
+    if isinstance(values, (list, tuple)):
+        if set(map(type, values)) == {dict}:
+            # Lists of {x, y[, r]} dictionaries are checked in C
+            required = set(keys)
+            return all(
+                map(operator.ge, map(dict.keys, values), repeat(required))
+            )
+        return all(_is_point(p, keys) for p in values)
+
+    return False
+
+
+def _has_immutable_items(values: list) -> bool:
+    """
+    Check if the items of a list can not be modified in place, so that
+    comparing the list with a shallow copy detects all its changes.
+
+    Args:
+        values (list): The values of a dataset.
+
+    Returns:
+        bool: True if all items are numbers, strings or None (or tuples of
+            them).
+    """
+    for item_type in set(map(type, values)):
+        if issubclass(item_type, tuple):
+            continue
+        if not issubclass(item_type, _IMMUTABLE_ITEMS):
+            return False
+
+    return all(
+        isinstance(v, _IMMUTABLE_ITEMS)
+        for item in values
+        if isinstance(item, tuple)
+        for v in item
+    )
+
+
+def _valid_values(values) -> bool:
+    """
+    Check the data of a dataset whose values share the labels of the chart.
+
+    Args:
+        values: The "data" entry of the dataset.
+
+    Returns:
+        bool: True if the data is valid.
+    """
+    if isinstance(values, (list, tuple)):
+        return True
+
+    if isinstance(values, dict):
+        if _is_point_columns(values):
+            lengths = {_column_length(v) for v in values.values()}
+            return None not in lengths and len(lengths) == 1
+        return True
+
+    return _column_length(values) is not None
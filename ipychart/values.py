@@ -488,3 +488,17 @@ COLORSCHEMES = [
     "tableau.ClassicRedWhiteGreenLight11",
     "tableau.ClassicRedGreenLight11",
 ]
+
+# Default colors of the datasets when no colorscheme is provided
+DEFAULT_COLORS = [
+    (54, 163, 235),
+    (254, 119, 124),
+    (255, 206, 87),
+    (11, 255, 238),
+    (153, 102, 255),
+    (255, 159, 64),
+    (5, 169, 69),
+    (230, 120, 199),
+    (35, 120, 206),
+    (211, 216, 214),
+]
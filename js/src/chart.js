@@ -9,6 +9,10 @@ import 'chartjs-adapter-moment';
 // Local imports
 import colorschemes from './colorschemes/index';
 import ColorSchemesPlugin from './plugin.colorschemes';
+import { deserializeData, deserializeValues, serializeData } from './serializers';
+import { convertInputData, convertInputOptions } from './convert';
+import { applyDelta } from './deltas';
+import { createPanels } from './panels';
 import version from './version';
 
 // Register plugins
@@ -20,6 +24,53 @@ Chart.register(ChartDataLabels);
 // Make sure we have a global Chart object
 window.Chart = Chart;
 
+// Duration of the deserialization of each data object received from Python
+const deserializeTimings = new WeakMap();
+
+function timedDeserializeData(data, manager) {
+    const start = performance.now();
+    const deserialized = deserializeData(data, manager);
+    const record = (result) => {
+        if (_.isObject(result)) {
+            deserializeTimings.set(result, performance.now() - start);
+        }
+        return result;
+    };
+    // Compressed data (HTML exports) are decoded asynchronously
+    if (deserialized instanceof Promise) {
+        return deserialized.then(record);
+    }
+    return record(deserialized);
+}
+
+function countPoints(data) {
+    return _.sumBy(data.datasets, (dataset) => _.size(dataset.data));
+}
+
+// Plugin sending the timings of a render to Python, once the chart is drawn
+// for the first time. chartStart is recorded before the chart is created.
+function renderStatsPlugin(view, stats, start, chartStart) {
+    return {
+        id: 'ipychartRenderStats',
+        afterRender: () => {
+            if (stats.first_paint !== undefined) {
+                return;
+            }
+            const now = performance.now();
+            if (stats.chart === undefined) {
+                // Drawn synchronously (without animation), while the chart
+                // was created: the first paint is part of its creation
+                stats.chart = now - chartStart;
+                stats.first_paint = 0;
+            } else {
+                stats.first_paint = Math.max(now - chartStart - stats.chart, 0);
+            }
+            stats.total = now - start + (stats.deserialize || 0);
+            view.send({ method: 'rendered', stats: { ...stats } });
+        },
+    };
+}
+
 // Define the widget model.
 const ChartModel = widgets.DOMWidgetModel.extend({
     defaults: _.extend(widgets.DOMWidgetModel.prototype.defaults(), {
@@ -30,160 +81,57 @@ const ChartModel = widgets.DOMWidgetModel.extend({
         _model_module_version: `^${version}`,
         _view_module_version: `^${version}`,
     }),
-});
-
-// Define the widget view.
-const ChartView = widgets.DOMWidgetView.extend({
-    convert_input_data(data, options) {
-        // Set datalabels default options
-        _.forEach(data.datasets, (dataset, i) => {
-            // If datalabels options are not provided, hide datalabels by default in each dataset.
-            // If datalabels options are provided, set automatic coloring based on colorscheme or
-            // dataset color when borderwidth is != 0
-
-            if (!_.has(dataset, 'datalabels')) {
-                _.set(dataset, 'datalabels', { display: false });
-            } else if (_.has(options, ['plugins', 'colorschemes', 'scheme'])) {
-                const color = _.get(Chart.colorschemes, options.plugins.colorschemes.scheme)[i];
-                if (_.has(dataset.datalabels, 'borderWidth')) {
-                    if (!_.has(dataset.datalabels, 'backgroundColor')) {
-                        _.set(dataset.datalabels, 'backgroundColor', color);
-                    }
-                    if (!_.has(dataset.datalabels, 'borderColor')) {
-                        _.set(dataset.datalabels, 'borderColor', color);
-                    }
-                }
-            } else {
-                if (!_.has(dataset.datalabels, 'backgroundColor')) {
-                    _.set(dataset.datalabels, 'backgroundColor', dataset.backgroundColor);
-                }
-                if (!_.has(dataset.datalabels, 'borderColor')) {
-                    _.set(dataset.datalabels, 'borderColor', dataset.borderColor);
-                }
-            }
-        });
 
-        return data;
+    initialize(...args) {
+        widgets.DOMWidgetModel.prototype.initialize.apply(this, args);
+        this.on('msg:custom', this.handle_custom_message, this);
     },
 
-    convert_input_options(options, colorscheme, zoom) {
-        // All paths of options dictionary with callback functions
-        const callbackOptionsPaths = [
-            ['onHover'],
-            ['onClick'],
-            ['onResize'],
-            ['plugins', 'tooltip', 'custom'],
-            ['plugins', 'tooltip', 'external'],
-            ['plugins', 'tooltip', 'itemSort'],
-            ['plugins', 'tooltip', 'filter'],
-            ['plugins', 'tooltip', 'callbacks', 'beforeTitle'],
-            ['plugins', 'tooltip', 'callbacks', 'title'],
-            ['plugins', 'tooltip', 'callbacks', 'afterTitle'],
-            ['plugins', 'tooltip', 'callbacks', 'beforeBody'],
-            ['plugins', 'tooltip', 'callbacks', 'beforeLabel'],
-            ['plugins', 'tooltip', 'callbacks', 'label'],
-            ['plugins', 'tooltip', 'callbacks', 'labelColor'],
-            ['plugins', 'tooltip', 'callbacks', 'labelTextColor'],
-            ['plugins', 'tooltip', 'callbacks', 'labelPointStyle'],
-            ['plugins', 'tooltip', 'callbacks', 'afterLabel'],
-            ['plugins', 'tooltip', 'callbacks', 'afterBody'],
-            ['plugins', 'tooltip', 'callbacks', 'beforeFooter'],
-            ['plugins', 'tooltip', 'callbacks', 'footer'],
-            ['plugins', 'tooltip', 'callbacks', 'afterFooter'],
-            ['plugins', 'legend', 'onClick'],
-            ['plugins', 'legend', 'onHover'],
-            ['plugins', 'legend', 'onLeave'],
-            ['plugins', 'legend', 'labels', 'generateLabels'],
-            ['plugins', 'legend', 'labels', 'filter'],
-            ['plugins', 'legend', 'labels', 'sort'],
-            ['animations', 'onProgress'],
-            ['animations', 'onComplete '],
-            ['scale', 'pointLabels', 'callback'],
-            ['scale', 'ticks', 'callback'],
-            ['scale', 'ticks', 'minor', 'callback'],
-            ['scale', 'ticks', 'major', 'callback'],
-            ['plugins', 'datalabels', 'formatter'],
-        ];
-
-        // These paths must be handled for all scales
-        // i.e. all entries contained in options.scales
-        const callbackScalesPaths = [
-            ['ticks', 'callback'],
-            ['pointLabels', 'callback'],
-            ['beforeUpdate'],
-            ['beforeSetDimensions'],
-            ['afterSetDimensions'],
-            ['beforeDataLimits'],
-            ['afterDataLimits'],
-            ['beforeBuildTicks'],
-            ['afterBuildTicks'],
-            ['beforeTickToLabelConversion'],
-            ['afterTickToLabelConversion'],
-            ['beforeCalculateTickRotation'],
-            ['afterCalculateTickRotation'],
-            ['beforeFit'],
-            ['afterFit'],
-            ['afterUpdate'],
-        ];
-
-        // Convert strings containing callback functions to real JS functions for all paths
-        _.forEach(callbackOptionsPaths, (callbackPath) => {
-            if (_.has(options, callbackPath)) {
-                _.set(
-                    options,
-                    callbackPath,
-                    new Function(`return ${_.get(options, callbackPath)}`)(),
-                );
+    handle_custom_message(content, buffers) {
+        if (content.method === 'append' || content.method === 'update') {
+            const start = performance.now();
+            widgets.put_buffers(content, content.buffer_paths, buffers);
+            const delta = {
+                ...content,
+                data: deserializeValues(content.data),
+                labels: deserializeValues(content.labels),
+            };
+            if (_.isNil(content.labels)) {
+                delete delta.labels;
+            } else if (ArrayBuffer.isView(delta.labels)) {
+                delta.labels = Array.from(delta.labels);
             }
-        });
 
-        // Convert strings containing this.callback functions to real JS functions for scales paths
-        _.forEach(options.scales, (scale) => {
-            _.forEach(callbackScalesPaths, (callbackPath) => {
-                if (_.has(scale, callbackPath)) {
-                    _.set(
-                        scale,
-                        callbackPath,
-                        new Function(`return ${_.get(scale, callbackPath)}`)(),
-                    );
-                }
-            });
-        });
-
-        // Set colorscheme options if not None
-        if (colorscheme) {
-            options = _.merge(
-                { plugins: { colorschemes: { scheme: colorscheme, override: true } } },
-                options,
-            );
+            // The data of the model are updated in place (they are shared
+            // with the Chart.js instances of the views), views only redraw
+            applyDelta(this.get('_data_sync'), delta);
+            this.trigger('data:delta', delta, performance.now() - start);
         }
+    },
+}, {
+    serializers: _.extend({
+        _data_sync: { deserialize: timedDeserializeData, serialize: serializeData },
+    }, widgets.DOMWidgetModel.serializers),
+});
 
-        // Set zoom options
-        options = _.merge(
-            {
-                plugins: {
-                    zoom: {
-                        zoom: {
-                            wheel: { enabled: false },
-                            pinch: { enabled: false },
-                            drag: { enabled: zoom },
-                        },
-                        pan: { enabled: false },
-                    },
-                },
-            },
-            options,
-        );
-
-        // Set aspect ratio
-        if (!_.has(options, 'aspectRatio')) {
-            options = _.merge({ aspectRatio: 2 }, options);
-        }
+// Define the widget view.
+const ChartView = widgets.DOMWidgetView.extend({
+    convert_input_data(data, options) {
+        return convertInputData(data, options);
+    },
 
-        return options;
+    convert_input_options(options, colorscheme, zoom) {
+        return convertInputOptions(options, colorscheme, zoom);
     },
 
     render() {
+        const start = performance.now();
+        const rawData = this.model.get('_data_sync');
+        const stats = {
+            method: this.chart ? 'update' : 'render',
+            deserialize: deserializeTimings.get(rawData) || 0,
+        };
+
         // Get data and type from python
         this.input = document.createElement('input');
         this.input.colorscheme = this.model.get('_colorscheme_sync');
@@ -194,14 +142,16 @@ const ChartView = widgets.DOMWidgetView.extend({
             this.input.colorscheme,
             this.input.zoom,
         );
-        this.input.data = this.convert_input_data(this.model.get('_data_sync'), this.input.options);
+        stats.convert_options = performance.now() - start;
+
+        this.input.data = this.convert_input_data(rawData, this.input.options);
         this.input.kind = this.model.get('_kind_sync');
+        stats.convert_data = performance.now() - start - stats.convert_options;
+        stats.points = countPoints(this.input.data);
 
-        console.log('Chart data:', this.input.data);
-        console.log('Chart options:', this.input.options);
-        console.log('Chart type:', this.input.kind);
-        console.log('Chart colorscheme:', this.input.colorscheme);
-        console.log('Chart zoom:', this.input.zoom);
+        // Send timings to Python once the chart is drawn for the first time
+        const chartStart = performance.now();
+        const renderStats = renderStatsPlugin(this, stats, start, chartStart);
 
         // Create Chart.js HTML element
         if (!this.chart) {
@@ -213,7 +163,9 @@ const ChartView = widgets.DOMWidgetView.extend({
                 type: this.input.kind,
                 data: this.input.data,
                 options: this.input.options,
+                plugins: [renderStats],
             });
+            stats.chart = performance.now() - chartStart;
 
             if (this.input.zoom === true) {
                 this.chart.canvas.ondblclick = function resetzoom() {
@@ -225,14 +177,11 @@ const ChartView = widgets.DOMWidgetView.extend({
             if (!this.el.canvas) {
                 this.el.appendChild(this.canvas);
             }
-            console.log('Chart created');
 
             // Python -> JavaScript update
-            this.model.on('change:_data_sync', this.data_changed, this);
-            this.model.on('change:_options_sync', this.options_changed, this);
-            this.model.on('change:_kind_sync', this.kind_changed, this);
-            this.model.on('change:_colorscheme_sync', this.colorscheme_changed, this);
-            this.model.on('change:_zoom_sync', this.zoom_changed, this);
+            // All attributes updated by a single message trigger one render
+            this.model.on('change', this.state_changed, this);
+            this.model.on('data:delta', this.data_delta, this);
 
             // JavaScript -> Python update
             this.input.onchange = this.input_changed.bind(this);
@@ -243,48 +192,212 @@ const ChartView = widgets.DOMWidgetView.extend({
                 type: this.input.kind,
                 data: this.input.data,
                 options: this.input.options,
+                plugins: [renderStats],
             });
+            stats.chart = performance.now() - chartStart;
 
             if (this.input.zoom === true) {
                 this.chart.canvas.ondblclick = function resetzoom() {
                     this.chart.resetZoom();
                 }.bind(this);
             }
+        }
+    },
+
+    // Attributes whose changes are drawn by the view
+    synced_attributes: [
+        '_data_sync',
+        '_options_sync',
+        '_kind_sync',
+        '_colorscheme_sync',
+        '_zoom_sync',
+    ],
 
-            console.log('Chart udpated');
+    data_delta(delta, deserialize) {
+        // Deltas received before the next frame are drawn once
+        const pending = _.get(this.pendingDelta, 'deserialize', 0);
+        this.pendingDelta = {
+            method: delta.method,
+            deserialize: deserialize + pending,
+        };
+        if (!this.deltaFrame) {
+            this.deltaFrame = requestAnimationFrame(() => this.draw_deltas());
         }
     },
 
-    data_changed() {
-        this.input.data = this.model.get('_data_sync');
-        this.render();
+    draw_deltas() {
+        const { method, deserialize } = this.pendingDelta;
+        this.pendingDelta = null;
+        this.deltaFrame = null;
+
+        // Redraw the existing chart without animation nor recreation
+        const start = performance.now();
+        this.redraw('none');
+        const chart = performance.now() - start;
+
+        this.send({
+            method: 'rendered',
+            stats: {
+                method,
+                deserialize,
+                chart,
+                points: countPoints(this.model.get('_data_sync')),
+                total: deserialize + chart,
+            },
+        });
     },
-    options_changed() {
-        this.input.options = this.model.get('_options_sync');
-        this.render();
+
+    redraw(mode) {
+        this.chart.update(mode);
     },
-    kind_changed() {
-        this.input.kind = this.model.get('_kind_sync');
-        this.render();
+
+    destroy_charts() {
+        if (this.chart) {
+            this.chart.destroy();
+        }
     },
-    colorscheme_changed() {
-        this.input.colorscheme = this.model.get('_colorscheme_sync');
-        this.render();
+
+    state_changed() {
+        const changed = _.filter(
+            this.synced_attributes,
+            (key) => this.model.hasChanged(key),
+        );
+        if (_.isEmpty(changed)) {
+            return;
+        }
+
+        // Changes received before the next frame are drawn once
+        this.pendingChanges = _.union(this.pendingChanges, changed);
+        if (!this.changeFrame) {
+            this.changeFrame = requestAnimationFrame(() => this.draw_changes());
+        }
     },
-    zoom_changed() {
-        this.input.zoom = this.model.get('_zoom');
-        this.render();
+
+    draw_changes() {
+        const changed = this.pendingChanges;
+        this.pendingChanges = [];
+        this.changeFrame = null;
+
+        if (_.isEqual(changed, ['_data_sync'])) {
+            this.update_data();
+        } else {
+            this.render();
+        }
+    },
+
+    update_data() {
+        // Only the data changed: the existing Chart.js instance is updated,
+        // options and callbacks are kept
+        const start = performance.now();
+        const rawData = this.model.get('_data_sync');
+        const stats = {
+            method: 'update',
+            deserialize: deserializeTimings.get(rawData) || 0,
+            convert_options: 0,
+        };
+
+        this.input.data = this.convert_input_data(rawData, this.input.options);
+        stats.convert_data = performance.now() - start;
+        stats.points = countPoints(this.input.data);
+
+        const chartStart = performance.now();
+        this.chart.data = this.input.data;
+        this.chart.update();
+        stats.chart = performance.now() - chartStart;
+        stats.total = performance.now() - start + stats.deserialize;
+
+        this.send({ method: 'rendered', stats });
+    },
+
+    remove(...args) {
+        cancelAnimationFrame(this.changeFrame);
+        cancelAnimationFrame(this.deltaFrame);
+        this.destroy_charts();
+        widgets.DOMWidgetView.prototype.remove.apply(this, args);
     },
 
     input_changed() {
-        this.model.set('_data_sync', this.input.data);
-        this.model.set('_options_sync', this.input.options);
-        this.model.set('_kind_sync', this.input.kind);
-        this.model.set('_colorscheme_sync', this.input.colorscheme);
-        this.model.set('_zoom_sync', this.input.zoom);
+        // A single set call triggers a single render
+        this.model.set({
+            _data_sync: this.input.data,
+            _options_sync: this.input.options,
+            _kind_sync: this.input.kind,
+            _colorscheme_sync: this.input.colorscheme,
+            _zoom_sync: this.input.zoom,
+        });
         this.model.save_changes();
+    },
+});
+
+// Grid of charts (facetplot), drawn by a single widget
+const ChartGridModel = ChartModel.extend({
+    defaults: _.extend(ChartModel.prototype.defaults(), {
+        _model_name: 'ChartGridModel',
+        _view_name: 'ChartGridView',
+    }),
+});
+
+const ChartGridView = ChartView.extend({
+    render() {
+        const start = performance.now();
+        const rawData = this.model.get('_data_sync');
+        const stats = {
+            method: this.charts ? 'update' : 'render',
+            deserialize: deserializeTimings.get(rawData) || 0,
+        };
+
+        // A single options object is converted for all the panels
+        const zoom = this.model.get('_zoom_sync');
+        const options = this.convert_input_options(
+            this.model.get('_options_sync'),
+            this.model.get('_colorscheme_sync'),
+            zoom,
+        );
+        stats.convert_options = performance.now() - start;
+
+        const data = this.convert_input_data(rawData, options);
+        stats.convert_data = performance.now() - start - stats.convert_options;
+        stats.points = countPoints(data);
+
+        if (this.charts) {
+            _.forEach(this.charts, (chart) => chart.destroy());
+            this.el.replaceChildren();
+        } else {
+            this.model.on('change', this.state_changed, this);
+            this.model.on('data:delta', this.data_delta, this);
+        }
+
+        const chartStart = performance.now();
+        this.charts = createPanels(
+            this.el,
+            this.model.get('_kind_sync'),
+            data,
+            options,
+            this.model.get('_panels_sync'),
+            zoom,
+            [renderStatsPlugin(this, stats, start, chartStart)],
+        );
+        stats.chart = performance.now() - chartStart;
+    },
+
+    synced_attributes: [
+        ...ChartView.prototype.synced_attributes,
+        '_panels_sync',
+    ],
+
+    redraw(mode) {
+        // Datasets and labels of the panels are updated in place
+        _.forEach(this.charts, (chart) => chart.update(mode));
+    },
+
+    destroy_charts() {
+        _.forEach(this.charts, (chart) => chart.destroy());
+    },
+
+    update_data() {
+        // Panels slice the datasets, they are created again
         this.render();
     },
 });
 
-export { ChartModel, ChartView };
+export { ChartModel, ChartView, ChartGridModel, ChartGridView };
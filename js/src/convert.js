@@ -0,0 +1,162 @@
+// Conversion of the data and options received from Python to the format
+// expected by Chart.js, shared by the widget view and the standalone export
+import Chart from 'chart.js/auto';
+import _ from 'lodash';
+
+import { isPointColumns, zipPointColumns } from './serializers';
+
+function convertInputData(data, options) {
+    // Set datalabels default options
+    _.forEach(data.datasets, (dataset, i) => {
+        // Zip parallel x/y/r columns (scatter and bubble charts) into points
+        if (isPointColumns(dataset.data)) {
+            dataset.data = zipPointColumns(dataset.data);
+        }
+
+        // If datalabels options are not provided, hide datalabels by default in each dataset.
+        // If datalabels options are provided, set automatic coloring based on colorscheme or
+        // dataset color when borderwidth is != 0
+
+        if (!_.has(dataset, 'datalabels')) {
+            _.set(dataset, 'datalabels', { display: false });
+        } else if (_.has(options, ['plugins', 'colorschemes', 'scheme'])) {
+            const color = _.get(Chart.colorschemes, options.plugins.colorschemes.scheme)[i];
+            if (_.has(dataset.datalabels, 'borderWidth')) {
+                if (!_.has(dataset.datalabels, 'backgroundColor')) {
+                    _.set(dataset.datalabels, 'backgroundColor', color);
+                }
+                if (!_.has(dataset.datalabels, 'borderColor')) {
+                    _.set(dataset.datalabels, 'borderColor', color);
+                }
+            }
+        } else {
+            if (!_.has(dataset.datalabels, 'backgroundColor')) {
+                _.set(dataset.datalabels, 'backgroundColor', dataset.backgroundColor);
+            }
+            if (!_.has(dataset.datalabels, 'borderColor')) {
+                _.set(dataset.datalabels, 'borderColor', dataset.borderColor);
+            }
+        }
+    });
+
+    return data;
+}
+
+function convertInputOptions(options, colorscheme, zoom) {
+    // All paths of options dictionary with callback functions
+    const callbackOptionsPaths = [
+        ['onHover'],
+        ['onClick'],
+        ['onResize'],
+        ['plugins', 'tooltip', 'custom'],
+        ['plugins', 'tooltip', 'external'],
+        ['plugins', 'tooltip', 'itemSort'],
+        ['plugins', 'tooltip', 'filter'],
+        ['plugins', 'tooltip', 'callbacks', 'beforeTitle'],
+        ['plugins', 'tooltip', 'callbacks', 'title'],
+        ['plugins', 'tooltip', 'callbacks', 'afterTitle'],
+        ['plugins', 'tooltip', 'callbacks', 'beforeBody'],
+        ['plugins', 'tooltip', 'callbacks', 'beforeLabel'],
+        ['plugins', 'tooltip', 'callbacks', 'label'],
+        ['plugins', 'tooltip', 'callbacks', 'labelColor'],
+        ['plugins', 'tooltip', 'callbacks', 'labelTextColor'],
+        ['plugins', 'tooltip', 'callbacks', 'labelPointStyle'],
+        ['plugins', 'tooltip', 'callbacks', 'afterLabel'],
+        ['plugins', 'tooltip', 'callbacks', 'afterBody'],
+        ['plugins', 'tooltip', 'callbacks', 'beforeFooter'],
+        ['plugins', 'tooltip', 'callbacks', 'footer'],
+        ['plugins', 'tooltip', 'callbacks', 'afterFooter'],
+        ['plugins', 'legend', 'onClick'],
+        ['plugins', 'legend', 'onHover'],
+        ['plugins', 'legend', 'onLeave'],
+        ['plugins', 'legend', 'labels', 'generateLabels'],
+        ['plugins', 'legend', 'labels', 'filter'],
+        ['plugins', 'legend', 'labels', 'sort'],
+        ['animations', 'onProgress'],
+        ['animations', 'onComplete '],
+        ['scale', 'pointLabels', 'callback'],
+        ['scale', 'ticks', 'callback'],
+        ['scale', 'ticks', 'minor', 'callback'],
+        ['scale', 'ticks', 'major', 'callback'],
+        ['plugins', 'datalabels', 'formatter'],
+    ];
+
+    // These paths must be handled for all scales
+    // i.e. all entries contained in options.scales
+    const callbackScalesPaths = [
+        ['ticks', 'callback'],
+        ['pointLabels', 'callback'],
+        ['beforeUpdate'],
+        ['beforeSetDimensions'],
+        ['afterSetDimensions'],
+        ['beforeDataLimits'],
+        ['afterDataLimits'],
+        ['beforeBuildTicks'],
+        ['afterBuildTicks'],
+        ['beforeTickToLabelConversion'],
+        ['afterTickToLabelConversion'],
+        ['beforeCalculateTickRotation'],
+        ['afterCalculateTickRotation'],
+        ['beforeFit'],
+        ['afterFit'],
+        ['afterUpdate'],
+    ];
+
+    // Convert strings containing callback functions to real JS functions for all paths
+    _.forEach(callbackOptionsPaths, (callbackPath) => {
+        if (_.has(options, callbackPath)) {
+            _.set(
+                options,
+                callbackPath,
+                new Function(`return ${_.get(options, callbackPath)}`)(),
+            );
+        }
+    });
+
+    // Convert strings containing this.callback functions to real JS functions for scales paths
+    _.forEach(options.scales, (scale) => {
+        _.forEach(callbackScalesPaths, (callbackPath) => {
+            if (_.has(scale, callbackPath)) {
+                _.set(
+                    scale,
+                    callbackPath,
+                    new Function(`return ${_.get(scale, callbackPath)}`)(),
+                );
+            }
+        });
+    });
+
+    // Set colorscheme options if not None
+    if (colorscheme) {
+        options = _.merge(
+            { plugins: { colorschemes: { scheme: colorscheme, override: true } } },
+            options,
+        );
+    }
+
+    // Set zoom options
+    options = _.merge(
+        {
+            plugins: {
+                zoom: {
+                    zoom: {
+                        wheel: { enabled: false },
+                        pinch: { enabled: false },
+                        drag: { enabled: zoom },
+                    },
+                    pan: { enabled: false },
+                },
+            },
+        },
+        options,
+    );
+
+    // Set aspect ratio
+    if (!_.has(options, 'aspectRatio')) {
+        options = _.merge({ aspectRatio: 2 }, options);
+    }
+
+    return options;
+}
+
+export { convertInputData, convertInputOptions };
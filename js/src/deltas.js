@@ -0,0 +1,64 @@
+import _ from 'lodash';
+
+import { isPointColumns, zipPointColumns } from './serializers';
+
+function concatValues(target, values, maxLen) {
+    // TypedArrays have a fixed size, a new one is built
+    if (ArrayBuffer.isView(target)) {
+        const total = target.length + values.length;
+        const start = maxLen ? Math.max(0, total - maxLen) : 0;
+        const result = new target.constructor(total - start);
+
+        if (start < target.length) {
+            result.set(target.subarray(start), 0);
+            result.set(values, target.length - start);
+        } else {
+            result.set(_.slice(values, start - target.length), 0);
+        }
+        return result;
+    }
+
+    // Arrays are updated in place: Chart.js listens to push and splice calls
+    for (let i = 0; i < values.length; i += 1) {
+        target.push(values[i]);
+    }
+    if (maxLen && target.length > maxLen) {
+        target.splice(0, target.length - maxLen);
+    }
+    return target;
+}
+
+function appendDatasetValues(dataset, values, maxLen) {
+    if (isPointColumns(dataset.data)) {
+        // Data not rendered yet: still stored as parallel point columns
+        const columns = isPointColumns(values)
+            ? values
+            : _.fromPairs(_.map(_.keys(dataset.data), (k) => [k, _.map(values, k)]));
+        _.forEach(_.keys(dataset.data), (key) => {
+            dataset.data[key] = concatValues(dataset.data[key], columns[key], maxLen);
+        });
+    } else {
+        const points = isPointColumns(values) ? zipPointColumns(values) : values;
+        dataset.data = concatValues(dataset.data, points, maxLen);
+    }
+}
+
+function applyDelta(data, delta) {
+    // Apply a partial update sent by Python on the data of a chart
+    const dataset = data.datasets[delta.index];
+
+    if (delta.method === 'append') {
+        appendDatasetValues(dataset, delta.data, delta.max_len);
+        if (_.has(delta, 'labels')) {
+            data.labels = concatValues(data.labels || [], delta.labels, delta.labels_max_len);
+        }
+    } else if (delta.method === 'update') {
+        dataset.data = delta.data;
+        // Default colors computed again for the new values
+        _.assign(dataset, delta.style);
+    }
+
+    return data;
+}
+
+export { applyDelta, concatValues };
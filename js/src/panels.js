@@ -0,0 +1,48 @@
+// Grid of small multiples (facetplot), shared by the widget view and the
+// standalone export. All panels share the labels array and the options
+// object of the grid, each one draws its own slice of the datasets.
+import Chart from 'chart.js/auto';
+import _ from 'lodash';
+
+function createPanels(container, kind, data, options, panels, zoom, plugins = []) {
+    const grid = document.createElement('div');
+    grid.style.display = 'grid';
+    grid.style.gridTemplateColumns = `repeat(${panels.columns}, minmax(0, 1fr))`;
+    container.appendChild(grid);
+
+    const last = panels.titles.length - 1;
+
+    return _.map(panels.titles, (title, i) => {
+        const cell = document.createElement('div');
+        cell.style.position = 'relative';
+
+        const header = document.createElement('div');
+        header.textContent = title;
+        header.style.textAlign = 'center';
+        header.style.fontWeight = 'bold';
+
+        const canvas = document.createElement('canvas');
+        cell.appendChild(header);
+        cell.appendChild(canvas);
+        grid.appendChild(cell);
+
+        const chart = new Chart(canvas.getContext('2d'), {
+            type: kind,
+            data: {
+                labels: data.labels,
+                datasets: data.datasets.slice(i * panels.datasets, (i + 1) * panels.datasets),
+            },
+            options,
+            // Plugins (e.g. render timings) only run on the last panel
+            plugins: i === last ? plugins : [],
+        });
+
+        if (zoom === true && chart.resetZoom) {
+            canvas.ondblclick = () => chart.resetZoom();
+        }
+
+        return chart;
+    });
+}
+
+export { createPanels };
@@ -0,0 +1,203 @@
+import _ from 'lodash';
+
+// TypedArray constructors for each dtype sent by Python
+const TYPED_ARRAYS = {
+    int8: Int8Array,
+    uint8: Uint8Array,
+    int16: Int16Array,
+    uint16: Uint16Array,
+    int32: Int32Array,
+    uint32: Uint32Array,
+    float32: Float32Array,
+    float64: Float64Array,
+};
+
+// Keys of a dataset data object holding parallel point columns
+const POINT_COLUMNS = ['x', 'y', 'r'];
+
+function isEncodedArray(value) {
+    return _.isPlainObject(value) && _.has(value, 'dtype') && value.buffer instanceof DataView;
+}
+
+function isPointColumns(value) {
+    return (
+        _.isPlainObject(value)
+        && _.has(value, 'x')
+        && _.has(value, 'y')
+        && _.every(_.keys(value), (key) => POINT_COLUMNS.includes(key))
+    );
+}
+
+function decodeArray(value) {
+    const TypedArray = TYPED_ARRAYS[value.dtype];
+    const view = value.buffer;
+
+    // TypedArrays must be aligned on their element size, copy otherwise
+    if (view.byteOffset % TypedArray.BYTES_PER_ELEMENT !== 0) {
+        const buffer = view.buffer.slice(view.byteOffset, view.byteOffset + view.byteLength);
+        return new TypedArray(buffer);
+    }
+
+    return new TypedArray(
+        view.buffer,
+        view.byteOffset,
+        view.byteLength / TypedArray.BYTES_PER_ELEMENT,
+    );
+}
+
+function decodeValues(value) {
+    return isEncodedArray(value) ? decodeArray(value) : value;
+}
+
+function isCompressedArray(value) {
+    return isEncodedArray(value) && _.has(value, 'encoding');
+}
+
+async function inflate(view) {
+    const stream = new Blob([view]).stream().pipeThrough(new DecompressionStream('deflate'));
+    return new Uint8Array(await new Response(stream).arrayBuffer());
+}
+
+function unshuffle(bytes, itemSize) {
+    // Bytes are grouped by significance by Python, put each value back together
+    const length = bytes.length / itemSize;
+    const unshuffled = new Uint8Array(bytes.length);
+    for (let b = 0; b < itemSize; b += 1) {
+        const offset = b * length;
+        for (let i = 0; i < length; i += 1) {
+            unshuffled[i * itemSize + b] = bytes[offset + i];
+        }
+    }
+    return unshuffled;
+}
+
+async function decodeCompressedArray(value) {
+    const { encoding } = value;
+    const TypedArray = TYPED_ARRAYS[value.dtype];
+
+    let bytes = await inflate(value.buffer);
+    if (encoding.shuffle) {
+        bytes = unshuffle(bytes, TypedArray.BYTES_PER_ELEMENT);
+    }
+    const values = new TypedArray(bytes.buffer, 0, bytes.length / TypedArray.BYTES_PER_ELEMENT);
+
+    if (!encoding.delta) {
+        return values;
+    }
+
+    // Cumulative sum of the deltas, scaled back to the kept decimals
+    const decoded = new Float64Array(values.length);
+    const factor = 10 ** encoding.decimals;
+    let step = encoding.base;
+    for (let i = 0; i < values.length; i += 1) {
+        step += values[i];
+        decoded[i] = encoding.decimals ? step / factor : step;
+    }
+    return decoded;
+}
+
+function deserializeValues(value) {
+    if (isPointColumns(value)) {
+        return _.mapValues(value, decodeValues);
+    }
+    return decodeValues(value);
+}
+
+function encodeValues(value) {
+    if (!ArrayBuffer.isView(value) || value instanceof DataView) {
+        return value;
+    }
+
+    const dtype = _.findKey(TYPED_ARRAYS, (TypedArray) => value instanceof TypedArray);
+    return {
+        dtype,
+        shape: [value.length],
+        buffer: new DataView(value.buffer, value.byteOffset, value.byteLength),
+    };
+}
+
+function deserializeData(data) {
+    if (!data) {
+        return data;
+    }
+
+    // Compressed arrays (HTML exports) are decoded asynchronously, in which
+    // case a promise of the data is returned
+    const pending = [];
+    const decode = (value, assign) => {
+        if (isCompressedArray(value)) {
+            pending.push(decodeCompressedArray(value).then(assign));
+            return value;
+        }
+        return assign(decodeValues(value));
+    };
+
+    // Labels are used by Chart.js scales as regular arrays
+    if (_.has(data, 'labels') && isEncodedArray(data.labels)) {
+        decode(data.labels, (labels) => {
+            data.labels = Array.from(labels);
+        });
+    }
+
+    _.forEach(data.datasets, (dataset) => {
+        if (isPointColumns(dataset.data)) {
+            _.forEach(_.keys(dataset.data), (key) => {
+                decode(dataset.data[key], (values) => {
+                    dataset.data[key] = values;
+                });
+            });
+        } else {
+            decode(dataset.data, (values) => {
+                dataset.data = values;
+            });
+        }
+    });
+
+    return pending.length ? Promise.all(pending).then(() => data) : data;
+}
+
+function serializeData(data) {
+    if (!data) {
+        return data;
+    }
+
+    const serialized = { ...data };
+
+    if (_.has(data, 'labels')) {
+        serialized.labels = encodeValues(data.labels);
+    }
+
+    serialized.datasets = _.map(data.datasets, (dataset) => {
+        if (isPointColumns(dataset.data)) {
+            return { ...dataset, data: _.mapValues(dataset.data, encodeValues) };
+        }
+        return { ...dataset, data: encodeValues(dataset.data) };
+    });
+
+    return serialized;
+}
+
+function zipPointColumns(columns) {
+    // Build the {x, y[, r]} points expected by Chart.js from parallel columns
+    const keys = _.filter(POINT_COLUMNS, (key) => _.has(columns, key));
+    const { length } = columns.x;
+    const points = new Array(length);
+
+    for (let i = 0; i < length; i += 1) {
+        const point = {};
+        for (let k = 0; k < keys.length; k += 1) {
+            point[keys[k]] = columns[keys[k]][i];
+        }
+        points[i] = point;
+    }
+
+    return points;
+}
+
+export {
+    deserializeData,
+    deserializeValues,
+    serializeData,
+    isPointColumns,
+    zipPointColumns,
+};
@@ -0,0 +1,6 @@
+// Colorschemes plugin bundle of the offline HTML export
+import colorschemes from '../colorschemes/index';
+import ColorSchemesPlugin from '../plugin.colorschemes';
+
+window.Chart.colorschemes = colorschemes;
+window.Chart.register(ColorSchemesPlugin);
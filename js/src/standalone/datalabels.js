@@ -0,0 +1,4 @@
+// Datalabels plugin bundle of the offline HTML export
+import ChartDataLabels from 'chartjs-plugin-datalabels';
+
+window.Chart.register(ChartDataLabels);
@@ -0,0 +1,104 @@
+// Entry point of the standalone bundle used by the offline HTML export.
+//
+// It contains Chart.js and the conversion code of the widget, but neither
+// the widget manager nor the Chart.js plugins: the plugins used by a chart
+// are inlined as separate bundles, registered on the global Chart object.
+import Chart from 'chart.js/auto';
+import * as helpers from 'chart.js/helpers';
+import _ from 'lodash';
+
+import { deserializeData } from '../serializers';
+import { convertInputData, convertInputOptions } from '../convert';
+import { createPanels } from '../panels';
+
+// Make the Chart object available to the plugin bundles
+Chart.helpers = helpers;
+window.Chart = Chart;
+
+function decodeBase64(encoded) {
+    const binary = window.atob(encoded);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i += 1) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return new DataView(bytes.buffer);
+}
+
+// Arrays shared by the charts of a report (identical labels or buffers),
+// embedded once in the document
+const shared = {};
+
+function share(key, value) {
+    shared[key] = value;
+}
+
+function shareBuffer(key, encoded) {
+    shared[key] = decodeBase64(encoded);
+}
+
+function resolveShared(value) {
+    if (_.isPlainObject(value) && _.has(value, '$shared')) {
+        const resolved = shared[value.$shared];
+        return _.isArray(resolved) ? resolved.slice() : resolved;
+    }
+    return value;
+}
+
+function putBuffers(state, bufferPaths, buffers) {
+    // Same layout as the buffers of a widget message
+    _.forEach(bufferPaths, (path, i) => {
+        const buffer = resolveShared(buffers[i]);
+        _.set(state, path, _.isString(buffer) ? decodeBase64(buffer) : buffer);
+    });
+
+    if (_.has(state, ['_data_sync', 'labels'])) {
+        state._data_sync.labels = resolveShared(state._data_sync.labels);
+    }
+    return state;
+}
+
+function draw(elementId, state, data) {
+    const options = convertInputOptions(
+        state._options_sync,
+        state._colorscheme_sync,
+        state._zoom_sync,
+    );
+
+    // Grid of charts (facetplot)
+    if (state._panels_sync) {
+        return createPanels(
+            document.getElementById(elementId),
+            state._kind_sync,
+            convertInputData(data, options),
+            options,
+            state._panels_sync,
+            state._zoom_sync,
+        );
+    }
+
+    const canvas = document.createElement('canvas');
+    document.getElementById(elementId).appendChild(canvas);
+
+    const chart = new Chart(canvas.getContext('2d'), {
+        type: state._kind_sync,
+        data: convertInputData(data, options),
+        options,
+    });
+
+    if (state._zoom_sync === true && chart.resetZoom) {
+        canvas.ondblclick = () => chart.resetZoom();
+    }
+
+    return chart;
+}
+
+function render(elementId, spec) {
+    const state = putBuffers(spec.state, spec.buffer_paths, spec.buffers);
+
+    // Compressed data are decoded asynchronously
+    return Promise.resolve(deserializeData(state._data_sync)).then(
+        (data) => draw(elementId, state, data),
+    );
+}
+
+window.ipychart = { render, share, shareBuffer };
@@ -0,0 +1,2 @@
+// Date adapter bundle of the offline HTML export, needed by time scales
+import 'chartjs-adapter-moment';
@@ -0,0 +1,4 @@
+// Zoom plugin bundle of the offline HTML export
+import ChartZoom from 'chartjs-plugin-zoom';
+
+window.Chart.register(ChartZoom);
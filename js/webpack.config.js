@@ -7,6 +7,16 @@ var rules = [
     { test: /\.css$/, use: ['style-loader', 'css-loader']}
 ];
 
+// Bundles of the offline HTML export. The plugins are built separately so
+// that only the ones used by a chart are inlined in the exported page, and
+// use the Chart object exposed by the core bundle.
+var standalonePath = path.resolve(__dirname, '..', 'ipychart', 'standalone');
+var standaloneExternals = {
+    'chart.js': 'Chart',
+    'chart.js/auto': 'Chart',
+    'chart.js/helpers': 'Chart.helpers'
+};
+
 
 module.exports = (env, argv) => {
     var devtool = argv.mode === 'development' ? 'source-map' : false;
@@ -73,6 +83,33 @@ module.exports = (env, argv) => {
                 rules: rules
             },
             externals: ['@jupyter-widgets/base']
+        },
+        {// Standalone bundle of the offline HTML export
+        //
+        // This bundle contains Chart.js and the conversion of the chart data
+        // and options, without the widget manager. It exposes a global
+        // `ipychart.render` function.
+        //
+            entry: './src/standalone/index.js',
+            output: {
+                filename: 'ipychart.js',
+                path: standalonePath
+            },
+            devtool: false
+        },
+        {// Plugin bundles of the offline HTML export
+            entry: {
+                zoom: './src/standalone/zoom.js',
+                datalabels: './src/standalone/datalabels.js',
+                colorschemes: './src/standalone/colorschemes.js',
+                time: './src/standalone/time.js'
+            },
+            output: {
+                filename: '[name].js',
+                path: standalonePath
+            },
+            devtool: false,
+            externals: standaloneExternals
         }
     ];
 };
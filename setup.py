@@ -30,6 +30,7 @@ js_dir = pjoin(here, 'js')
 # Representative files that should exist after a successful build
 jstargets = [
     pjoin(js_dir, 'dist', 'index.js'),
+    pjoin(here, name, 'standalone', 'ipychart.js'),
 ]
 
 data_files_spec = [
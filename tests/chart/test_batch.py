@@ -0,0 +1,72 @@
+import pytest
+from ipychart import Chart
+
+
+def count_refreshes(chart, monkeypatch):
+    calls = []
+    validate = chart._validate_current_arguments
+
+    def counted():
+        calls.append(1)
+        validate()
+
+    monkeypatch.setattr(chart, '_validate_current_arguments', counted)
+    return calls
+
+
+def capture_states(chart, monkeypatch):
+    states = []
+    monkeypatch.setattr(chart, 'send_state',
+                        lambda key=None: states.append(set(key)))
+    return states
+
+
+def test_batch_update_refreshes_once(monkeypatch):
+    chart = Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="bar")
+    calls = count_refreshes(chart, monkeypatch)
+
+    with chart.batch_update():
+        chart.data = {'datasets': [{'data': [4, 5, 6]}]}
+        chart.kind = "line"
+        chart.colorscheme = 'tableau.Tableau20'
+        assert not calls
+
+    assert len(calls) == 1
+    assert chart._kind_sync == "line"
+    assert chart._colorscheme_sync == 'tableau.Tableau20'
+
+
+def test_refresh_sends_single_message(monkeypatch):
+    chart = Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="bar")
+    states = capture_states(chart, monkeypatch)
+    chart.set(data={'datasets': [{'data': [4, 5, 6]}]}, kind="line")
+
+    assert len(states) == 1
+    assert {'_data_sync', '_kind_sync'} <= states[0]
+
+
+def test_set_validates_at_the_end():
+    chart = Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="bar")
+    with pytest.raises(ValueError):
+        chart.set(kind="foo")
+
+
+def test_set_unknown_property():
+    chart = Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="bar")
+    with pytest.raises(ValueError):
+        chart.set(foo=1)
+    with pytest.raises(ValueError):
+        chart.set(stats={})
+
+
+def test_failed_batch_is_rolled_back(monkeypatch):
+    chart = Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="bar")
+    states = capture_states(chart, monkeypatch)
+
+    with pytest.raises(RuntimeError):
+        with chart.batch_update():
+            chart.kind = 'line'
+            raise RuntimeError
+
+    assert chart.kind == 'bar'
+    assert not chart._refresh_pending and not states
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from ipychart import Chart
+from ipywidgets.widgets.widget import _remove_buffers, _put_buffers
+
+
+def test_binary_sends_buffers():
+    chart = Chart(data={'labels': [1, 2, 3],
+                        'datasets': [{'data': np.array([1.5, np.nan, 3])}]},
+                  kind="line", binary=True)
+    state, buffer_paths, buffers = _remove_buffers(chart.get_state())
+
+    assert ['_data_sync', 'labels', 'buffer'] in buffer_paths
+    assert ['_data_sync', 'datasets', 0, 'data', 'buffer'] in buffer_paths
+    dataset = state['_data_sync']['datasets'][0]['data']
+    assert dataset['dtype'] == 'float64'
+    assert dataset['shape'] == [3]
+
+
+def test_binary_keeps_string_labels_as_list():
+    chart = Chart(data={'labels': ['a', 'b', 'c'],
+                        'datasets': [{'data': [1, 2, 3]}]},
+                  kind="bar", binary=True)
+    state = chart.get_state()
+
+    assert state['_data_sync']['labels'] == ['a', 'b', 'c']
+    assert state['_data_sync']['datasets'][0]['data']['dtype'] == 'float64'
+
+
+def test_binary_point_columns():
+    data = {'datasets': [{'data': {'x': np.arange(3), 'y': np.ones(3)}}]}
+    chart = Chart(data=data, kind="scatter", binary=True)
+    _, buffer_paths, _ = _remove_buffers(chart.get_state())
+
+    assert ['_data_sync', 'datasets', 0, 'data', 'x', 'buffer'] in buffer_paths
+    assert ['_data_sync', 'datasets', 0, 'data', 'y', 'buffer'] in buffer_paths
+
+
+def test_json_mode_converts_arrays():
+    data = {'datasets': [{'data': np.array([1.0, np.nan, 3.0])}]}
+    chart = Chart(data=data, kind="line")
+    state = chart.get_state()
+
+    assert state['_data_sync']['datasets'][0]['data'] == [1.0, None, 3.0]
+    assert isinstance(chart.data['datasets'][0]['data'], np.ndarray)
+
+
+def test_binary_roundtrip():
+    data = {'datasets': [{'data': np.array([1.0, 2.0, 3.0])}]}
+    chart = Chart(data=data, kind="line", binary=True)
+    state, buffer_paths, buffers = _remove_buffers(
+        chart.get_state('_data_sync'))
+    _put_buffers(state, buffer_paths, [bytes(b) for b in buffers])
+    chart.set_state(state)
+
+    np.testing.assert_array_equal(chart._data_sync['datasets'][0]['data'],
+                                  [1.0, 2.0, 3.0])
+
+
+def test_binary_invalid_value():
+    with pytest.raises(ValueError):
+        Chart(data={'datasets': [{'data': [1, 2, 3]}]},
+              kind="bar", binary="foo")
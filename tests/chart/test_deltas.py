@@ -0,0 +1,225 @@
+import asyncio
+
+import numpy as np
+import pytest
+from ipychart import Chart
+from ipychart.utils.ring import _RingBuffer
+
+
+def capture_messages(chart):
+    messages = []
+    chart.send = lambda content, buffers=None: messages.append(
+        (content, buffers))
+    return messages
+
+
+def test_append_list_dataset():
+    chart = Chart(data={'labels': ['a', 'b'],
+                        'datasets': [{'data': [1, 2]}]}, kind="line")
+    messages = capture_messages(chart)
+    chart.append(0, [3, 4], labels=['c', 'd'])
+
+    assert chart.data['datasets'][0]['data'] == [1, 2, 3, 4]
+    assert chart.data['labels'] == ['a', 'b', 'c', 'd']
+    content, _ = messages[0]
+    assert content['method'] == 'append'
+    assert content['data'] == [3, 4]
+    assert content['labels'] == ['c', 'd']
+
+
+def test_append_max_len():
+    chart = Chart(data={'labels': [0, 1, 2],
+                        'datasets': [{'data': np.array([0., 1., 2.])}]},
+                  kind="line", binary=True)
+    messages = capture_messages(chart)
+    chart.append(0, 3., labels=3, max_len=3)
+
+    np.testing.assert_array_equal(chart.data['datasets'][0]['data'],
+                                  [1., 2., 3.])
+    assert chart.data['labels'] == [1, 2, 3]
+    content, buffers = messages[0]
+    assert content['max_len'] == 3
+    assert ['data', 'buffer'] in content['buffer_paths']
+    assert len(buffers) == 2
+
+
+def test_append_keeps_synced_state():
+    chart = Chart(data={'datasets': [{'data': [1, 2]}]}, kind="bar")
+    capture_messages(chart)
+    chart.append(0, 3)
+
+    assert chart._data_sync['datasets'][0]['data'] == [1, 2, 3]
+
+
+def test_append_points_to_columns():
+    data = {'datasets': [{'data': {'x': [1], 'y': [2]}}]}
+    chart = Chart(data=data, kind="scatter")
+    capture_messages(chart)
+    chart.append(0, {'x': 3, 'y': 4})
+
+    assert chart.data['datasets'][0]['data'] == {'x': [1, 3], 'y': [2, 4]}
+
+
+def test_update_dataset_by_label():
+    chart = Chart(data={'datasets': [{'data': [1, 2], 'label': 'a'},
+                                     {'data': [3, 4], 'label': 'b'}]},
+                  kind="bar")
+    messages = capture_messages(chart)
+    chart.update_dataset('b', [5, 6])
+
+    assert chart.data['datasets'][1]['data'] == [5, 6]
+    assert messages[0][0]['index'] == 1
+    assert messages[0][0]['method'] == 'update'
+
+
+def test_update_dataset_validation_and_colors():
+    chart = Chart(data={'datasets': [{'data': [1, 2]}]}, kind="bar")
+    messages = capture_messages(chart)
+
+    with pytest.raises(ValueError):
+        chart.update_dataset(0, {'x': [1, 2], 'y': [1]})
+
+    chart.update_dataset(0, [1, 2, 3, 4])
+    colors = chart.data['datasets'][0]['backgroundColor']
+    assert len(colors) == 4
+    assert messages[0][0]['style']['backgroundColor'] == colors
+
+    chart = Chart(data={'datasets': [{'data': [1, 2]}]}, kind="bar",
+                  validate='fast')
+    chart.update_dataset(0, {'x': [1, 2], 'y': [1]})
+    assert chart.data['datasets'][0]['data'] == {'x': [1, 2], 'y': [1]}
+
+
+def test_update_dataset_keeps_user_colors():
+    chart = Chart(data={'datasets': [{'data': [1, 2],
+                                      'backgroundColor': 'red'}]},
+                  kind="bar")
+    messages = capture_messages(chart)
+    chart.update_dataset(0, [1, 2, 3])
+
+    assert chart.data['datasets'][0]['backgroundColor'] == 'red'
+    assert 'style' not in messages[0][0]
+
+
+def test_append_unknown_dataset():
+    chart = Chart(data={'datasets': [{'data': [1, 2]}]}, kind="bar")
+    with pytest.raises(IndexError):
+        chart.append(2, 3)
+    with pytest.raises(IndexError):
+        chart.update_dataset('foo', [1])
+
+
+async def _records(n, labelled=False, delay=0):
+    for i in range(n):
+        if delay:
+            await asyncio.sleep(delay)
+        yield (i, float(i)) if labelled else float(i)
+
+
+def test_stream_window():
+    chart = Chart(data={'labels': [], 'datasets': [{'data': []}]},
+                  kind='line')
+    messages = capture_messages(chart)
+    stats = asyncio.run(chart.stream(_records(1000, labelled=True),
+                                     window=10, fps=100))
+
+    assert stats['records'] == 1000
+    assert stats['frames'] == len(messages)
+    assert chart.data['datasets'][0]['data'] == [float(i)
+                                                 for i in range(990, 1000)]
+    assert chart.data['labels'] == list(range(990, 1000))
+    # Records arrive faster than frames: the buffer only keeps the window
+    assert stats['dropped'] > 0
+    assert all(len(content['data']) <= 10 for content, _ in messages)
+
+
+def test_stream_back_pressure():
+    chart = Chart(data={'datasets': [{'data': []}]}, kind='line')
+    messages = []
+
+    def send(content, buffers=None):
+        messages.append(content)
+        # The browser draws the first frame, then falls behind
+        if len(messages) == 1:
+            chart._handle_custom_msg(None, {'method': 'rendered',
+                                            'stats': {'method': 'append'}},
+                                     [])
+
+    chart.send = send
+    stats = asyncio.run(chart.stream(_records(20, delay=0.01), fps=1000,
+                                     max_lag=10))
+
+    # Frames are held until the end of the stream
+    assert stats == {'records': 20, 'dropped': 0, 'frames': 3}
+    assert sum(len(content['data']) for content in messages[:2]) < 5
+    assert chart.data['datasets'][0]['data'] == [float(i) for i in range(20)]
+
+
+def test_stream_errors():
+    chart = Chart(data={'datasets': [{'data': []}]}, kind='line')
+    capture_messages(chart)
+
+    with pytest.raises(ValueError):
+        asyncio.run(chart.stream([1, 2, 3]))
+
+    with pytest.raises(ValueError):
+        asyncio.run(chart.stream(_records(3), fps=0))
+
+    async def mixed():
+        yield 1
+        yield ('a', 2)
+
+    with pytest.raises(ValueError):
+        asyncio.run(chart.stream(mixed()))
+
+
+def test_ring_buffer():
+    ring = _RingBuffer(4)
+    for i in range(6):
+        ring.push(i)
+
+    assert ring.tolist() == [2., 3., 4., 5.]
+    ring.extend([6, 7, 8])
+    np.testing.assert_array_equal(np.asarray(ring), [5., 6., 7., 8.])
+    ring.extend(range(10))
+    assert ring.tolist() == [6., 7., 8., 9.]
+    assert len(ring) == 4
+
+    with pytest.raises(ValueError):
+        _RingBuffer(0)
+
+
+def test_rolling_dataset():
+    chart = Chart(data={'labels': ['a', 'b'],
+                        'datasets': [{'data': [1, 2]}]}, kind='line')
+    messages = capture_messages(chart)
+    rolling = chart.rolling_dataset(capacity=3)
+
+    for i in range(5):
+        rolling.push(i * 10, label=i)
+
+    assert np.asarray(rolling).tolist() == [20., 30., 40.]
+    assert chart.data['labels'].tolist() == [2, 3, 4]
+    content, _ = messages[-1]
+    assert content['data'] == [40]
+    assert content['labels'] == [4]
+    assert content['max_len'] == 3
+
+    # Full state of the chart, as sent to new views
+    state = chart.get_state(['_data_sync'])['_data_sync']
+    assert state['datasets'][0]['data'] == [20., 30., 40.]
+
+    with pytest.raises(ValueError):
+        chart.rolling_dataset(capacity=5)
+
+
+def test_rolling_labels_do_not_limit_other_datasets():
+    chart = Chart(data={'labels': ['a', 'b'],
+                        'datasets': [{'data': [1, 2]}, {'data': [3]}]},
+                  kind='line')
+    chart.rolling_dataset(capacity=3)
+    messages = capture_messages(chart)
+    chart.append(1, [9] * 4)
+
+    assert chart.data['datasets'][1]['data'] == [3, 9, 9, 9, 9]
+    assert messages[-1][0]['max_len'] is None
@@ -0,0 +1,163 @@
+import json
+import zlib
+import base64
+
+import numpy as np
+import pytest
+import ipychart.utils.standalone as standalone
+from ipychart import Chart
+from ipychart.utils.standalone import _required_plugins
+from ipychart.utils.compression import _compress_array, _compress_data
+
+
+@pytest.fixture
+def bundles(tmp_path, monkeypatch):
+    for name in ('ipychart',) + standalone.PLUGIN_BUNDLES:
+        (tmp_path / f'{name}.js').write_text(f'/* {name} bundle */')
+    monkeypatch.setattr(standalone, 'STANDALONE_DIR', tmp_path)
+    return tmp_path
+
+
+def _spec(html):
+    start = html.index('ipychart.render(')
+    end = html.index(');\n</script>', start)
+    return json.loads(html[start:end].split(', ', 1)[1])
+
+
+def test_required_plugins():
+    chart = Chart(data={'datasets': [{'data': [1, 2]}]}, kind='bar')
+    assert _required_plugins(chart.get_state()) == ['zoom']
+
+    chart = Chart(data={'datasets': [{'data': [1, 2], 'datalabels': {}}]},
+                  kind='bar', colorscheme='office.Blue6', zoom=False,
+                  options={'scales': {'x': {'type': 'time'}}})
+    assert _required_plugins(chart.get_state()) == ['time', 'colorschemes',
+                                                    'datalabels']
+
+
+def test_offline_html_inlines_bundles(bundles):
+    chart = Chart(data={'labels': ['a', 'b'],
+                        'datasets': [{'data': [1, 2]}]},
+                  kind='bar', zoom=False)
+    html = chart.get_html_template(offline=True)
+
+    assert '/* ipychart bundle */' in html
+    assert '/* zoom bundle */' not in html
+    assert 'unpkg' not in html and 'require' not in html
+    spec = _spec(html)
+    assert spec['state']['_kind_sync'] == 'bar'
+    assert spec['state']['_data_sync']['labels'] == ['a', 'b']
+
+
+def test_offline_html_encodes_buffers(bundles):
+    values = np.array([1.5, 2.5, 3.5])
+    chart = Chart(data={'labels': [1, 2, 3], 'datasets': [{'data': values}]},
+                  kind='line', binary=True)
+    spec = _spec(chart.get_html_template(offline=True))
+
+    path = ['_data_sync', 'datasets', 0, 'data', 'buffer']
+    buffer = spec['buffers'][spec['buffer_paths'].index(path)]
+    decoded = np.frombuffer(base64.b64decode(buffer), dtype='float64')
+    np.testing.assert_array_equal(decoded, values)
+
+
+def test_offline_html_escapes_script_tags(bundles):
+    chart = Chart(data={'labels': ['</script>'],
+                        'datasets': [{'data': [1]}]}, kind='bar')
+    html = chart.get_html_template(offline=True)
+
+    assert html.count('</script>') == html.count('<script>')
+
+
+def test_offline_to_html(bundles, tmp_path):
+    chart = Chart(data={'datasets': [{'data': [1, 2]}]}, kind='bar')
+    path = tmp_path / 'chart.html'
+    chart.to_html(str(path), offline=True)
+
+    assert '/* zoom bundle */' in path.read_text()
+
+
+def test_offline_html_missing_bundle(tmp_path, monkeypatch):
+    monkeypatch.setattr(standalone, 'STANDALONE_DIR', tmp_path)
+    chart = Chart(data={'datasets': [{'data': [1, 2]}]}, kind='bar')
+
+    with pytest.raises(FileNotFoundError):
+        chart.get_html_template(offline=True)
+
+
+def _decompress(encoded):
+    encoding = encoded['encoding']
+    dtype = np.dtype(encoded['dtype'])
+    raw = np.frombuffer(zlib.decompress(encoded['buffer']), dtype='uint8')
+    values = raw.reshape(dtype.itemsize, -1).T.copy().view(dtype).ravel()
+    if encoding['delta']:
+        values = (encoding['base'] + np.cumsum(values, dtype='int64'))
+        values = values / 10 ** encoding['decimals']
+    return values
+
+
+def test_compress_data_roundtrip():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=1000)
+    data = {'labels': np.arange(1000),
+            'datasets': [{'data': values},
+                         {'data': {'x': values, 'y': [1, None, 3] * 333 + [1]}},
+                         {'data': ['a', 'b']}]}
+    compressed = _compress_data(data)
+
+    labels = compressed['labels']
+    assert labels['encoding']['delta'] and labels['dtype'] == 'int32'
+    np.testing.assert_array_equal(_decompress(labels), np.arange(1000))
+    np.testing.assert_array_equal(
+        _decompress(compressed['datasets'][0]['data']), values)
+    y = _decompress(compressed['datasets'][1]['data']['y'])
+    assert np.isnan(y[1]) and y[0] == 1
+    assert compressed['datasets'][2]['data'] == ['a', 'b']
+
+
+def test_compress_precision():
+    values = np.linspace(0, 10, 1001)
+
+    encoded = _compress_array(values, precision=2)
+    assert encoded['encoding']['decimals'] == 2
+    np.testing.assert_allclose(_decompress(encoded), values, atol=0.005)
+
+    encoded = _compress_array(np.array([1.26, 2.71]), precision=0)
+    assert encoded['encoding']['delta']
+    np.testing.assert_array_equal(_decompress(encoded), [1, 3])
+
+    # Missing values can not be delta encoded, but are kept
+    encoded = _compress_array(np.array([1.26, np.nan]), precision=1)
+    assert not encoded['encoding']['delta']
+    decoded = _decompress(encoded)
+    assert decoded[0] == 1.3 and np.isnan(decoded[1])
+
+    encoded = _compress_array(values, precision='float32')
+    assert encoded['dtype'] == 'float32'
+    np.testing.assert_allclose(_decompress(encoded), values, rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        Chart(data={'datasets': [{'data': [1]}]},
+              kind='bar').get_html_template(compress=True, precision=-1)
+
+
+def test_compressed_export_is_smaller():
+    values = np.linspace(0, 1, 100_000).round(3)
+    chart = Chart(data={'labels': np.arange(100_000),
+                        'datasets': [{'data': values}]}, kind='line')
+
+    plain = chart.get_html_template()
+    compressed = chart.get_html_template(compress=True, precision=3)
+    assert len(compressed) * 20 < len(plain)
+
+
+def test_compressed_offline_html(bundles):
+    chart = Chart(data={'labels': np.arange(10),
+                        'datasets': [{'data': np.arange(10) / 2}]},
+                  kind='line')
+    spec = _spec(chart.get_html_template(offline=True, compress=True))
+
+    dataset = spec['state']['_data_sync']['datasets'][0]['data']
+    assert dataset['encoding']['compression'] == 'deflate'
+    path = ['_data_sync', 'datasets', 0, 'data', 'buffer']
+    assert path in spec['buffer_paths']
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import ipychart
+from ipychart import Chart
+
+
+def test_no_stats_when_profiling_disabled():
+    chart = Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="bar")
+    chart.kind = 'line'
+
+    assert chart.stats is None
+
+
+def test_refresh_stats():
+    chart = Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="bar")
+
+    with ipychart.profiling():
+        chart.data = {'datasets': [{'data': [4, 5, 6]}]}
+
+    stages = chart.stats['stages']
+    assert chart.stats['name'] == 'refresh'
+    assert {'validation', 'default_inputs', 'sync',
+            'default_inputs.default_style'} <= set(stages)
+    assert chart.stats['bytes']['data'] > 0
+
+    # Top-level stages are disjoint
+    top_level = [v for k, v in stages.items() if '.' not in k]
+    assert chart.stats['total'] >= sum(top_level)
+    assert stages['default_inputs'] >= stages['default_inputs.default_style']
+
+
+def test_unchanged_payload_not_measured():
+    chart = Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="bar")
+
+    with ipychart.profiling():
+        chart.kind = 'line'
+
+    # Only the kind of the chart is sent
+    assert 'data' not in chart.stats['bytes']
+
+
+def test_plot_stats_and_hooks():
+    records = []
+    df = pd.DataFrame({'x': [1, 2, 2], 'y': [1., 2., 3.]})
+
+    ipychart.add_profiling_hook(records.append)
+    ipychart.set_profiling(True)
+    try:
+        chart = ipychart.barplot(df, x='x', y='y')
+    finally:
+        ipychart.set_profiling(False)
+        ipychart.remove_profiling_hook(records.append)
+
+    assert records == [chart.stats]
+    assert chart.stats['name'] == 'barplot'
+    assert {'aggregation', 'options', 'validation', 'sync'} <= set(
+        chart.stats['stages'])
+
+
+def test_binary_payload_stats():
+    data = {'datasets': [{'data': np.arange(100, dtype='float64')}]}
+
+    with ipychart.profiling():
+        chart = Chart(data=data, kind="line", binary=True)
+
+    assert chart.stats['bytes']['buffers'] == 800
+
+
+def test_delta_stats():
+    chart = Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="line")
+
+    with ipychart.profiling():
+        chart.append(0, [4, 5])
+
+    assert chart.stats['name'] == 'append'
+    assert chart.stats['bytes']['data'] > 0
+
+
+def test_render_stats_from_browser():
+    chart = Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="bar")
+    received = []
+    chart.on_rendered(lambda c, stats: received.append((c, stats)))
+    stats = {'method': 'render', 'deserialize': 0.1, 'chart': 2.5,
+             'first_paint': 3.0, 'total': 6.0, 'points': 3}
+
+    assert chart.render_stats is None
+
+    chart._handle_custom_msg(chart, {'method': 'rendered', 'stats': stats},
+                             [])
+
+    assert chart.render_stats == stats
+    assert received == [(chart, stats)]
+
+
+def test_render_stats_with_missing_timings():
+    chart = Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="bar")
+    stats = {'method': 'render', 'deserialize': 0.1, 'chart': None,
+             'first_paint': -2.5, 'total': float('nan'), 'points': 3}
+
+    chart._handle_custom_msg(chart, {'method': 'rendered', 'stats': stats},
+                             [])
+    assert chart.render_stats == {'method': 'render', 'deserialize': 0.1,
+                                  'points': 3}
+
+    chart._handle_custom_msg(chart, {'method': 'rendered'}, [])
+    assert chart.render_stats == {}
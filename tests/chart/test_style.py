@@ -1,3 +1,4 @@
+import pytest
 from ipychart import Chart
 from pydash import has
 
@@ -44,3 +45,63 @@ def test_default_style_several_datasets():
         assert has(ds, "borderWidth")
         assert has(ds, "pointBackgroundColor")
         assert has(ds, "pointBorderColor")
+
+
+def test_default_style_is_deterministic():
+    datasets = [{'data': [i]} for i in range(300)]
+    chart = Chart(data={'datasets': datasets}, kind="bar")
+    other = Chart(data={'datasets': [{'data': [i]} for i in range(300)]},
+                  kind="bar")
+
+    colors = [ds["backgroundColor"] for ds in chart.data["datasets"]]
+    assert colors == [ds["backgroundColor"] for ds in other.data["datasets"]]
+    assert colors[0] == 'rgba(54, 163, 235, 0.2)'
+    assert colors[256] == colors[0]
+
+
+def test_default_style_kept_on_refresh():
+    chart = Chart(data={'datasets': [{'data': [1]}, {'data': [2]}]},
+                  kind="line")
+    colors = [ds["borderColor"] for ds in chart.data["datasets"]]
+    chart.options = {}
+
+    assert [ds["borderColor"] for ds in chart.data["datasets"]] == colors
+
+
+def test_palette():
+    chart = Chart(data={'datasets': [{'data': [1]}, {'data': [2]},
+                                     {'data': [3]}]},
+                  kind="line", palette=['#ff0000', (0, 0, 255)])
+    datasets = chart.data["datasets"]
+
+    assert datasets[0]["backgroundColor"] == 'rgba(255, 0, 0, 0.2)'
+    assert datasets[1]["borderColor"] == 'rgba(0, 0, 255, 1)'
+    assert datasets[2]["borderColor"] == 'rgba(255, 0, 0, 1)'
+
+
+def test_palette_change_keeps_user_colors():
+    datasets = [{'data': [1]}, {'data': [2], 'borderColor': 'black'}]
+    chart = Chart(data={'datasets': datasets}, kind="line")
+    chart.palette = ['rgb(1, 2, 3)']
+
+    assert chart.data["datasets"][0]["borderColor"] == 'rgba(1, 2, 3, 1)'
+    assert chart.data["datasets"][1]["borderColor"] == 'black'
+
+
+def test_palette_change_is_synced():
+    chart = Chart(data={'datasets': [{'data': [1, 2]}]}, kind="bar")
+    messages = []
+    chart._send = lambda msg, buffers=None: messages.append(msg)
+    chart.palette = ['#ff0000', '#00ff00']
+
+    data = messages[-1]['state']['_data_sync']
+    assert data['datasets'][0]['backgroundColor'] == \
+        chart.data['datasets'][0]['backgroundColor']
+    assert '255, 0, 0' in data['datasets'][0]['backgroundColor'][0]
+
+
+@pytest.mark.parametrize('palette', [[], ['notacolor'], [(1, 2)], 'red'])
+def test_invalid_palette(palette):
+    with pytest.raises(ValueError):
+        Chart(data={'datasets': [{'data': [1]}]}, kind="bar",
+              palette=palette)
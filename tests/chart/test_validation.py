@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ipychart import Chart
+
+
+def test_scatter_points_are_validated():
+    with pytest.raises(ValueError):
+        Chart(data={'datasets': [{'data': [{'x': 1}, {'x': 2}]}]},
+              kind="scatter")
+
+
+def test_bubble_points_need_radius():
+    Chart(data={'datasets': [{'data': [{'x': 1, 'y': 2}]}]}, kind="scatter")
+
+    with pytest.raises(ValueError):
+        Chart(data={'datasets': [{'data': [{'x': 1, 'y': 2}]}]},
+              kind="bubble")
+
+
+def test_point_columns_validated_by_shape():
+    columns = {'x': np.arange(3), 'y': pd.Series([1., 2., 3.])}
+    Chart(data={'datasets': [{'data': columns}]}, kind="scatter")
+
+    with pytest.raises(ValueError):
+        Chart(data={'datasets': [{'data': {'x': np.arange(3),
+                                           'y': np.arange(4)}}]},
+              kind="scatter")
+
+    with pytest.raises(ValueError):
+        Chart(data={'datasets': [{'data': {'x': np.arange(3),
+                                           'y': np.array(['a', 'b', 'c'])}}]},
+              kind="scatter")
+
+
+def test_array_values_validated_by_shape():
+    with pytest.raises(ValueError):
+        Chart(data={'datasets': [{'data': np.ones((2, 2))}]}, kind="bar")
+
+
+def test_mixed_chart_point_dataset():
+    datasets = [{'data': [1, 2]},
+                {'type': 'scatter', 'data': [{'x': 1, 'y': 1}]}]
+    Chart(data={'labels': ['a', 'b'], 'datasets': datasets}, kind="bar")
+
+
+def test_fast_validation_skips_values():
+    data = {'datasets': [{'data': [{'x': 1}]}]}
+    chart = Chart(data=data, kind="scatter", validate="fast")
+
+    with pytest.raises(ValueError):
+        chart.options = {'a': 1}
+
+
+def test_validation_off():
+    chart = Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="bar",
+                  validate="off")
+    chart.options = {'a': 1}
+
+    assert chart.options['a'] == 1
+
+
+def test_invalid_validation_mode():
+    with pytest.raises(ValueError):
+        Chart(data={'datasets': [{'data': [1, 2, 3]}]}, kind="bar",
+              validate="foo")
+
+
+def test_validation_cache_detects_appended_values():
+    points = [{'x': 1, 'y': 1}]
+    chart = Chart(data={'datasets': [{'data': points}]}, kind="scatter")
+    points.append({'x': 2})
+
+    with pytest.raises(ValueError):
+        chart.options = {}
+
+
+def test_validation_cache_detects_replaced_values():
+    points = [{'x': 1, 'y': 1}, {'x': 2, 'y': 2}]
+    chart = Chart(data={'datasets': [{'data': points}]}, kind="scatter")
+
+    points[0] = {'x': 1}
+    with pytest.raises(ValueError):
+        chart.options = {}
+
+    points[0] = {'x': 1, 'y': 1}
+    chart.options = {}
+    points[1].pop('y')
+    with pytest.raises(ValueError):
+        chart.options = {}
+
+    points = [(1, 1), (2, 2)]
+    chart = Chart(data={'datasets': [{'data': points}]}, kind="scatter")
+    points[1] = (2,)
+    with pytest.raises(ValueError):
+        chart.options = {}
@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+from ipychart import barplot, scatterplot
+
+
+def test_barplot_binary_keeps_arrays():
+    df = pd.DataFrame({'x': ['a', 'b', 'a', 'c'], 'y': [1, 2, 3, 4]})
+    chart = barplot(df, x='x', y='y', binary=True)
+
+    assert chart.binary
+    assert isinstance(chart.data['datasets'][0]['data'], np.ndarray)
+
+
+def test_scatterplot_binary_point_columns():
+    df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6], 'h': [0, 1, 0]})
+    chart = scatterplot(df, x='x', y='y', hue='h', binary=True)
+
+    for dataset in chart.data['datasets']:
+        assert set(dataset['data']) == {'x', 'y'}
+        assert isinstance(dataset['data']['x'], np.ndarray)
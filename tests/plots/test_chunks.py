@@ -0,0 +1,73 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+from ipychart import barplot, countplot, distplot, lineplot, scatterplot
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'x': rng.integers(0, 10, 1000),
+                       'y': rng.normal(100, 5, 1000),
+                       'h': rng.choice(['u', 'v', 'w'], 1000)})
+    df.loc[::7, 'y'] = np.nan
+    return df
+
+
+def _chunks(df, size=128):
+    return (df.iloc[i:i + size] for i in range(0, len(df), size))
+
+
+def test_chunked_countplot():
+    df = _frame()
+
+    for kwargs in [{'x': 'x'}, {'x': 'h'}, {'x': 'x', 'hue': 'h'}]:
+        assert countplot(_chunks(df), **kwargs).data == \
+            countplot(df, **kwargs).data
+
+
+@pytest.mark.parametrize('agg', ['sum', 'count', 'mean', 'min', 'max',
+                                 'var', 'std'])
+def test_chunked_aggregation(agg):
+    df = _frame()
+
+    chunked = barplot(_chunks(df), x='x', y='y', hue='h', agg=agg).data
+    expected = barplot(df, x='x', y='y', hue='h', agg=agg).data
+    assert chunked['labels'] == expected['labels']
+    for ds, expected_ds in zip(chunked['datasets'], expected['datasets']):
+        np.testing.assert_allclose(ds['data'], expected_ds['data'],
+                                   atol=1e-4)
+
+
+def test_chunked_csv_reader():
+    df = _frame()
+    reader = pd.read_csv(io.StringIO(df.to_csv(index=False)), chunksize=100)
+
+    chunked = lineplot(reader, x='x', y='y', agg='mean').data
+    expected = lineplot(df, x='x', y='y', agg='mean').data
+    assert chunked['labels'] == expected['labels']
+    np.testing.assert_allclose(chunked['datasets'][0]['data'],
+                               expected['datasets'][0]['data'], atol=1e-4)
+
+
+def test_chunked_unsupported():
+    df = _frame()
+
+    with pytest.raises(ValueError):
+        barplot(_chunks(df), x='x', y='y', agg='median')
+    with pytest.raises(ValueError):
+        scatterplot(_chunks(df), x='x', y='y')
+    with pytest.raises(ValueError):
+        distplot(_chunks(df), x='y')
+
+
+def test_chunks_must_be_frames():
+    records = [{'x': 1, 'y': 2.}, {'x': 2, 'y': 3.}]
+
+    for data in [records, iter(records), np.zeros((3, 2))]:
+        with pytest.raises(ValueError):
+            barplot(data, x='x', y='y')
+
+    chunks = [pd.DataFrame(records[:1]), pd.DataFrame(records[1:])]
+    assert barplot(chunks, x='x', y='y').data['labels'] == [1, 2]
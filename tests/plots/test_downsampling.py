@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ipychart import lineplot, scatterplot, Chart
+
+
+@pytest.fixture
+def df():
+    n = 10000
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({'x': np.arange(n), 'y': rng.normal(size=n),
+                         'h': rng.integers(0, 2, size=n)})
+
+
+@pytest.mark.parametrize('method', ['lttb', 'minmax', 'every_nth'])
+def test_lineplot_max_points(df, method):
+    chart = lineplot(df, x='x', y='y', max_points=500, downsample=method)
+    dataset = chart.data['datasets'][0]['data']
+
+    assert len(dataset) <= 502
+    assert len(chart.data['labels']) == len(dataset)
+    assert isinstance(dataset, list)
+
+
+def test_lineplot_hue_datasets_stay_aligned(df):
+    chart = lineplot(df, x='x', y='y', hue='h', max_points=500)
+    n_labels = len(chart.data['labels'])
+
+    assert n_labels <= 500
+    for dataset in chart.data['datasets']:
+        assert len(dataset['data']) <= n_labels
+
+
+def test_scatterplot_max_points_per_hue(df):
+    chart = scatterplot(df, x='x', y='y', hue='h', max_points=100)
+
+    for dataset in chart.data['datasets']:
+        assert len(dataset['data']['x']) == 100
+
+
+def test_lttb_keeps_extremes(df):
+    df.loc[5000, 'y'] = 100
+    chart = lineplot(df, x='x', y='y', max_points=100)
+
+    assert 100 in chart.data['datasets'][0]['data']
+
+
+def test_chart_downsample():
+    data = {'datasets': [{'data': {'x': np.arange(1000),
+                                   'y': np.random.rand(1000)}}]}
+    chart = Chart(data=data, kind='scatter')
+    chart.downsample(50, method='minmax')
+
+    assert len(chart.data['datasets'][0]['data']['x']) <= 52
+
+
+def test_downsample_non_numeric_points():
+    data = {'datasets': [{'data': {'x': np.arange(100),
+                                   'y': ['a'] * 100}}]}
+    chart = Chart(data=data, kind='scatter')
+    chart.downsample(10)
+
+    assert len(chart.data['datasets'][0]['data']['y']) == 100
+
+
+def test_unknown_downsampling_method(df):
+    with pytest.raises(ValueError):
+        lineplot(df, x='x', y='y', max_points=100, downsample='foo')
+
+
+@pytest.mark.parametrize('max_points', [0, -5, 2.5, True])
+def test_invalid_max_points(df, max_points):
+    with pytest.raises(ValueError):
+        lineplot(df, x='x', y='y', max_points=max_points)
+    with pytest.raises(ValueError):
+        scatterplot(df, x='x', y='y', max_points=max_points)
+    with pytest.raises(ValueError):
+        Chart(data={'datasets': [{'data': [1, 2, 3]}]},
+              kind='line').downsample(max_points)
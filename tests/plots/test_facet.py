@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ipychart import ChartGrid, barplot, build_spec, facetplot
+from ipychart.chart import Chart
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({'x': rng.integers(0, 5, 500),
+                         'y': rng.normal(10, 2, 500),
+                         'region': rng.choice(['n', 's', 'e'], 500),
+                         'year': rng.choice([2023, 2024], 500),
+                         'h': rng.choice(['u', 'v'], 500)})
+
+
+def test_facetplot_panels():
+    df = _frame()
+    grid = facetplot(df, x='x', y='y', col='region', hue='h', col_wrap=2)
+
+    assert isinstance(grid, ChartGrid)
+    assert grid.titles == ['region = e', 'region = n', 'region = s']
+    assert grid._panels_sync == {'titles': grid.titles, 'columns': 2,
+                                 'datasets': 2}
+
+    # Each panel matches the chart of its subset of the data
+    labels = grid.data['labels']
+    for i, region in enumerate(['e', 'n', 's']):
+        subset = barplot(df[df['region'] == region], x='x', y='y', hue='h')
+        for ds, expected in zip(grid.data['datasets'][2 * i:2 * i + 2],
+                                subset.data['datasets']):
+            values = dict(zip(subset.data['labels'], expected['data']))
+            assert ds['data'] == [values.get(v) for v in labels]
+            assert ds['label'] == expected['label']
+            assert ds['backgroundColor'] == expected['backgroundColor']
+
+
+def test_facetplot_rows_and_cols():
+    df = _frame()
+    grid = facetplot(df, x='x', row='year', col='region')
+
+    assert grid.columns == 3
+    assert grid.titles[0] == 'year = 2023 | region = e'
+    assert len(grid.data['datasets']) == 6
+
+    subset = df[(df['year'] == 2024) & (df['region'] == 's')]
+    counts = subset['x'].value_counts().reindex(grid.data['labels'])
+    assert grid.data['datasets'][5]['data'] == counts.tolist()
+
+
+def test_facetplot_missing_groups():
+    df = _frame()
+    df = df[~((df['region'] == 'n') & (df['x'] == 0))]
+    grid = facetplot(df, x='x', y='y', col='region', binary=True)
+
+    assert grid.data['labels'].tolist() == [0, 1, 2, 3, 4]
+    assert np.isnan(grid.data['datasets'][1]['data'][0])
+
+
+def test_facetplot_spec():
+    df = _frame()
+    spec = build_spec('facetplot', df, x='x', y='y', col='region')
+
+    assert spec.panels['columns'] == 3
+    grid = Chart.from_spec(spec)
+    assert isinstance(grid, ChartGrid)
+    assert grid.data == facetplot(df, x='x', y='y', col='region').data
+
+
+def test_chart_grid_validation():
+    data = {'labels': ['a', 'b'],
+            'datasets': [{'data': [1, 2]}, {'data': [3, 4]},
+                         {'data': [5, 6]}]}
+
+    with pytest.raises(ValueError):
+        ChartGrid(data=data, kind='bar', titles=['A', 'B'])
+
+    with pytest.raises(ValueError):
+        ChartGrid(data=data, kind='bar', titles=['A'], columns=0)
+
+    grid = ChartGrid(data=data, kind='line', titles=['A', 'B', 'C'])
+    assert grid._panels_sync['columns'] == 3
+    assert grid.data['datasets'][0]['borderColor'] == \
+        grid.data['datasets'][2]['borderColor']
@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+from ipychart import barplot, countplot, distplot, radarplot, scatterplot
+from ipychart.utils.frames import _frame_engine
+
+COLUMNS = {'x': ['b', 'a', 'b', 'c', 'b', None],
+           'n': [3, 1, 2, 1, 3, 2],
+           'y': [1., 2., 3., 4., None, 6.],
+           'h': ['u', 'v', 'v', 'u', 'u', 'v']}
+
+
+def _polars_frame():
+    pl = pytest.importorskip('polars')
+    return pl.DataFrame(COLUMNS)
+
+
+def _polars_lazy_frame():
+    pl = pytest.importorskip('polars')
+    return pl.DataFrame(COLUMNS).lazy()
+
+
+def _arrow_table():
+    pa = pytest.importorskip('pyarrow')
+    return pa.table(COLUMNS)
+
+
+FRAMES = [_polars_frame, _polars_lazy_frame, _arrow_table]
+
+
+def test_pandas_frame_engine():
+    assert _frame_engine(pd.DataFrame(COLUMNS)) is None
+
+
+@pytest.mark.parametrize('frame', FRAMES)
+def test_native_countplot(frame):
+    df = pd.DataFrame(COLUMNS)
+
+    for kwargs in [{'x': 'x'}, {'x': 'n'}, {'x': 'x', 'hue': 'h'}]:
+        expected = countplot(df, **kwargs).data
+        assert countplot(frame(), **kwargs).data == expected
+
+
+@pytest.mark.parametrize('frame', FRAMES)
+@pytest.mark.parametrize('agg', ['mean', 'median', 'sum', 'max', 'count'])
+def test_native_barplot(frame, agg):
+    df = pd.DataFrame(COLUMNS)
+
+    for kwargs in [{'x': 'x', 'y': 'y'}, {'x': 'n', 'y': 'y', 'hue': 'h'}]:
+        expected = barplot(df, agg=agg, **kwargs).data
+        assert barplot(frame(), agg=agg, **kwargs).data == expected
+
+
+@pytest.mark.parametrize('frame', FRAMES)
+def test_native_radarplot_keeps_hue_order(frame):
+    df = pd.DataFrame(COLUMNS)
+    expected = radarplot(df, x='n', y='y', hue='h', agg='sum').data
+
+    assert radarplot(frame(), x='n', y='y', hue='h', agg='sum').data == expected
+
+
+@pytest.mark.parametrize('frame', FRAMES)
+def test_native_point_plots(frame):
+    df = pd.DataFrame(COLUMNS)
+
+    expected = scatterplot(df, x='n', y='y', hue='h').data
+    assert scatterplot(frame(), x='n', y='y', hue='h').data == expected
+
+    expected = distplot(df, x='n', bandwidth=1.0).data
+    assert distplot(frame(), x='n', bandwidth=1.0).data == expected
@@ -0,0 +1,44 @@
+import pandas as pd
+from ipychart import barplot, countplot, lineplot
+
+
+def test_hue_datasets_aligned_on_labels():
+    df = pd.DataFrame({'x': ['b', 'a', 'b', 'c'], 'y': [1, 2, 3, 4],
+                       'h': ['u', 'v', 'u', 'u']})
+    chart = lineplot(df, x='x', y='y', hue='h')
+    datasets = {ds['label']: ds['data'] for ds in chart.data['datasets']}
+
+    assert chart.data['labels'] == ['a', 'b', 'c']
+    assert datasets['u'] == [None, 2.0, 4.0]
+    assert datasets['v'] == [2.0, None, None]
+
+
+def test_labels_aligned_without_hue():
+    df = pd.DataFrame({'x': [3, 1, 2, 1], 'y': [1., 2., 3., 4.]})
+    chart = barplot(df, x='x', y='y', agg='sum')
+
+    assert chart.data['labels'] == [1, 2, 3]
+    assert chart.data['datasets'][0]['data'] == [6.0, 3.0, 1.0]
+
+
+def test_countplot_hue_aligned_on_labels():
+    df = pd.DataFrame({'x': ['b', 'a', 'b', 'c', 'b'],
+                       'h': ['u', 'v', 'v', 'u', 'u']})
+    chart = countplot(df, x='x', hue='h')
+    datasets = {ds['label']: ds['data'] for ds in chart.data['datasets']}
+
+    assert chart.data['labels'] == ['b', 'a', 'c']
+    assert datasets['u'] == [2, None, 1]
+    assert datasets['v'] == [1, 1, None]
+
+
+def test_categorical_hue_dataset_options():
+    df = pd.DataFrame({'x': [1, 2, 1, 2], 'y': [1, 2, 3, 4],
+                       'h': pd.Categorical(['b', 'a', 'b', 'a'])})
+    options = [{'borderColor': 'red'}, {'borderColor': 'blue'}]
+    chart = lineplot(df, x='x', y='y', hue='h', dataset_options=options)
+    datasets = chart.data['datasets']
+
+    assert [ds['label'] for ds in datasets] == ['a', 'b']
+    assert datasets[0]['borderColor'] == 'red'
+    assert datasets[0]['data'] == [None, 3.0]
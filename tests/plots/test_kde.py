@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ipychart import distplot
+from ipychart.utils.kde import _bandwidth, _kde, FFT_MIN_STEPS, KERNELS
+
+
+@pytest.fixture
+def sample():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=5000), rng.uniform(size=5000)
+
+
+@pytest.mark.parametrize('kernel', KERNELS)
+def test_fft_matches_sklearn(sample, kernel):
+    values, weights = sample
+    grid, fft, _ = _kde(values, 500, 0.5, kernel, weights, method='fft')
+    grid_skl, skl, _ = _kde(values, 500, 0.5, kernel, weights,
+                         method='sklearn')
+
+    assert np.array_equal(grid, grid_skl)
+    assert np.abs(fft - skl).max() < 0.01 * skl.max()
+
+
+# Largest difference between the FFT and the exact estimates, relative to
+# the peak density, for a bandwidth of 20 grid steps
+FFT_ERRORS = {'gaussian': 0.001, 'tophat': 0.05, 'epanechnikov': 0.002,
+              'exponential': 0.001, 'linear': 0.001, 'cosine': 0.002}
+
+
+@pytest.mark.parametrize('kernel', KERNELS)
+def test_fft_error_bound(sample, kernel):
+    values, _ = sample
+    grid, _, _ = _kde(values, 1000, 1.0, method='sklearn')
+    bandwidth = 20 * (grid[1] - grid[0])
+
+    _, fft, _ = _kde(values, 1000, bandwidth, kernel, method='fft')
+    _, skl, _ = _kde(values, 1000, bandwidth, kernel, method='sklearn')
+    assert np.abs(fft - skl).max() < FFT_ERRORS[kernel] * skl.max()
+
+
+@pytest.mark.parametrize('kernel', KERNELS)
+def test_auto_method_matches_sklearn(sample, kernel):
+    values, _ = sample
+    grid, _, _ = _kde(values, 1000, 1.0, method='sklearn')
+
+    # Down to the narrowest bandwidth, the curve matches the exact one
+    for steps in [0.5, FFT_MIN_STEPS, 50]:
+        bandwidth = steps * (grid[1] - grid[0])
+        _, auto, _ = _kde(values, 1000, bandwidth, kernel)
+        _, skl, _ = _kde(values, 1000, bandwidth, kernel, method='sklearn')
+        assert np.abs(auto - skl).max() < 0.001 * skl.max()
+
+
+def test_fft_ignores_missing_values(sample):
+    values, _ = sample
+    _, pdf, _ = _kde(np.append(values, [np.nan, np.inf]), 500, 0.5,
+                     method='fft')
+    _, expected, _ = _kde(values, 500, 0.5, method='fft')
+
+    assert np.allclose(pdf, expected)
+
+
+def test_fft_rejects_sklearn_arguments(sample):
+    with pytest.raises(ValueError):
+        _kde(sample[0], 500, 0.5, method='fft', metric='manhattan')
+
+
+def test_distplot_methods_and_weights(sample):
+    df = pd.DataFrame({'x': sample[0], 'w': sample[1]})
+    chart = distplot(df, x='x', bandwidth=0.5, weights='w', kernel='linear')
+    chart_skl = distplot(df, x='x', bandwidth=0.5, weights='w',
+                         kernel='linear', method='sklearn')
+
+    pdf = np.array(chart.data['datasets'][0]['data'])
+    pdf_skl = np.array(chart_skl.data['datasets'][0]['data'])
+
+    assert chart.data['labels'] == chart_skl.data['labels']
+    assert np.abs(pdf - pdf_skl).max() < 0.01 * pdf_skl.max()
+    assert 'bandwidth: 0.5' in chart.options['scales']['y']['title']['text']
+
+
+def test_bandwidth_selectors(sample):
+    values, weights = sample
+    scott = _bandwidth(values, 'scott')
+    silverman = _bandwidth(values, 'silverman')
+    isj = _bandwidth(values, 'isj', weights=weights)
+
+    # Optimal bandwidth of a standard normal sample of 5000 observations
+    for bw in [scott, silverman, isj]:
+        assert 0.1 < bw < 0.25
+    assert _bandwidth(values, 'scott', 'tophat') > scott
+
+
+def test_isj_on_multimodal_data():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.normal(-5, 1, 5000),
+                             rng.normal(5, 1, 5000)])
+
+    assert _bandwidth(values, 'isj') < _bandwidth(values, 'silverman') / 2
+
+
+def test_auto_bandwidth_on_subsample():
+    values = np.random.default_rng(0).normal(size=1000)
+    bandwidth = _bandwidth(values, 'auto', max_samples=100)
+
+    assert 0.1 <= bandwidth <= 2
+
+
+@pytest.mark.parametrize('bandwidth', [0, -1, 'foo'])
+def test_invalid_bandwidth(sample, bandwidth):
+    with pytest.raises(ValueError):
+        _bandwidth(sample[0], bandwidth)
+
+
+def test_distplot_reports_selected_bandwidth(sample):
+    df = pd.DataFrame({'x': sample[0]})
+    chart = distplot(df, x='x', bandwidth='silverman')
+    bandwidth = round(_bandwidth(sample[0], 'silverman'), 4)
+
+    assert (chart.options['scales']['y']['title']['text']
+            == f'Density (bandwidth: {bandwidth})')
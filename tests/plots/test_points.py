@@ -0,0 +1,20 @@
+import pandas as pd
+from ipychart import scatterplot, bubbleplot
+
+
+def test_scatterplot_point_columns():
+    df = pd.DataFrame({'x': [1, 2, 3], 'y': [4., 5., 6.]})
+    chart = scatterplot(df, x='x', y='y')
+
+    assert chart.data['datasets'][0]['data'] == {'x': [1, 2, 3],
+                                                 'y': [4., 5., 6.]}
+
+
+def test_bubbleplot_point_columns_with_hue():
+    df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6], 'r': [7, 8, 9],
+                       'h': ['a', 'b', 'a']})
+    chart = bubbleplot(df, x='x', y='y', r='r', hue='h')
+    datasets = {ds['label']: ds['data'] for ds in chart.data['datasets']}
+
+    assert datasets['a'] == {'x': [1, 3], 'y': [4, 6], 'r': [7, 9]}
+    assert datasets['b'] == {'x': [2], 'y': [5], 'r': [8]}
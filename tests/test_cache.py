@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ipychart import (barplot, cache_info, caching, clear_cache, countplot,
+                      distplot, set_cache)
+from ipychart.cache import DEFAULT_MAX_BYTES
+
+
+@pytest.fixture(autouse=True)
+def cache():
+    clear_cache()
+    yield
+    set_cache(False, max_bytes=DEFAULT_MAX_BYTES)
+    clear_cache()
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({'x': rng.integers(0, 5, 200),
+                         'y': rng.normal(10, 2, 200),
+                         'h': rng.choice(['u', 'v'], 200),
+                         'other': rng.random(200)})
+
+
+def test_cache_hits():
+    df = _frame()
+
+    with caching():
+        first = barplot(df, x='x', y='y', hue='h')
+        second = barplot(df, x='x', y='y', hue='h',
+                         colorscheme='brewer.Paired12')
+        countplot(df, x='x')
+        distplot(df, x='y')
+        distplot(df, x='y')
+
+    info = cache_info()
+    assert (info['hits'], info['misses'], info['entries']) == (2, 3, 3)
+    assert second.data['labels'] == first.data['labels']
+    assert [ds['data'] for ds in second.data['datasets']] == \
+        [ds['data'] for ds in first.data['datasets']]
+
+    # The cache is disabled outside of the block
+    barplot(df, x='x', y='y', hue='h')
+    assert cache_info()['hits'] == 2
+
+
+def test_cache_keys():
+    df = _frame()
+    set_cache()
+
+    barplot(df, x='x', y='y')
+    barplot(df.assign(other=0), x='x', y='y')
+    assert cache_info()['hits'] == 1
+
+    changed = df.copy()
+    changed.loc[0, 'y'] += 1
+    barplot(changed, x='x', y='y')
+    barplot(df, x='x', y='y', agg='sum')
+    barplot(df, x='x', y='y', dataset_options={'borderWidth': 2})
+    assert cache_info()['hits'] == 1
+    assert cache_info()['misses'] == 4
+
+
+def test_cached_data_are_copies():
+    df = _frame()
+    set_cache()
+
+    chart = barplot(df, x='x', y='y')
+    chart.data['datasets'][0]['data'][0] = -1
+    assert barplot(df, x='x', y='y').data['datasets'][0]['data'][0] != -1
+
+
+def test_cache_eviction():
+    df = _frame()
+    set_cache(max_bytes=3000)
+
+    # Larger than the whole cache, not stored
+    countplot(df, x='y')
+    assert cache_info()['entries'] == 0
+
+    for agg in ['mean', 'sum', 'min', 'max']:
+        barplot(df, x='x', y='y', agg=agg)
+
+    info = cache_info()
+    assert info['evictions'] > 0
+    assert info['bytes'] <= 3000
+
+    # The most recently used entry is kept
+    barplot(df, x='x', y='y', agg='max')
+    assert cache_info()['hits'] == 1
+
+    with pytest.raises(ValueError):
+        set_cache(max_bytes=0)
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+
+# Import of ipychart compared to the import of ipywidgets, its only required
+# dependency, in the same interpreter (heavy dependencies take much longer)
+IMPORT_RATIO = 2.0
+
+CODE = '''
+import sys, time
+start = time.perf_counter()
+import ipywidgets
+baseline = time.perf_counter() - start
+start = time.perf_counter()
+import ipychart
+print(baseline, time.perf_counter() - start)
+print(','.join(m for m in ('pandas', 'sklearn', 'scipy') if m in sys.modules))
+'''
+
+
+def run(code):
+    output = subprocess.run([sys.executable, '-c', code], check=True,
+                            capture_output=True, text=True)
+    return output.stdout.splitlines()
+
+
+def test_import_does_not_load_heavy_dependencies():
+    durations, modules = run(CODE)
+    baseline, duration = map(float, durations.split())
+
+    assert modules == ''
+    assert duration < IMPORT_RATIO * baseline
+
+
+def test_plots_are_loaded_on_first_access():
+    code = ('import sys, ipychart\n'
+            'ipychart.distplot\n'
+            'print("pandas" in sys.modules, "sklearn" in sys.modules)')
+
+    assert run(code) == ['True False']
+
+
+def test_star_import_exports_plots():
+    namespace = {}
+    exec('from ipychart import *', namespace)
+
+    assert 'Chart' in namespace and 'scatterplot' in namespace
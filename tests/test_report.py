@@ -0,0 +1,67 @@
+import re
+
+import numpy as np
+import pytest
+import ipychart.utils.standalone as standalone
+from ipychart import Chart, export_report
+from ipychart.export import _report_rows
+
+
+@pytest.fixture
+def bundles(tmp_path, monkeypatch):
+    directory = tmp_path / 'bundles'
+    directory.mkdir()
+    for name in ('ipychart',) + standalone.PLUGIN_BUNDLES:
+        (directory / f'{name}.js').write_text(f'/* {name} bundle */')
+    monkeypatch.setattr(standalone, 'STANDALONE_DIR', directory)
+    return directory
+
+
+def test_report_rows():
+    assert _report_rows(5, 2) == [2, 2, 1]
+    assert _report_rows(6, [1, 2]) == [1, 2, 2, 1]
+
+    with pytest.raises(ValueError):
+        _report_rows(3, 0)
+    with pytest.raises(ValueError):
+        _report_rows(3, [])
+
+
+def test_report_inlines_bundles_once(bundles, tmp_path):
+    charts = [Chart(data={'datasets': [{'data': [i, 2]}]}, kind='bar')
+              for i in range(3)]
+    path = tmp_path / 'report.html'
+    export_report(charts, str(path), layout=2)
+    report = path.read_text()
+
+    assert report.count('/* ipychart bundle */') == 1
+    assert report.count('/* zoom bundle */') == 1
+    assert report.count('/* datalabels bundle */') == 0
+    assert report.count('ipychart.render(') == 3
+    assert report.count('class="ipychart-row"') == 2
+
+
+def test_report_shares_arrays(bundles, tmp_path):
+    labels = [f'label {i}' for i in range(100)]
+    x = np.arange(1000)
+    charts = [Chart(data={'labels': labels,
+                          'datasets': [{'data': np.arange(100) * i}]},
+                    kind='bar') for i in range(3)]
+    charts += [Chart(data={'datasets': [{'data': {'x': x, 'y': x * i}}]},
+                     kind='scatter') for i in range(2, 4)]
+    path = tmp_path / 'report.html'
+    export_report(charts, str(path), compress=True)
+    report = path.read_text()
+
+    assert report.count('ipychart.share(') == 1
+    # 3 bar datasets, 1 shared x column and 2 y columns
+    assert report.count('ipychart.shareBuffer(') == 6
+    keys = re.findall(r'"\$shared": "(\w+)"', report)
+    assert len(keys) == 3 + 3 + 4
+
+
+def test_report_invalid_charts(bundles, tmp_path):
+    with pytest.raises(ValueError):
+        export_report([], str(tmp_path / 'report.html'))
+    with pytest.raises(ValueError):
+        export_report(['chart'], str(tmp_path / 'report.html'))
@@ -0,0 +1,46 @@
+import pickle
+
+import pandas as pd
+import pytest
+from ipychart import Chart, ChartSpec, barplot, build_many, build_spec
+
+
+def _frame():
+    return pd.DataFrame({'x': ['a', 'b', 'a', 'c'], 'y': [1., 2., 3., 4.],
+                         'h': ['u', 'v', 'u', 'v']})
+
+
+def test_build_spec_matches_plot():
+    df = _frame()
+    spec = build_spec(barplot, df, x='x', y='y', hue='h')
+    chart = barplot(df, x='x', y='y', hue='h')
+
+    assert isinstance(spec, ChartSpec)
+    assert spec.kind == 'bar'
+    assert Chart.from_spec(spec).data == chart.data
+    assert Chart.from_spec(spec).options == chart.options
+
+
+def test_spec_is_picklable():
+    spec = build_spec('countplot', _frame(), x='x', binary=True)
+
+    assert pickle.loads(pickle.dumps(spec)).data['labels'] == ['a', 'b', 'c']
+
+
+def test_build_many():
+    df = _frame()
+    jobs = [('barplot', {'data': df, 'x': 'x', 'y': 'y'}),
+            (barplot, {'data': df, 'x': 'x', 'y': 'y', 'agg': 'sum'}),
+            ('countplot', {'data': df, 'x': 'h'})]
+
+    specs = build_many(jobs, n_jobs=2)
+    assert specs == build_many(jobs, n_jobs=1)
+    assert [s.kind for s in specs] == ['bar', 'bar', 'bar']
+    assert specs[1].data['datasets'][0]['data'] == [4.0, 2.0, 4.0]
+
+
+def test_build_many_invalid_jobs():
+    with pytest.raises(ValueError):
+        build_many([('unknownplot', {})])
+    with pytest.raises(ValueError):
+        build_many([barplot])